@@ -0,0 +1,48 @@
+"""Throughput of the asyncio streaming conversion: converts a stream of mixed Celsius, Fahrenheit and Kelvin readings
+into Celsius one by one in an async generator and with convert_async and convert_batches_async.
+
+Run from the repository root with: python -m benchmarks.bench_async [number of readings]
+"""
+import asyncio
+import sys
+import time
+
+from pyUnitTypes.aio import convert_async, convert_batches_async
+from pyUnitTypes.temperature import Celsius, Fahrenheit, Kelvin
+
+SIZE = 200000
+
+
+async def _stream(readings):
+    for reading in readings:
+        yield reading
+
+
+async def _per_item(readings):
+    async for reading in _stream(readings):
+        Celsius(reading)
+
+
+async def _converted(readings):
+    async for _ in convert_async(_stream(readings), to=Celsius):
+        pass
+
+
+async def _batched(readings):
+    async for _ in convert_batches_async(_stream(readings), Celsius):
+        pass
+
+
+def main(size=SIZE):
+    units = (Celsius, Fahrenheit, Kelvin)
+    readings = [units[index % 3](20.0 + index % 50) for index in range(size)]
+    for name, function in (('per item', _per_item), ('convert_async', _converted),
+                           ('convert_batches_async', _batched)):
+        start = time.perf_counter()
+        asyncio.run(function(readings))
+        duration = time.perf_counter() - start
+        print('{0:<22} {1:8.1f} ms {2:8.2f} M values/s'.format(name, duration * 1e3, size / duration / 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,48 @@
+"""Memory and conversion time of readings kept as list of unit objects and as QuantityBuffer: stores Celsius readings,
+converts them into Fahrenheit and sums them up.
+
+Run from the repository root with: python -m benchmarks.bench_buffer [number of readings]
+"""
+import sys
+import time
+import tracemalloc
+
+from pyUnitTypes.buffer import QuantityBuffer
+from pyUnitTypes.reductions import qsum
+from pyUnitTypes.temperature import Celsius, Fahrenheit
+
+SIZE = 100000
+
+
+def _measure(name, function, size):
+    tracemalloc.start()
+    start = time.perf_counter()
+    readings = function()
+    duration = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('{0:<28} {1:8.1f} ms {2:8.1f} bytes/reading'.format(name, duration * 1e3, memory / size))
+    return readings
+
+
+def _timed(name, function, size):
+    start = time.perf_counter()
+    function()
+    duration = time.perf_counter() - start
+    print('{0:<28} {1:8.1f} ms {2:8.2f} M values/s'.format(name, duration * 1e3, size / duration / 1e6))
+
+
+def main(size=SIZE):
+    values = [20.0 + index % 50 / 10 for index in range(size)]
+
+    objects = _measure('store list of Celsius', lambda: [Celsius(value) for value in values], size)
+    buffer = _measure('store QuantityBuffer', lambda: QuantityBuffer(values, Celsius), size)
+
+    _timed('convert list of Celsius', lambda: [Fahrenheit(reading) for reading in objects], size)
+    _timed('convert QuantityBuffer', lambda: buffer.convert(Fahrenheit).convert(Celsius), 2 * size)
+    _timed('sum list of Celsius', lambda: qsum(objects), size)
+    _timed('sum QuantityBuffer', buffer.sum, size)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
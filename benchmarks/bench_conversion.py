@@ -0,0 +1,70 @@
+"""Compares the scalar and list conversion paths of pyUnitTypes against a raw ``a * x + b``.
+
+Run from the repository root with: python -m benchmarks.bench_conversion
+"""
+import timeit
+
+from pyUnitTypes.basics import converter, convert_iter, convert_list, convert_scalar, list_converter
+from pyUnitTypes.temperature import Celsius, Fahrenheit
+
+NUMBER = 1000000
+SIZE = 10000
+
+
+def _closure(src, dst):
+    """The converter before the functions were generated: a closure loading the constants from its cells."""
+
+    to_factor, to_offset = src.to_base.factor, src.to_base.offset
+    from_factor, from_offset = dst.from_base.factor, dst.from_base.offset
+
+    def convert_value(x):
+        return from_factor * (to_factor * x + to_offset) + from_offset
+
+    return convert_value
+
+
+def _report(results, reference):
+    for name, seconds in results.items():
+        print('{0:<46} {1:8.1f} ns  {2:5.2f}x'.format(name, seconds * 1e9, seconds / reference))
+
+
+def main():
+    factor, offset = Fahrenheit.to_base.factor, Fahrenheit.to_base.offset
+    fahrenheit_to_celsius = converter(Fahrenheit, Celsius)
+    closure = _closure(Fahrenheit, Celsius)
+
+    candidates = {
+        'raw a * x + b': lambda: (lambda x: factor * x + offset),
+        'converter(Fahrenheit, Celsius)': lambda: fahrenheit_to_celsius,
+        'closure converter': lambda: closure,
+        'convert_scalar(x, Fahrenheit, Celsius)': lambda: (lambda x: convert_scalar(x, Fahrenheit, Celsius)),
+        'Celsius(Fahrenheit(x)).value': lambda: (lambda x: Celsius(Fahrenheit(x)).value),
+    }
+
+    results = {}
+    for name, factory in candidates.items():
+        func = factory()
+        results[name] = min(timeit.repeat(lambda: func(98.6), number=NUMBER, repeat=5)) / NUMBER
+    _report(results, results['raw a * x + b'])
+
+    # per value of a list
+    print()
+    values = [float(value % 120) for value in range(SIZE)]
+    to_celsius = list_converter(Fahrenheit, Celsius)
+    candidates = {
+        'raw [a * x + b for x in values]': lambda: [factor * x + offset for x in values],
+        'list_converter(Fahrenheit, Celsius)(values)': lambda: to_celsius(values),
+        'convert_list(values, Fahrenheit, Celsius)': lambda: convert_list(values, Fahrenheit, Celsius),
+        'list(convert_iter(values, ...))': lambda: list(convert_iter(values, Fahrenheit, Celsius)),
+        'list(map(closure converter, values))': lambda: list(map(closure, values)),
+        '[Celsius(Fahrenheit(x)).value for x in values]': lambda: [Celsius(Fahrenheit(x)).value for x in values],
+    }
+
+    results = {}
+    for name, func in candidates.items():
+        results[name] = min(timeit.repeat(func, number=NUMBER // SIZE, repeat=5)) / NUMBER
+    _report(results, results['raw [a * x + b for x in values]'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Compares the dimension id dispatch of the BaseUnit comparisons against the former isinstance / issubclass checks on
+``sorted()`` and ``==`` of mixed Meter / Feet lists.
+
+Run from the repository root with: python -m benchmarks.bench_dispatch
+"""
+import timeit
+
+from pyUnitTypes.length import Length, Meter, Feet
+
+SIZE = 100000
+
+
+class IsinstanceLength(Length):
+    """Meter with the comparisons as they were before the dispatch by dimension id."""
+
+    name = 'Meter'
+    symbol = 'm'
+
+    def __eq__(self, other):
+        if isinstance(other, (float, int)):
+            return self.value == other
+        elif issubclass(type(other), self.type):
+            return self.base_value == other.base_value
+        else:
+            return False
+
+    def __lt__(self, other):
+        if isinstance(other, (float, int)):
+            return self.value < other
+        elif issubclass(type(other), self.type):
+            return self.base_value < other.base_value
+        else:
+            raise TypeError('Can not compare Unit {0} to object of type {1}'.format(self.name, type(other).__name__))
+
+
+class IsinstanceFeet(IsinstanceLength):
+    """Feet with the former comparisons."""
+
+    name = 'Feet'
+    symbol = 'ft'
+
+
+# assigned after the class creation, so the classes are not registered as units of the Length
+IsinstanceLength.to_base = Meter.to_base
+IsinstanceLength.from_base = Meter.from_base
+IsinstanceFeet.to_base = Feet.to_base
+IsinstanceFeet.from_base = Feet.from_base
+
+
+def _values(meter, feet):
+    return [meter(i % 97) if i % 2 else feet(i % 89) for i in range(SIZE)]
+
+
+def main():
+    candidates = {
+        'isinstance': _values(IsinstanceLength, IsinstanceFeet),
+        'dimension id': _values(Meter, Feet),
+    }
+
+    results = {}
+    for name, values in candidates.items():
+        other = values[::-1]
+        results[name] = {
+            'sorted': min(timeit.repeat(lambda: sorted(values), number=1, repeat=5)),
+            '==': min(timeit.repeat(lambda: [a == b for a, b in zip(values, other)], number=1, repeat=5)),
+        }
+
+    before = results['isinstance']
+    for name, timings in results.items():
+        for operation, seconds in timings.items():
+            print('{0:<14} {1:<8} {2:8.1f} ms  {3:5.2f}x speedup'.format(name, operation, seconds * 1e3,
+                                                                        before[operation] / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Measures the cold import time of the lazy pyUnitTypes package against importing all of its modules eagerly, which is
+what ``import pyUnitTypes`` used to do.
+
+Run from the repository root with: python -m benchmarks.bench_import
+"""
+import subprocess
+import sys
+
+REPEAT = 20
+
+SCENARIOS = {
+    'import pyUnitTypes': 'import pyUnitTypes',
+    'import pyUnitTypes; pyUnitTypes.Meter': 'import pyUnitTypes; pyUnitTypes.Meter',
+    'eager import of all modules': 'import pyUnitTypes; [getattr(pyUnitTypes, m) for m in pyUnitTypes._MODULES]',
+}
+
+TEMPLATE = """
+import time
+start = time.perf_counter()
+{0}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement):
+    """Returns the best import time in seconds of the statement in a fresh interpreter."""
+
+    timings = []
+    for _ in range(REPEAT):
+        output = subprocess.check_output([sys.executable, '-c', TEMPLATE.format(statement)])
+        timings.append(float(output.decode().strip().splitlines()[-1]))
+    return min(timings)
+
+
+def main():
+    for name, statement in SCENARIOS.items():
+        print('{0:<40} {1:8.2f} ms'.format(name, measure(statement) * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Eager against lazy evaluation of a multi-step unit pipeline: two Fahrenheit readings are added, converted into
+Celsius, scaled and converted into Kelvin, for scalars, QuantityBuffer and QuantityArray.
+
+Run from the repository root with: python -m benchmarks.bench_lazy [number of values]
+"""
+import sys
+import timeit
+
+from pyUnitTypes.arrays import QuantityArray, np
+from pyUnitTypes.buffer import QuantityBuffer
+from pyUnitTypes.expressions import lazy
+from pyUnitTypes.temperature import Celsius, Fahrenheit, Kelvin
+
+SIZE = 100000
+
+
+def _eager(x, y):
+    return ((x + y).to(Celsius) * 2 + 1).to(Kelvin)
+
+
+def _lazy(x, y):
+    return ((lazy(x) + y).to(Celsius) * 2 + 1).to(Kelvin).evaluate()
+
+
+def _eager_scalar(x, y):
+    # the readings are added in the base unit like QuantityArray does
+    return Kelvin(Celsius(Fahrenheit(Fahrenheit.from_base(x.base_value + y.base_value))) * 2 + 1)
+
+
+def _report(name, eager, fused, number, size):
+    eager_time = min(timeit.repeat(eager, number=number, repeat=5)) / number
+    lazy_time = min(timeit.repeat(fused, number=number, repeat=5)) / number
+    print('{0:<14} eager {1:10.1f} us   lazy {2:10.1f} us   {3:5.2f}x'.format(
+        name, eager_time * 1e6, lazy_time * 1e6, eager_time / lazy_time))
+
+
+def main(size=SIZE):
+    x, y = Fahrenheit(50), Fahrenheit(68)
+    _report('scalar', lambda: _eager_scalar(x, y), lambda: _lazy(x, y), 10000, 1)
+
+    values = [20.0 + index % 50 for index in range(size)]
+    buffer_x, buffer_y = QuantityBuffer(values, Fahrenheit), QuantityBuffer(values, Fahrenheit)
+
+    def eager_buffer():
+        total = QuantityBuffer(map(float.__add__, buffer_x.to(Celsius).value, buffer_y.to(Celsius).value), Celsius)
+        scaled = QuantityBuffer(map((2.0).__mul__, total.value), Celsius)
+        return QuantityBuffer(map((1.0).__add__, scaled.value), Celsius).convert(Kelvin)
+
+    _report('QuantityBuffer', eager_buffer, lambda: _lazy(buffer_x, buffer_y), 5, size)
+
+    if np is not None:
+        array_x, array_y = QuantityArray(values, Fahrenheit), QuantityArray(values, Fahrenheit)
+        _report('QuantityArray', lambda: _eager(array_x, array_y), lambda: _lazy(array_x, array_y), 20, size)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,59 @@
+"""Scaling curve of the parallel bulk conversion: converts a float64 buffer from Fahrenheit into Kelvin with 1, 2, 4,
+... worker processes up to the number of CPUs and compares the throughput with the single process numpy conversion. The
+in place conversion of a shared memory block (convert_shared) is measured next to convert, which copies the values
+into and out of a shared memory block.
+
+Run from the repository root with: python -m benchmarks.bench_parallel [number of values]
+"""
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from pyUnitTypes.arrays import _affine
+from pyUnitTypes.basics import conversion
+from pyUnitTypes.parallel import ParallelConverter
+from pyUnitTypes.temperature import Fahrenheit, Kelvin
+
+SIZE = 20000000
+
+
+def _best(function, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(size=SIZE):
+    values = np.random.default_rng(0).uniform(-40, 120, size)
+    composed = conversion(Fahrenheit, Kelvin)
+    serial = _best(lambda: _affine(values, composed.factor, composed.offset))
+    print('{0:<12} {1:8.1f} ms {2:8.1f} M values/s'.format('numpy', serial * 1e3, size / serial / 1e6))
+
+    block = shared_memory.SharedMemory(create=True, size=values.nbytes)
+    try:
+        workers = 1
+        cpus = os.cpu_count() or 1
+        while True:
+            with ParallelConverter(workers=workers, chunk_size=max(size // (4 * workers), 1)) as converter:
+                converter.convert_shared(block, Fahrenheit, Kelvin)  # start the workers
+                shared = _best(lambda: converter.convert_shared(block, Fahrenheit, Kelvin))
+                copied = _best(lambda: converter.convert(values, Fahrenheit, Kelvin))
+            print('{0:<12} shared: {1:8.1f} M values/s {2:5.2f}x   copied: {3:8.1f} M values/s {4:5.2f}x'.format(
+                '{0} worker(s)'.format(workers), size / shared / 1e6, serial / shared, size / copied / 1e6,
+                serial / copied))
+            if workers >= cpus:
+                break
+            workers = min(workers * 2, cpus)
+    finally:
+        block.close()
+        block.unlink()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,168 @@
+"""Benchmark suite of the hot paths of pyUnitTypes: construction, conversion, arithmetic, comparison, copying and the
+package import.
+
+Run from the repository root with:
+
+    python -m benchmarks.run                               # print the results
+    python -m benchmarks.run --output results.json         # also store them as JSON
+    python -m benchmarks.run --compare                     # compare against benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline               # store the results as new baseline
+
+With --compare the exit code is 1 if any benchmark got slower than the baseline by more than the tolerance.
+"""
+import argparse
+import copy
+import json
+import os
+import pickle
+import platform
+import sys
+import timeit
+from array import array
+
+from benchmarks.bench_import import measure as measure_import
+from pyUnitTypes.current import Ampere
+from pyUnitTypes.length import Meter, CentiMeter, KiloMeter, Mile, Feet, Yard
+from pyUnitTypes.luminous import Candela
+from pyUnitTypes.mass import KiloGram, Pound
+from pyUnitTypes.reductions import qsum
+from pyUnitTypes.substance import Mole
+from pyUnitTypes.temperature import Celsius, Fahrenheit, Kelvin
+from pyUnitTypes.time import Day, Hour
+from pyUnitTypes.wire import encode, decode, encode_batch, decode_batch
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# name -> (statement, setup); the setup is executed in the globals of this module
+BENCHMARKS = {
+    # construction per unit type
+    'construct.Meter': ('Meter(1.5)', ''),
+    'construct.CentiMeter': ('CentiMeter(1.5)', ''),
+    'construct.KiloGram': ('KiloGram(1.5)', ''),
+    'construct.Celsius': ('Celsius(1.5)', ''),
+    'construct.Day': ('Day(1.5)', ''),
+    'construct.Ampere': ('Ampere(1.5)', ''),
+    'construct.Mole': ('Mole(1.5)', ''),
+    'construct.Candela': ('Candela(1.5)', ''),
+    # conversion between units
+    'convert.Fahrenheit->Kelvin': ('Kelvin(value)', 'value = Fahrenheit(98.6)'),
+    'convert.Mile->CentiMeter': ('CentiMeter(value)', 'value = Mile(26.2)'),
+    'convert.Pound->KiloGram': ('KiloGram(value)', 'value = Pound(150)'),
+    'convert.Hour->Day': ('Day(value)', 'value = Hour(36)'),
+    # arithmetic
+    'arithmetic.add_mixed': ('a + b', 'a = Meter(1); b = CentiMeter(50)'),
+    'arithmetic.sub_mixed': ('a - b', 'a = Meter(1); b = Feet(2)'),
+    'arithmetic.iadd_scalar': ('a += 0.1', 'a = Meter(1)'),
+    'arithmetic.mul_scalar': ('a * 2', 'a = Meter(1)'),
+    'arithmetic.mul_derived': ('a * b', 'a = Meter(2); b = CentiMeter(50)'),
+    'arithmetic.div_derived': ('a / b', 'a = Mile(26.2); b = Hour(3)'),
+    # comparison
+    'compare.eq_mixed': ('a == b', 'a = Meter(1); b = Feet(3)'),
+    'compare.lt_mixed': ('a < b', 'a = Meter(1); b = Feet(3)'),
+    'compare.lt_scalar': ('a < 2', 'a = Meter(1)'),
+    'compare.sorted_1000': ('sorted(values)',
+                            'values = [Meter(i % 97) if i % 2 else Feet(i % 89) for i in range(1000)]'),
+    # reductions
+    'reduce.sum_1000': ('sum(values, Meter(0))', 'values = [Mile(i) if i % 2 else Yard(i) for i in range(1000)]'),
+    'reduce.qsum_1000': ('qsum(values, Meter)', 'values = [Mile(i) if i % 2 else Yard(i) for i in range(1000)]'),
+    # wire format
+    'wire.pickle': ('pickle.dumps(a)', 'a = KiloMeter(1.5)'),
+    'wire.unpickle': ('pickle.loads(data)', 'data = pickle.dumps(KiloMeter(1.5))'),
+    'wire.encode': ('encode(a)', 'a = KiloMeter(1.5)'),
+    'wire.decode': ('decode(data)', 'data = encode(KiloMeter(1.5))'),
+    'wire.decode_batch_100000': ('decode_batch(data)', 'data = encode_batch(array("d", range(100000)), Meter)'),
+    # copying
+    'copy.copy': ('copy.copy(a)', 'a = Celsius(21.5)'),
+    'copy.deepcopy': ('copy.deepcopy(a)', 'a = Celsius(21.5)'),
+}
+
+# benchmarks which are measured in a fresh interpreter
+IMPORT_BENCHMARKS = {
+    'import.package': 'import pyUnitTypes',
+    'import.length': 'import pyUnitTypes.length',
+}
+
+
+def run_benchmark(statement, setup, repeat=5):
+    """Returns the best time per execution of the statement in seconds."""
+
+    timer = timeit.Timer(statement, setup=setup, globals=dict(globals()))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(names=None):
+    """Runs the benchmarks and returns the results as JSON serializable dict."""
+
+    results = {}
+    for name, (statement, setup) in BENCHMARKS.items():
+        if names is None or any(name.startswith(prefix) for prefix in names):
+            results[name] = run_benchmark(statement, setup) * 1e9
+    for name, statement in IMPORT_BENCHMARKS.items():
+        if names is None or any(name.startswith(prefix) for prefix in names):
+            results[name] = measure_import(statement) * 1e9
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'unit': 'ns',
+        'results': results,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Compares the results against the baseline and returns the names of the benchmarks which got slower."""
+
+    regressions = []
+    print('{0:<32} {1:>12} {2:>12} {3:>8}'.format('benchmark', 'baseline', 'current', 'change'))
+    for name, current in sorted(results['results'].items()):
+        previous = baseline['results'].get(name)
+        if previous is None:
+            print('{0:<32} {1:>12} {2:>12.1f} {3:>8}'.format(name, '-', current, 'new'))
+            continue
+        change = current / previous - 1
+        flag = ''
+        if change > tolerance:
+            regressions.append(name)
+            flag = '  <-- slower'
+        print('{0:<32} {1:>12.1f} {2:>12.1f} {3:>+7.1%}{4}'.format(name, previous, current, change, flag))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('names', nargs='*', help='only run the benchmarks starting with these names')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', default=BASELINE, help='baseline JSON file. Default: %(default)s')
+    parser.add_argument('--compare', action='store_true', help='compare the results against the baseline')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='relative slow down accepted by --compare. Default: %(default)s')
+    args = parser.parse_args(argv)
+
+    results = run(args.names or None)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print('{0} benchmark(s) slower than the baseline: {1}'.format(len(regressions), ', '.join(regressions)))
+            return 1
+    else:
+        for name, nanoseconds in sorted(results['results'].items()):
+            print('{0:<32} {1:>12.1f} ns'.format(name, nanoseconds))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,17 +1,230 @@
-import os
-import sys
-import inspect
-import pkgutil
 from importlib import import_module
 
-# make sure to add all dynamically created classes to the modules
-# found at: https://www.bnmetrics.com/blog/dynamic-import-in-python3
-for (_, name, _) in pkgutil.iter_modules([os.path.dirname(__file__)]):
+# The package does not import any of its modules up front. The classes and functions are looked up in the static index
+# below and their module is only imported when the name is touched for the first time.
 
-    imported_module = import_module('.' + name, package=__name__)
+# all modules of the package
+_MODULES = ('acceleration', 'aio', 'area', 'arrays', 'auxiliary', 'basics', 'buffer', 'current', 'expressions',
+            'extension', 'flow', 'force', 'immutable', 'io', 'length', 'luminous', 'mass', 'parallel', 'parser',
+            'profiling', 'reductions', 'series', 'speed', 'storage', 'substance', 'temperature', 'time', 'volume',
+            'wire', 'work')
 
-    for i in dir(imported_module):
-        attribute = getattr(imported_module, i)
+# public name -> module defining it
+_INDEX = {
+    # acceleration
+    'Acceleration': 'acceleration',
+    'MeterPerSecondSquared': 'acceleration',
+    'StandardGravity': 'acceleration',
+    'FeetPerSecondSquared': 'acceleration',
+    # aio
+    'convert_async': 'aio',
+    'convert_batches_async': 'aio',
+    # area
+    'Area': 'area',
+    'SquareMeter': 'area',
+    'SquareKiloMeter': 'area',
+    'SquareCentiMeter': 'area',
+    'SquareMilliMeter': 'area',
+    'Hectare': 'area',
+    'Acre': 'area',
+    'SquareMile': 'area',
+    'SquareFeet': 'area',
+    'SquareInch': 'area',
+    # arrays
+    'QuantityArray': 'arrays',
+    # basics
+    'BaseUnit': 'basics',
+    'BasicTypes': 'basics',
+    'ComplexTypes': 'basics',
+    'Conversion': 'basics',
+    'Dimension': 'basics',
+    'System': 'basics',
+    'UnitMeta': 'basics',
+    'UnknownUnitDivisionError': 'basics',
+    'UnknownUnitError': 'basics',
+    'UnknownUnitMultiplicationError': 'basics',
+    'conversion': 'basics',
+    'conversion_table': 'basics',
+    'convert': 'basics',
+    'convert_iter': 'basics',
+    'convert_list': 'basics',
+    'convert_scalar': 'basics',
+    'converter': 'basics',
+    'list_converter': 'basics',
+    'unit_type': 'basics',
+    'unregister_unit': 'basics',
+    # buffer
+    'QuantityBuffer': 'buffer',
+    # current
+    'Current': 'current',
+    'Ampere': 'current',
+    # expressions
+    'LazyQuantity': 'expressions',
+    'lazy': 'expressions',
+    # flow
+    'Flow': 'flow',
+    'CubicMeterPerSecond': 'flow',
+    'CubicMeterPerHour': 'flow',
+    'LiterPerSecond': 'flow',
+    'LiterPerMinute': 'flow',
+    'GallonPerMinute': 'flow',
+    # force
+    'Force': 'force',
+    'Newton': 'force',
+    'KiloNewton': 'force',
+    'Dyne': 'force',
+    'KiloGramForce': 'force',
+    'PoundForce': 'force',
+    # immutable
+    'FrozenUnit': 'immutable',
+    'freeze': 'immutable',
+    'frozen': 'immutable',
+    # io
+    'convert_file': 'io',
+    'convert_stream': 'io',
+    # length
+    'Length': 'length',
+    'Meter': 'length',
+    'Mile': 'length',
+    'Yard': 'length',
+    'Feet': 'length',
+    'Inch': 'length',
+    # luminous
+    'Luminous': 'luminous',
+    'Candela': 'luminous',
+    # mass
+    'Mass': 'mass',
+    'Tonne': 'mass',
+    'KiloGram': 'mass',
+    'Gram': 'mass',
+    'Pound': 'mass',
+    'Ounce': 'mass',
+    'Ton': 'mass',
+    'ShortTon': 'mass',
+    # parallel
+    'ParallelConverter': 'parallel',
+    'convert_parallel': 'parallel',
+    # parser
+    'parse': 'parser',
+    'parse_unit': 'parser',
+    # profiling
+    'ProfileStats': 'profiling',
+    'disable_profiling': 'profiling',
+    'enable_profiling': 'profiling',
+    'profile': 'profiling',
+    # reductions
+    'qmax': 'reductions',
+    'qmean': 'reductions',
+    'qmin': 'reductions',
+    'qstd': 'reductions',
+    'qsum': 'reductions',
+    # series
+    'QuantitySeries': 'series',
+    # speed
+    'Speed': 'speed',
+    'MeterPerSecond': 'speed',
+    'KiloMeterPerHour': 'speed',
+    'MilePerHour': 'speed',
+    'FeetPerSecond': 'speed',
+    'Knot': 'speed',
+    # storage
+    'QuantityFile': 'storage',
+    'QuantityView': 'storage',
+    'open_quantities': 'storage',
+    'write_quantities': 'storage',
+    # substance
+    'Substance': 'substance',
+    'Mole': 'substance',
+    # temperature
+    'Temperature': 'temperature',
+    'Celsius': 'temperature',
+    'Kelvin': 'temperature',
+    'Fahrenheit': 'temperature',
+    # time
+    'Time': 'time',
+    'Day': 'time',
+    'Week': 'time',
+    'Year': 'time',
+    'Hour': 'time',
+    'Minute': 'time',
+    'Second': 'time',
+    'MilliSecond': 'time',
+    'MicroSecond': 'time',
+    # volume
+    'Volume': 'volume',
+    'CubicMeter': 'volume',
+    'CubicCentiMeter': 'volume',
+    'Liter': 'volume',
+    'HectoLiter': 'volume',
+    'CentiLiter': 'volume',
+    'MilliLiter': 'volume',
+    'CubicFeet': 'volume',
+    'CubicInch': 'volume',
+    'Gallon': 'volume',
+    'ImperialGallon': 'volume',
+    # wire
+    'decode': 'wire',
+    'decode_batch': 'wire',
+    'encode': 'wire',
+    'encode_batch': 'wire',
+    'register_unit': 'wire',
+    'unit_from_id': 'wire',
+    'unit_id': 'wire',
+    # work
+    'Work': 'work',
+    'Joule': 'work',
+    'KiloJoule': 'work',
+    'MegaJoule': 'work',
+    'WattHour': 'work',
+    'KiloWattHour': 'work',
+    'Calorie': 'work',
+    'KiloCalorie': 'work',
+    'BritishThermalUnit': 'work',
+}
 
-        if inspect.isclass(attribute):
-            setattr(sys.modules[__name__], name, attribute)
+# names of the SI prefixes (see pyUnitTypes.basics.SI_PREFIXES), the prefixed units are named <prefix><unit>
+_SI_PREFIX_NAMES = ('Yotta', 'Zetta', 'Exa', 'Peta', 'Tera', 'Giga', 'Mega', 'Kilo', 'Hecto', 'Deca', 'Deci', 'Centi',
+                    'Milli', 'Micro', 'Nano', 'Pico', 'Femto', 'Atto', 'Zepto', 'Yocto')
+
+# unit -> module defining the SI prefixed versions of the unit
+_SI_PREFIXED_UNITS = {
+    'Meter': 'length',
+    'Gram': 'mass',
+    'Ampere': 'current',
+    'Mole': 'substance',
+    'Candela': 'luminous',
+}
+
+
+def _find_module(name):
+    """Returns the name of the module defining the given public name or None if the name is unknown."""
+
+    try:
+        return _INDEX[name]
+    except KeyError:
+        pass
+
+    for prefix in _SI_PREFIX_NAMES:
+        if name.startswith(prefix) and name[len(prefix):] in _SI_PREFIXED_UNITS:
+            return _SI_PREFIXED_UNITS[name[len(prefix):]]
+
+    return None
+
+
+def __getattr__(name):
+    """Imports the module defining the requested name on first access and caches the name in the package."""
+
+    if name in _MODULES:
+        return import_module('.' + name, __name__)
+
+    module_name = _find_module(name)
+    if module_name is None:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+    attribute = getattr(import_module('.' + module_name, __name__), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES) | set(_INDEX))
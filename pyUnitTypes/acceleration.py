@@ -0,0 +1,37 @@
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+
+
+class Acceleration(BaseUnit):
+    """
+    The Acceleration class is the superclass of all acceleration based unit classes. It provides the
+    magic method to calculate with the different acceleration based units.
+    """
+
+    dimension = Dimension(length=1, time=-2)
+
+
+class MeterPerSecondSquared(Acceleration):
+    """The SI unit of accelerations."""
+
+    name = 'MeterPerSecondSquared'
+    symbol = 'm/s²'
+    to_base = Conversion()
+
+
+class StandardGravity(Acceleration):
+    """The acceleration of free fall on earth."""
+
+    name = 'StandardGravity'
+    symbol = 'gn'
+    to_base = Conversion(9.80665)
+
+
+class FeetPerSecondSquared(Acceleration):
+    """Accelerations in the US."""
+
+    name = 'FeetPerSecondSquared'
+    symbol = 'ft/s²'
+    to_base = Conversion(0.3048)
+
+
+__all__ = ['Acceleration', 'MeterPerSecondSquared', 'StandardGravity', 'FeetPerSecondSquared']
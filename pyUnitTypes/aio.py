@@ -0,0 +1,181 @@
+import asyncio
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyUnitTypes.arrays import _affine
+
+# maximal number of values converted in one batch
+BATCH_SIZE = 1024
+
+# maximal time in seconds a value waits for its batch to fill up
+MAX_DELAY = 0.01
+
+
+class _Pending:
+    """The items which have been read from the source but not yet taken into a batch. The reader waits while it holds
+    max_pending items, the batches wait while it is empty."""
+
+    def __init__(self, max_pending):
+        self.items = deque()
+        self.max_pending = max_pending
+        self.finished = False
+        self.error = None
+        self._readable = None
+        self._writable = None
+
+    def notify_readable(self):
+        if self._readable is not None and not self._readable.done():
+            self._readable.set_result(None)
+
+    def notify_writable(self):
+        if self._writable is not None and not self._writable.done():
+            self._writable.set_result(None)
+
+    def readable(self):
+        """Returns a future which is done as soon as new items are read or the source is finished."""
+
+        self._readable = asyncio.get_running_loop().create_future()
+        return self._readable
+
+    def writable(self):
+        """Returns a future which is done as soon as items have been taken."""
+
+        self._writable = asyncio.get_running_loop().create_future()
+        return self._writable
+
+
+async def _read(source, pending):
+    """Moves the items of the source into the pending items. The reading is suspended while max_pending items are
+    pending, so a slow consumer slows down the source instead of buffering it."""
+
+    items = pending.items
+    try:
+        if hasattr(source, '__aiter__'):
+            async for item in source:
+                items.append(item)
+                pending.notify_readable()
+                if len(items) >= pending.max_pending:
+                    await pending.writable()
+        else:
+            for item in source:
+                items.append(item)
+                pending.notify_readable()
+                if len(items) >= pending.max_pending:
+                    await pending.writable()
+    except Exception as exception:
+        pending.error = exception
+    pending.finished = True
+    pending.notify_readable()
+
+
+async def _batches(source, max_batch, max_delay, max_pending):
+    """Yields lists of the items of the source. A batch is complete if it holds max_batch items, if max_delay seconds
+    passed since its first item arrived or if the source is exhausted. An error of the source is raised after the items
+    read before it have been yielded."""
+
+    if max_batch < 1:
+        raise ValueError('The batch size needs to be positive.')
+
+    pending = _Pending(max_pending if max_pending is not None else 2 * max_batch)
+    items = pending.items
+    reader = asyncio.ensure_future(_read(source, pending))
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            if not items and not pending.finished:
+                await pending.readable()
+            if not items:
+                if pending.error is not None:
+                    raise pending.error
+                return
+
+            deadline = loop.time() + max_delay
+            batch = []
+            while True:
+                batch.extend([items.popleft() for _ in range(min(len(items), max_batch - len(batch)))])
+                pending.notify_writable()
+                if len(batch) >= max_batch or pending.finished:
+                    break
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(pending.readable(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            yield batch
+    finally:
+        # also if the consumer stops early, the reader must not outlive the batches. asyncio.wait doesn't raise the
+        # CancelledError of the reader, but the one of the consumer if it is cancelled itself.
+        reader.cancel()
+        await asyncio.wait((reader,))
+
+
+def _convert_batch(batch, unit):
+    """Converts the unit objects of a batch, which may be of different units of the unit type of the given unit, into
+    the given unit with one affine transformation of their base values."""
+
+    dimension_id = unit._dimension_id
+    base_values = array('d')
+    for quantity in batch:
+        if getattr(quantity, '_dimension_id', None) != dimension_id:
+            raise TypeError('Can not convert object of type {0} into {1}'.format(type(quantity).__name__, unit.name))
+        base_values.append(quantity._base_value or quantity.base_value)
+
+    from_base = unit.from_base
+    if np is not None:
+        return _affine(np.frombuffer(base_values, dtype=np.float64), from_base.factor, from_base.offset)
+    else:  # pragma: no cover
+        return array('d', (from_base.factor * base_value + from_base.offset for base_value in base_values))
+
+
+async def convert_batches_async(source, to, max_batch=BATCH_SIZE, max_delay=MAX_DELAY, max_pending=None):
+    """Collects the unit objects of an asynchronous stream into batches and yields the values of every batch converted
+    into one unit. The batches keep the order of the stream, no unit objects are created.
+
+    :param source: (mandatory, async iterable or iterable of pyUnitTypes.basics.BaseUnit) the stream of unit objects of
+    the same unit type, every object may be of another unit, e.g. Celsius and Fahrenheit
+    :param to: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit to convert to
+    :param max_batch: (optional, int) maximal number of values in one batch. Default: BATCH_SIZE
+    :param max_delay: (optional, float) maximal seconds to wait for a batch to fill up. Default: MAX_DELAY
+    :param max_pending: (optional, int) number of read but not converted objects at which the source is not read any
+    further until the batches are consumed. Default: 2 * max_batch
+    :returns async generator: float64 numpy arrays if numpy is installed, otherwise array('d')
+    """
+
+    batches = _batches(source, max_batch, max_delay, max_pending)
+    try:
+        async for batch in batches:
+            yield _convert_batch(batch, to)
+    finally:
+        await batches.aclose()
+
+
+async def convert_async(source, to, max_batch=BATCH_SIZE, max_delay=MAX_DELAY, max_pending=None):
+    """Converts the unit objects of an asynchronous stream into one unit, e.g. the readings of many devices reporting in
+    Celsius or Fahrenheit. The objects are collected into batches (see convert_batches_async) which are converted in one
+    step and yielded in the order of the stream. After every batch the event loop gets to run other tasks.
+
+    :param source: (mandatory, async iterable or iterable of pyUnitTypes.basics.BaseUnit) the stream of unit objects of
+    the same unit type
+    :param to: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit to convert to
+    :param max_batch: (optional, int) maximal number of values in one batch. Default: BATCH_SIZE
+    :param max_delay: (optional, float) maximal seconds to wait for a batch to fill up. Default: MAX_DELAY
+    :param max_pending: (optional, int) number of read but not converted objects at which the source is not read any
+    further. Default: 2 * max_batch
+    :returns async generator: objects of the given unit
+    """
+
+    batches = _batches(source, max_batch, max_delay, max_pending)
+    try:
+        async for batch in batches:
+            for value in _convert_batch(batch, to).tolist():
+                yield to(value)
+            await asyncio.sleep(0)
+    finally:
+        await batches.aclose()
@@ -0,0 +1,86 @@
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+
+
+class Area(BaseUnit):
+    """
+    The Area class is the superclass of all area based unit classes. It provides the magic method to calculate
+    with the different area based units.
+    """
+
+    dimension = Dimension(length=2)
+
+
+class SquareMeter(Area):
+    """The SI unit of areas."""
+
+    name = 'SquareMeter'
+    symbol = 'm²'
+    to_base = Conversion()
+
+
+class SquareKiloMeter(Area):
+    """Areas of countries and lakes."""
+
+    name = 'SquareKiloMeter'
+    symbol = 'km²'
+    to_base = Conversion(1e6)
+
+
+class SquareCentiMeter(Area):
+    """A square with 1 cm edges."""
+
+    name = 'SquareCentiMeter'
+    symbol = 'cm²'
+    to_base = Conversion(1e-4)
+
+
+class SquareMilliMeter(Area):
+    """Cross sections of wires."""
+
+    name = 'SquareMilliMeter'
+    symbol = 'mm²'
+    to_base = Conversion(1e-6)
+
+
+class Hectare(Area):
+    """Farmland. A square with 100 m edges."""
+
+    name = 'Hectare'
+    symbol = 'ha'
+    to_base = Conversion(1e4)
+
+
+class Acre(Area):
+    """Farmland in the US and the UK."""
+
+    name = 'Acre'
+    symbol = 'ac'
+    to_base = Conversion(4046.8564224)
+
+
+class SquareMile(Area):
+    """Areas of US states."""
+
+    name = 'SquareMile'
+    symbol = 'mi²'
+    to_base = Conversion(2589988.110336)
+
+
+class SquareFeet(Area):
+    """Floor space of US apartments."""
+
+    name = 'SquareFeet'
+    symbol = 'ft²'
+    to_base = Conversion(0.09290304)
+
+
+class SquareInch(Area):
+    """A square with 1 inch edges."""
+
+    name = 'SquareInch'
+    symbol = 'in²'
+    to_base = Conversion(6.4516e-4)
+
+
+__all__ = ['Area', 'SquareMeter', 'SquareKiloMeter', 'SquareCentiMeter', 'SquareMilliMeter', 'Hectare', 'Acre',
+           'SquareMile', 'SquareFeet', 'SquareInch']
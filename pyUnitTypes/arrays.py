@@ -0,0 +1,460 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyUnitTypes.basics import BaseUnit, UnknownUnitMultiplicationError, UnknownUnitDivisionError, _result_type, \
+    conversion
+
+
+def _unit_info(unit):
+    """Returns the unit type and the conversions to and from the base unit of the given unit class.
+
+    :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class
+    :returns tuple: (unit_type, to_base, from_base)
+    """
+
+    if not (isinstance(unit, type) and issubclass(unit, BaseUnit)):
+        raise TypeError('Expected a subclass of BaseUnit as unit, got object of type {0}'.format(type(unit).__name__))
+
+    return unit._type, unit.to_base, unit.from_base
+
+
+def _unit_of(obj):
+    """Returns the unit class of a unit object or QuantityArray."""
+
+    return obj.unit if isinstance(obj, QuantityArray) else type(obj)
+
+
+def _affine(values, factor, offset, out=None):
+    """Applies y = factor * x + offset on the whole buffer. Identity steps are skipped."""
+
+    if out is None:
+        out = np.array(values, dtype=np.float64, copy=True)
+    elif out is not values:
+        out[...] = values
+    if factor != 1:
+        np.multiply(out, factor, out=out)
+    if offset != 0:
+        np.add(out, offset, out=out)
+    return out
+
+
+class QuantityArray:
+    """
+    The QuantityArray holds many values of the same unit in one contiguous float64 numpy buffer. It provides the same
+    arithmetic and comparison behavior as pyUnitTypes.basics.BaseUnit, but element-wise and with numpy broadcasting.
+
+    Slices are numpy views sharing the buffer with the array. They take the unit from the array they were sliced from,
+    so they follow its in place conversions.
+    """
+
+    # let numpy hand over mixed operations like ndarray + QuantityArray to the reflected operators of this class
+    __array_ufunc__ = None
+
+    def __init__(self, values, unit):
+        """Creates a new QuantityArray.
+
+        :param values: (mandatory, array like, QuantityArray or subclass of pyUnitTypes.basics.BaseUnit) the values in
+        the given unit. A QuantityArray or unit object of the same unit type will be converted into the given unit.
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class of all values, e.g. Meter
+        """
+
+        if np is None:  # pragma: no cover
+            raise ImportError('The QuantityArray requires numpy to be installed.')
+
+        self._own_unit = unit
+        self._parent = None
+        self._type = _unit_info(unit)[0]
+
+        if isinstance(values, (QuantityArray, BaseUnit)):
+            if not issubclass(values.type, self._type):
+                raise TypeError('Can not create QuantityArray of {0} from {1}'.format(unit.__name__,
+                                                                                      _unit_of(values).__name__))
+            self._values = self._from_base(np.asarray(values.base_value, dtype=np.float64))
+        else:
+            self._values = np.array(values, dtype=np.float64)
+
+    @classmethod
+    def from_units(cls, units, unit=None):
+        """Creates a QuantityArray from an iterable of unit objects of the same unit type.
+
+        :param units: (mandatory, iterable of pyUnitTypes.basics.BaseUnit) the unit objects
+        :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the array. Default: unit of the
+        first element
+        """
+
+        units = list(units)
+        if unit is None:
+            if not units:
+                raise ValueError('Can not determine the unit of an empty sequence.')
+            unit = type(units[0])
+
+        unit_type, _, from_base = _unit_info(unit)
+        base_values = np.empty(len(units), dtype=np.float64)
+        for i, item in enumerate(units):
+            if not isinstance(item, unit_type):
+                raise TypeError('Can not create QuantityArray of {0} from object of type {1}'.format(
+                    unit.__name__, type(item).__name__))
+            base_values[i] = item.base_value
+
+        return cls._from_buffer(_affine(base_values, from_base.factor, from_base.offset, out=base_values), unit)
+
+    @classmethod
+    def _from_buffer(cls, buffer, unit, parent=None):
+        """Wraps an existing float64 buffer without copying it. Views of the buffer of another QuantityArray (or
+        QuantitySeries) are wrapped with the object owning the buffer as parent and use its unit."""
+
+        obj = cls.__new__(cls)
+        obj._own_unit = unit
+        obj._parent = parent
+        obj._type = _unit_info(unit)[0]
+        obj._values = buffer
+        return obj
+
+    @property
+    def _unit(self):
+        if self._parent is None:
+            return self._own_unit
+        return self._parent._own_unit
+
+    @property
+    def _to_base_converter(self):
+        return self._unit.to_base
+
+    @property
+    def _from_base_converter(self):
+        return self._unit.from_base
+
+    def _to_base(self, values):
+        return _affine(values, self._to_base_converter.factor, self._to_base_converter.offset)
+
+    def _from_base(self, base_values):
+        return _affine(base_values, self._from_base_converter.factor, self._from_base_converter.offset)
+
+    def _other_base_value(self, other):
+        """Returns the base values of the other operand if it is a unit or a QuantityArray of the same unit type.
+        Returns None if it's not a unit at all and raises a TypeError if the unit types don't match."""
+
+        if isinstance(other, (QuantityArray, BaseUnit)):
+            if other.type is not self._type:
+                raise TypeError('Can not combine {0} with {1}.'.format(other.type.__name__, self._type.__name__))
+            return other.base_value
+        return None
+
+    def to(self, unit):
+        """Returns a new QuantityArray with all values converted into the given unit with one affine transformation.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        """
+
+        composed = conversion(self._unit, unit)
+        return QuantityArray._from_buffer(_affine(self._values, composed.factor, composed.offset), unit)
+
+    def convert(self, unit):
+        """Converts all values in place into the given unit. Slices of the array see the converted values in the new
+        unit. They can't be converted in place themselves, as the other values of the array would keep their unit.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        """
+
+        if self._parent is not None:
+            raise TypeError('Can not convert a view of a QuantityArray in place, use to() for a converted copy.')
+        composed = conversion(self._unit, unit)
+        _affine(self._values, composed.factor, composed.offset, out=self._values)
+        self._own_unit = unit
+        return self
+
+    def copy(self):
+        """Returns a copy of the QuantityArray with its own buffer."""
+
+        return QuantityArray._from_buffer(self._values.copy(), self._unit)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self._values
+        return self._values.astype(dtype)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        unit = self._unit
+        for value in self._values:
+            yield unit(float(value))
+
+    def __getitem__(self, item):
+        """Returns a unit object for integer indices and a QuantityArray (a view for slices) otherwise."""
+
+        values = self._values[item]
+        if isinstance(values, np.ndarray):
+            if not np.may_share_memory(values, self._values):
+                # advanced indexing copies the values
+                return QuantityArray._from_buffer(values, self._unit)
+            parent = self if self._parent is None else self._parent
+            return QuantityArray._from_buffer(values, self._unit, parent)
+        return self._unit(float(values))
+
+    def __setitem__(self, key, value):
+        other_base = self._other_base_value(value)
+        if other_base is None:
+            self._values[key] = value
+        else:
+            self._values[key] = self._from_base(np.asarray(other_base, dtype=np.float64))
+
+    def __repr__(self):  # pragma: no cover
+        return "QuantityArray({0}, {1})".format(self._values.tolist(), self._unit.__name__)
+
+    def __str__(self):  # pragma: no cover
+        return "{0} {1}".format(self._values, self._unit.symbol)
+
+    def __pos__(self):
+        """Implements behavior for unary positive (e.g. +some_object)"""
+
+        return self
+
+    def __neg__(self):
+        """Implements behavior for negation (e.g. -some_object)"""
+
+        return QuantityArray._from_buffer(-self._values, self._unit)
+
+    def __abs__(self):
+        """Implements behavior for the built in abs() function."""
+
+        return QuantityArray._from_buffer(np.abs(self._values), self._unit)
+
+    def __round__(self, n=None):
+        """Implements behavior for the built in round() function. n is the number of decimal places to round to."""
+
+        return QuantityArray._from_buffer(np.round(self._values, decimals=n or 0), self._unit)
+
+    def _compare(self, other, operator):
+        """Compares element-wise. Numbers are compared to the values, units of the same type to the base values."""
+
+        other_base = self._other_base_value(other)
+        if other_base is None:
+            if isinstance(other, (int, float, np.number, np.ndarray)):
+                return operator(self._values, other)
+            raise TypeError('Can not compare QuantityArray of {0} to object of type {1}'.format(self._unit.__name__,
+                                                                                              type(other).__name__))
+        return operator(self.base_value, other_base)
+
+    def __eq__(self, other):
+        """Defines behavior for the equality operator, ==."""
+
+        try:
+            return self._compare(other, np.equal)
+        except TypeError:
+            return np.zeros(self._values.shape, dtype=bool)
+
+    def __ne__(self, other):
+        """Defines behavior for the inequality operator, !=."""
+
+        try:
+            return self._compare(other, np.not_equal)
+        except TypeError:
+            return np.ones(self._values.shape, dtype=bool)
+
+    def __lt__(self, other):
+        """Defines behavior for the less-than operator, <."""
+
+        return self._compare(other, np.less)
+
+    def __gt__(self, other):
+        """Defines behavior for the greater-than operator, >."""
+
+        return self._compare(other, np.greater)
+
+    def __le__(self, other):
+        """Defines behavior for the less-than-or-equal-to operator, <=."""
+
+        return self._compare(other, np.less_equal)
+
+    def __ge__(self, other):
+        """Defines behavior for the greater-than-or-equal-to operator, >=."""
+
+        return self._compare(other, np.greater_equal)
+
+    def __add__(self, other):
+        """Implements addition."""
+
+        other_base = self._other_base_value(other)
+        if other_base is not None:
+            return QuantityArray._from_buffer(self._from_base(self.base_value + other_base), self._unit)
+        elif isinstance(other, (int, float, np.number, np.ndarray)):
+            return QuantityArray._from_buffer(self._values + other, self._unit)
+        else:
+            raise TypeError('Can not add objects of type {0} to QuantityArray of {1}'.format(type(other).__name__,
+                                                                                           self._unit.__name__))
+
+    def __radd__(self, other):
+        """Implements reflected addition. Like for unit objects, the sum with a unit object on the left is in its
+        unit."""
+
+        if isinstance(other, BaseUnit):
+            return QuantityArray(other, type(other)) + self
+        return self + other
+
+    def __iadd__(self, other):
+        """Implements addition in place."""
+
+        other_base = self._other_base_value(other)
+        if other_base is not None:
+            self._values[...] = self._from_base(self.base_value + other_base)
+        elif isinstance(other, (int, float, np.number, np.ndarray)):
+            self._values += other
+        else:
+            raise TypeError('Can not add objects of type {0} to QuantityArray of {1}'.format(type(other).__name__,
+                                                                                           self._unit.__name__))
+        return self
+
+    def __sub__(self, other):
+        """Implements subtraction."""
+
+        other_base = self._other_base_value(other)
+        if other_base is not None:
+            return QuantityArray._from_buffer(self._from_base(self.base_value - other_base), self._unit)
+        elif isinstance(other, (int, float, np.number, np.ndarray)):
+            return QuantityArray._from_buffer(self._values - other, self._unit)
+        else:
+            raise TypeError('Can not subtract objects of type {0} from QuantityArray of {1}'.format(
+                type(other).__name__, self._unit.__name__))
+
+    def __rsub__(self, other):
+        """Implements reflected subtraction."""
+
+        if isinstance(other, BaseUnit):
+            # like for unit objects, the difference is in the unit of the left operand
+            return QuantityArray(other, type(other)) - self
+        elif isinstance(other, (int, float, np.number, np.ndarray)):
+            return QuantityArray._from_buffer(other - self._values, self._unit)
+        else:
+            raise TypeError('Can not subtract QuantityArray of {0} from object of type {1}'.format(
+                self._unit.__name__, type(other).__name__))
+
+    def __isub__(self, other):
+        """Implements subtraction in place."""
+
+        other_base = self._other_base_value(other)
+        if other_base is not None:
+            self._values[...] = self._from_base(self.base_value - other_base)
+        elif isinstance(other, (int, float, np.number, np.ndarray)):
+            self._values -= other
+        else:
+            raise TypeError('Can not subtract objects of type {0} from QuantityArray of {1}'.format(
+                type(other).__name__, self._unit.__name__))
+        return self
+
+    def _derive(self, other, divide, reflected=False):
+        """Returns the element-wise product or quotient with a unit object or QuantityArray like
+        pyUnitTypes.basics.BaseUnit does for unit objects: a QuantityArray of the base class of the resulting unit type
+        or a float64 numpy array if the result is dimensionless. Plain numbers and numpy arrays as other operand are
+        only passed for the reflected division, e.g. 1 / seconds.
+        """
+
+        other_type = other.type if isinstance(other, (QuantityArray, BaseUnit)) else None
+        if reflected:
+            result_type = _result_type(other_type, self._type, divide)
+        else:
+            result_type = _result_type(self._type, other_type, divide)
+        if result_type is None:
+            names = [self._unit.__name__, _unit_of(other).__name__ if other_type is not None else 'number']
+            if reflected:
+                names.reverse()
+            if divide:
+                raise UnknownUnitDivisionError('So far the division of {0} by {1} is unknown.'.format(*names))
+            raise UnknownUnitMultiplicationError('So far the multiplication of {0} by {1} is unknown.'.format(*names))
+
+        a = self.base_value * self._type._si_factor
+        if other_type is None:
+            b = np.asarray(other, dtype=np.float64)
+        else:
+            b = other.base_value * other_type._si_factor
+        if reflected:
+            a, b = b, a
+        if divide:
+            if np.any(np.asarray(b) == 0):
+                raise ZeroDivisionError('QuantityArray division by zero')
+            result = np.divide(a, b)
+        else:
+            result = np.multiply(a, b)
+        if result_type is float:
+            return result
+        if result_type._si_factor != 1:
+            np.divide(result, result_type._si_factor, out=result)
+        return QuantityArray._from_buffer(result, result_type._base_class)
+
+    def __mul__(self, other):
+        """Implements multiplication. The product with units is of the derived unit type, e.g. meters * meters are
+        square meters."""
+
+        if isinstance(other, (int, float, np.number, np.ndarray)):
+            return QuantityArray._from_buffer(self._values * other, self._unit)
+        elif isinstance(other, (QuantityArray, BaseUnit)):
+            return self._derive(other, divide=False)
+        else:
+            raise TypeError('Can not multiply QuantityArray of {0} with object of type {1}'.format(
+                self._unit.__name__, type(other).__name__))
+
+    def __rmul__(self, other):
+        """Implements reflected multiplication."""
+
+        if isinstance(other, (QuantityArray, BaseUnit)):
+            return self._derive(other, divide=False, reflected=True)
+        return self * other
+
+    def __imul__(self, other):
+        """Implements multiplication in place. The product with units is a new QuantityArray of another unit type."""
+
+        if isinstance(other, (int, float, np.number, np.ndarray)):
+            self._values *= other
+            return self
+        return self * other
+
+    def __truediv__(self, other):
+        """Implements true division. The quotient of units is of the derived unit type, e.g. meters / seconds are
+        meters per second."""
+
+        if isinstance(other, (int, float, np.number, np.ndarray)):
+            if np.any(np.asarray(other) == 0):
+                raise ZeroDivisionError('QuantityArray division by zero')
+            return QuantityArray._from_buffer(self._values / other, self._unit)
+        elif isinstance(other, (QuantityArray, BaseUnit)):
+            return self._derive(other, divide=True)
+        else:
+            raise TypeError('Can not divide QuantityArray of {0} by object of type {1}'.format(
+                self._unit.__name__, type(other).__name__))
+
+    def __rtruediv__(self, other):
+        """Implements reflected true division, e.g. 1 / seconds are hertz."""
+
+        if isinstance(other, (int, float, np.number, np.ndarray, QuantityArray, BaseUnit)):
+            return self._derive(other, divide=True, reflected=True)
+        raise TypeError('Can not divide object of type {0} by QuantityArray of {1}'.format(
+            type(other).__name__, self._unit.__name__))
+
+    def __itruediv__(self, other):
+        """Implements true division in place. The quotient of units is a new QuantityArray of another unit type."""
+
+        if isinstance(other, (int, float, np.number, np.ndarray)):
+            if np.any(np.asarray(other) == 0):
+                raise ZeroDivisionError('QuantityArray division by zero')
+            self._values /= other
+            return self
+        return self / other
+
+    @property
+    def value(self):
+        return self._values
+
+    @property
+    def base_value(self):
+        return self._to_base(self._values)
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def type(self):
+        return self._type
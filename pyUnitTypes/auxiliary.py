@@ -1,12 +1,69 @@
-def class_factory(BaseClass, name, symbol, to_base, value=float()):
-    """Helper function to generically create new classes programmatically."""
+import threading
+
+from pyUnitTypes.basics import Conversion, SI_PREFIXES
+
+# makes sure that lazily created classes are only created once, even if several threads request them at the same time
+_CLASS_CREATION_LOCK = threading.Lock()
 
-    # create new local class
-    class NewClass(BaseClass):
-        def __init__(self, value=value):
-            super().__init__(name=name, symbol=symbol, to_base=to_base, value=value)
 
-    NewClass.__name__ = name
-    NewClass.__qualname__ = name
+def class_factory(BaseClass, name, symbol, to_base):
+    """Helper function to generically create new classes programmatically."""
+
+    # create new class, the meta class of the BaseClass takes care of the unit meta data
+    NewClass = type(BaseClass)(name, (BaseClass,), {
+        '__module__': BaseClass.__module__,
+        'name': name,
+        'symbol': symbol,
+        'to_base': to_base,
+    })
 
     return NewClass
+
+
+def si_prefixed_units(name, symbol, base_divisor=1, skip=()):
+    """Helper function returning the names, symbols and conversion factors of all SI prefixed versions of a unit.
+
+    :param name: (mandatory, string) name of the unit without prefix, e.g. 'Meter'
+    :param symbol: (mandatory, string) symbol of the unit without prefix, e.g. 'm'
+    :param base_divisor: (optional, float or int) the prefix factors are divided by this value. Needed if the base unit
+    is prefixed itself like the KiloGram. Default: 1
+    :param skip: (optional, iterable of strings) names of the prefixes which shall not be generated. Default: none
+    :returns dict: class name -> (symbol, conversion factor to the base unit)
+    """
+
+    units = {}
+    for prefix, prefix_symbol, base10 in SI_PREFIXES:
+        if prefix in skip:
+            continue
+        if base_divisor != 1:
+            base10 /= base_divisor
+        units['{0}{1}'.format(prefix, name)] = ('{0}{1}'.format(prefix_symbol, symbol), base10)
+
+    return units
+
+
+def lazy_units(module_globals, BaseClass, units):
+    """Helper function returning a module level __getattr__ which creates the given units on first access. The created
+    class is stored in the module, so it is only created once.
+
+    :param module_globals: (mandatory, dict) the globals() of the module the units belong to
+    :param BaseClass: (mandatory, type) the unit type of the units
+    :param units: (mandatory, dict) class name -> (symbol, conversion factor to the base unit), see si_prefixed_units
+    :returns function: the __getattr__ function of the module
+    """
+
+    def __getattr__(name):
+        try:
+            symbol, factor = units[name]
+        except KeyError:
+            raise AttributeError('module {0!r} has no attribute {1!r}'.format(module_globals['__name__'], name))
+
+        with _CLASS_CREATION_LOCK:
+            # another thread might have been faster
+            if name not in module_globals:
+                module_globals[name] = class_factory(BaseClass=BaseClass, name=name, symbol=symbol,
+                                                     to_base=Conversion(factor))
+
+        return module_globals[name]
+
+    return __getattr__
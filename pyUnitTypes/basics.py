@@ -1,6 +1,10 @@
-import copy
+import itertools
 import math
+import sys
+import weakref
+from collections import namedtuple
 from enum import Enum
+from importlib import import_module
 
 SI_PREFIXES = [
     ('Yotta', 'Y', 1e24),
@@ -10,13 +14,13 @@ SI_PREFIXES = [
     ('Tera', 'T', 1e12),
     ('Giga', 'G', 1e9),
     ('Mega', 'M', 1e6),
-    ('Kilo', 'K', 1e3),
-    ('Hecto', 'H', 1e2),
-    ('Deca', 'D', 1e1),
+    ('Kilo', 'k', 1e3),
+    ('Hecto', 'h', 1e2),
+    ('Deca', 'da', 1e1),
     ('Deci', 'd', 1e-1),
     ('Centi', 'c', 1e-2),
     ('Milli', 'm', 1e-3),
-    ('Micro', 'm', 1e-6),
+    ('Micro', 'μ', 1e-6),
     ('Nano', 'n', 1e-9),
     ('Pico', 'p', 1e-12),
     ('Femto', 'f', 1e-15),
@@ -32,13 +36,16 @@ class System(Enum):
 
 
 class BasicTypes(Enum):
-    """Enumeration of all basic unit types supported. A basic unit is length, temperature, etc. Units types like speed etc
-    are ComplexTypes."""
+    """Enumeration of all basic unit types supported. A basic unit is length, temperature, etc. Units types like speed
+    etc are ComplexTypes."""
 
     LENGTH = 1
     TEMPERATURE = 2
     MASS = 3
     TIME = 4
+    CURRENT = 5
+    SUBSTANCE = 6
+    LUMINOUS = 7
 
 
 class ComplexTypes(Enum):
@@ -50,6 +57,78 @@ class ComplexTypes(Enum):
     FLOW = 4
     FORCE = 5
     WORK = 6
+    ACCELERATION = 7
+
+
+class Dimension(namedtuple('Dimension', 'length mass time temperature current substance luminous')):
+    """The dimension of a unit type as exponents of the basic unit types, e.g. speed is length / time:
+    Dimension(length=1, time=-1). Multiplying and dividing dimensions adds and subtracts the exponents."""
+
+    __slots__ = ()
+
+    def __new__(cls, length=0, mass=0, time=0, temperature=0, current=0, substance=0, luminous=0):
+        return super().__new__(cls, length, mass, time, temperature, current, substance, luminous)
+
+    def __mul__(self, other):
+        """Returns the dimension of the product of two unit types."""
+
+        return Dimension(*[a + b for a, b in zip(self, other)])
+
+    def __truediv__(self, other):
+        """Returns the dimension of the quotient of two unit types."""
+
+        return Dimension(*[a - b for a, b in zip(self, other)])
+
+    def __pow__(self, exponent):
+        """Returns the dimension of the unit type to the power of the exponent."""
+
+        return Dimension(*[a * exponent for a in self])
+
+    def __bool__(self):
+        """A dimension is False if it is dimensionless."""
+
+        return any(self)
+
+
+# modules of the package defining the unit type of a dimension. The module is imported when a calculation results in
+# its dimension for the first time.
+_DIMENSION_MODULES = {
+    Dimension(length=1): 'pyUnitTypes.length',
+    Dimension(mass=1): 'pyUnitTypes.mass',
+    Dimension(time=1): 'pyUnitTypes.time',
+    Dimension(temperature=1): 'pyUnitTypes.temperature',
+    Dimension(current=1): 'pyUnitTypes.current',
+    Dimension(substance=1): 'pyUnitTypes.substance',
+    Dimension(luminous=1): 'pyUnitTypes.luminous',
+    Dimension(length=2): 'pyUnitTypes.area',
+    Dimension(length=3): 'pyUnitTypes.volume',
+    Dimension(length=1, time=-1): 'pyUnitTypes.speed',
+    Dimension(length=1, time=-2): 'pyUnitTypes.acceleration',
+    Dimension(length=3, time=-1): 'pyUnitTypes.flow',
+    Dimension(length=1, mass=1, time=-2): 'pyUnitTypes.force',
+    Dimension(length=2, mass=1, time=-2): 'pyUnitTypes.work',
+}
+
+# dimension -> unit type, filled by the UnitMeta
+_UNIT_TYPES = {}
+
+
+def unit_type(dimension):
+    """Returns the unit type of the given dimension or None if there is no unit type of the dimension.
+
+    :param dimension: (mandatory, pyUnitTypes.basics.Dimension) the dimension
+    :returns type: the unit type, e.g. pyUnitTypes.speed.Speed for Dimension(length=1, time=-1)
+    """
+
+    try:
+        return _UNIT_TYPES[dimension]
+    except KeyError:
+        pass
+
+    module_name = _DIMENSION_MODULES.get(dimension)
+    if module_name is not None:
+        import_module(module_name)
+    return _UNIT_TYPES.get(dimension)
 
 
 class UnknownUnitMultiplicationError(Exception):
@@ -64,18 +143,50 @@ class UnknownUnitDivisionError(Exception):
     pass
 
 
+class UnknownUnitError(ValueError):
+    """Will be raised when a unit name or symbol does not match any known unit."""
+    pass
+
+
+# (factor, offset, signs of factor and offset) -> Conversion, every conversion in use exists once. The entries go away
+# with the last reference to their conversion, e.g. the conversions of units created at runtime.
+_INTERNED_CONVERSIONS = weakref.WeakValueDictionary()
+
+
 class Conversion:
-    """The Conversion class defines a conversion from one value to another."""
+    """The Conversion class defines a conversion from one value to another: y = factor * x + offset.
+
+    Conversions are immutable and interned, so equal factors and offsets share one object, which can be used as a key of
+    caches. Conversions with a NaN factor or offset are not interned, they are never equal to another conversion.
+    Conversions are composed with ``a @ b`` (first b, then a) and inverted with ``~a``.
+    """
 
-    def __init__(self, factor=1.0, offset=0.0):
-        """Creates new Conversion with given factor and offset.
+    __slots__ = ('factor', 'offset', '_inverse', '__weakref__')
+
+    def __new__(cls, factor=1.0, offset=0.0):
+        """Returns the Conversion with given factor and offset.
 
         :param factor: (optional, float or int) the conversion factor. Default: 1
         :param offset: (optional, float or int) the offset of the conversion Default: 0
         """
 
-        self.factor = factor
-        self.offset = offset
+        factor, offset = float(factor), float(offset)
+        # 0.0 == -0.0, but the sign of zero is kept by the conversions
+        key = (factor, offset, math.copysign(1.0, factor), math.copysign(1.0, offset))
+        try:
+            return _INTERNED_CONVERSIONS[key]
+        except KeyError:
+            pass
+
+        self = super().__new__(cls)
+        object.__setattr__(self, 'factor', factor)
+        object.__setattr__(self, 'offset', offset)
+        object.__setattr__(self, '_inverse', None)
+        if math.isnan(factor) or math.isnan(offset):
+            # NaN keys are never found again
+            return self
+        # another thread may have interned the same conversion in the meantime
+        return _INTERNED_CONVERSIONS.setdefault(key, self)
 
     def convert(self, val):
         """Returns the converted value
@@ -86,6 +197,21 @@ class Conversion:
 
         return self.factor * float(val) + self.offset
 
+    # calling the conversion object is the same as calling the convert method
+    __call__ = convert
+
+    @property
+    def is_identity(self):
+        """True if the conversion does not change any value."""
+
+        return self.factor == 1 and self.offset == 0
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Conversion objects are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Conversion objects are immutable')
+
     def __eq__(self, other):
         """Defines behavior for the equality operator, ==."""
 
@@ -102,73 +228,184 @@ class Conversion:
         else:
             return True
 
+    def __hash__(self):
+        return hash((self.factor, self.offset))
+
     def __copy__(self):
-        """Defines behavior for copy.copy() for instances of your class. copy.copy() returns a shallow copy of your
-        object -- this means that, while the instance itself is a new instance, all of its data is referenced
-        -- i.e., the object itself is copied, but its data is still referenced (and hence changes to data in a shallow
-        copy may cause changes in the original)."""
+        """Conversions are immutable, so a copy is the conversion itself."""
 
-        return Conversion(factor=self.factor, offset=self.offset)
+        return self
 
     def __deepcopy__(self, memodict={}):
-        """Defines behavior for copy.deepcopy() for instances of your class. copy.deepcopy() returns a deep copy of
-        your object -- the object and its data are both copied. memodict is a cache of previously copied objects
-        -- this optimizes copying and prevents infinite recursion when copying recursive data structures. When you want
-        to deep copy an individual attribute, call copy.deepcopy() on that attribute with memodict as the first
-        argument."""
+        """Conversions are immutable, so a deep copy is the conversion itself."""
+
+        return self
+
+    def __reduce__(self):
+        # unpickling interns the conversion again
+        return Conversion, (self.factor, self.offset)
 
-        return Conversion(factor=self.factor, offset=self.offset)
+    def __matmul__(self, other):
+        """Composes two conversions: (a @ b)(x) is a(b(x)).
+
+        :param other: (mandatory, pyUnitTypes.basics.Conversion) the conversion applied first
+        :returns pyUnitTypes.basics.Conversion: the composed conversion
+        """
+
+        if not isinstance(other, Conversion):
+            return NotImplemented
+        return Conversion(factor=self.factor * other.factor, offset=self.factor * other.offset + self.offset)
 
     def __invert__(self):
-        """Creates the inverted conversion of this class."""
+        """Returns the inverted conversion. The conversion itself is not changed."""
 
-        if self.factor != 0:
-            self.offset = -(self.offset / self.factor)
-            self.factor = 1 / self.factor
-        else:
-            self.offset = -self.offset
-        return self
+        inverse = self._inverse
+        if inverse is None:
+            if self.factor != 0:
+                inverse = Conversion(factor=1 / self.factor, offset=-(self.offset / self.factor))
+            else:
+                inverse = Conversion(factor=0, offset=-self.offset)
+            object.__setattr__(self, '_inverse', inverse)
+        return inverse
 
     def __repr__(self):  # pragma: no cover
         return "Conversion(factor={0}, offset={1})".format(self.factor, self.offset)
 
-    def __str__(self):  # pragma: no cover
-        return "y = {0} * x + {1}".format(self.factor, self.factor)
+    def __str__(self):
+        return "y = {0} * x + {1}".format(self.factor, self.offset)
+
+
+# operand kind of plain numbers in the binary operators of the units, the unit classes use their dimension id
+_NUMBER = 0
+
+# operand type -> operand kind: _NUMBER, the dimension id of a unit class or None for unsupported types. The unit
+# classes are registered by the UnitMeta, all other types on their first use.
+_OPERAND_KINDS = {float: _NUMBER, int: _NUMBER}
+
+# dimension ids of the unit types, 0 is reserved for numbers
+_DIMENSION_IDS = itertools.count(1)
+
+
+def _operand_kind(operand_type):
+    """Returns and caches the operand kind of a type which has not been used in a binary operator of the units yet."""
+
+    if issubclass(operand_type, (float, int)):
+        kind = _NUMBER
+    elif issubclass(operand_type, BaseUnit):
+        kind = operand_type._dimension_id
+    else:
+        kind = None
+    _OPERAND_KINDS[operand_type] = kind
+    return kind
+
+
+def _defers(other):
+    """Returns True for operands which implement the operators with unit objects in their reflected operators, e.g.
+    pyUnitTypes.arrays.QuantityArray. Like for numpy, these types opt out of the ufuncs with __array_ufunc__ = None."""
 
+    return getattr(other.__class__, '__array_ufunc__', True) is None
 
-class BaseUnit:
+
+class UnitMeta(type):
+    """Meta class of all unit classes. It makes sure that the unit meta data (name, symbol, unit type, base class and
+    the conversions) lives once per unit class, while the instances only carry their values in ``__slots__``."""
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        # instances of unit classes only store their values, so don't give them a __dict__
+        namespace.setdefault('__slots__', ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+
+        # the BaseUnit itself
+        if not bases:
+            return
+
+        # direct subclasses of the BaseUnit define a new unit type like Length or Temperature
+        if cls._type is None:
+            cls._type = cls
+            cls._base_class = None
+            cls._units = []
+            cls._dimension_id = next(_DIMENSION_IDS)
+            if cls.dimension is not None and _UNIT_TYPES.setdefault(cls.dimension, cls) is cls:
+                # products and quotients of this dimension were unknown so far
+                _RESULT_TYPES.clear()
+        _OPERAND_KINDS[cls] = cls._dimension_id
+
+        to_base = namespace.get('to_base')
+        if to_base is not None:
+            # invert the conversion once per class and not once per instance
+            if namespace.get('from_base') is None:
+                cls.from_base = ~to_base
+            # the first unit of a unit type which does not need any conversion is the base class of the unit type
+            if cls._base_class is None and to_base.is_identity:
+                cls._type._base_class = cls
+            # register the unit to its unit type
+            cls._type._units.append(cls)
+
+
+class BaseUnit(metaclass=UnitMeta):
     """
     The BaseUnit class is the basic class of every Unit class of this package. It provides general magic methods.
+
+    The unit classes define their meta data as class attributes:
+
+    * **name**: (string) name of the unit as word
+    * **symbol**: (string) symbol of the unit
+    * **to_base**: (pyUnitTypes.basics.Conversion) conversion object to convert the value to the base value
+    * **from_base**: (optional, pyUnitTypes.basics.Conversion) conversion object to convert the value back from the base
+      to the value of the actual class. Default: inversion of to_base
+
+    The unit types (direct subclasses of the BaseUnit) define their **dimension** (pyUnitTypes.basics.Dimension), which
+    is used to find the unit type of products and quotients of units.
     """
 
-    def __init__(self, name, symbol, base_class, to_base, unit_type, from_base=None):
+    # _base_value caches the base value of _value. It is None until the base value is read, so the readers use
+    # ``(obj._base_value or obj.base_value)``: the slot if it is filled and not 0, otherwise the converting property.
+    __slots__ = ('_value', '_base_value')
+
+    # unit meta data, defined by the unit type and unit classes
+    name = None
+    symbol = None
+    to_base = None
+    from_base = None
+    _type = None
+    _base_class = None
+    _units = None
+
+    # unit type meta data: the dimension of the unit type and the factor converting the base value into the coherent SI
+    # unit (e.g. days into seconds), which is needed to multiply and divide units of different unit types. Unit types
+    # with an offset to their SI unit set the factor to None.
+    dimension = None
+    _si_factor = 1.0
+
+    # integer tag of the unit type shared by all its units. The binary operators compare the tag of the other operand
+    # (see _OPERAND_KINDS) with their own instead of running isinstance and issubclass checks.
+    _dimension_id = None
+
+    def __init__(self, value=float()):
         """
         The default constructor of the BaseUnit class.
 
-        :param name: (mandatory, string) name of the unit as word
-        :param symbol: (mandatory, string) symbol of the unit
-        :param base_class: (mandatory, type) class of the base class
-        :param to_base: (mandatory, pyUnitTypes.basics.Conversion) conversion object to convert the value to the base value
-        :param from_base: (optional, pyUnitTypes.basics.Conversion) conversion object to convert the value back from the base
-        to the value of the actual class. Default: inversion of to_base
+        :param value: (optional, float, int or object of the same unit type) The actual value of the class. Units of the
+        same unit type are converted into the unit of the class.
         """
 
-        # Public attributes
-        self.name = name
-        self.symbol = symbol
-
-        # internal attributes
-        self._value = float()
-        self._type = unit_type
-        self._base_value = float()
-        self._base_class = base_class
-        self._to_base_converter = to_base
-        self.to_base = self._to_base_converter.convert
-        if from_base is not None:
-            self._from_base_converter = from_base
+        if isinstance(value, (float, int)):
+            value = float(value)
+        elif isinstance(value, self._type):
+            value = self.from_base(value._base_value or value.base_value)
         else:
-            self._from_base_converter = copy.copy(to_base).__invert__()
-        self.from_base = self._from_base_converter.convert
+            raise TypeError('Can not create object of type {0} from object of type {1}'.format(type(self).__name__,
+                                                                                               type(value).__name__))
+        self._value = value
+        self._base_value = None
+
+    def __reduce__(self):
+        """Pickles the unit object by the wire format id of its unit and its value, see pyUnitTypes.wire."""
+
+        return _reduce(self)
 
     def __repr__(self):  # pragma: no cover
         return "{0} {1}".format(self.value, self.symbol)
@@ -190,78 +427,105 @@ class BaseUnit:
     def __eq__(self, other):
         """Defines behavior for the equality operator, ==."""
 
-        if isinstance(other, (float, int)):
-            return self.value == other
-        elif issubclass(type(other), self.type):
-            return self.base_value == other.base_value
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            return (self._base_value or self.base_value) == (other._base_value or other.base_value)
+        elif kind == _NUMBER:
+            return self._value == other
+        elif _defers(other):
+            return NotImplemented
         else:
             return False
 
     def __ne__(self, other):
         """Defines behavior for the inequality operator, !=."""
 
-        if isinstance(other, (float, int)):
-            return self.value != other
-        elif issubclass(type(other), self.type):
-            return self.base_value != other.base_value
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            return (self._base_value or self.base_value) != (other._base_value or other.base_value)
+        elif kind == _NUMBER:
+            return self._value != other
+        elif _defers(other):
+            return NotImplemented
         else:
             return True
 
     def __lt__(self, other):
         """Defines behavior for the less-than operator, <."""
 
-        if isinstance(other, (float, int)):
-            return self.value < other
-        elif issubclass(type(other), self.type):
-            return self.base_value < other.base_value
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            return (self._base_value or self.base_value) < (other._base_value or other.base_value)
+        elif kind == _NUMBER:
+            return self._value < other
+        elif _defers(other):
+            return NotImplemented
         else:
-            if issubclass(type(other), BaseUnit):
-                raise TypeError('Can not compare Unit {0} to Unit {1}'.format(self.name, type(other).__name__))
-            else:
-                raise TypeError(
-                    'Can not compare Unit {0} to object of type {1}'.format(self.name, type(other).__name__))
+            self._compare_error(other, kind)
 
     def __gt__(self, other):
         """Defines behavior for the greater-than operator, >."""
 
-        if isinstance(other, (float, int)):
-            return self.value > other
-        elif issubclass(type(other), self.type):
-            return self.base_value > other.base_value
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            return (self._base_value or self.base_value) > (other._base_value or other.base_value)
+        elif kind == _NUMBER:
+            return self._value > other
+        elif _defers(other):
+            return NotImplemented
         else:
-            if issubclass(type(other), BaseUnit):
-                raise TypeError('Can not compare Unit {0} to Unit {1}'.format(self.name, type(other).__name__))
-            else:
-                raise TypeError(
-                    'Can not compare Unit {0} to object of type {1}'.format(self.name, type(other).__name__))
+            self._compare_error(other, kind)
 
     def __le__(self, other):
         """Defines behavior for the less-than-or-equal-to operator, <=."""
 
-        if isinstance(other, (float, int)):
-            return self.value <= other
-        elif issubclass(type(other), self.type):
-            return self.base_value <= other.base_value
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            return (self._base_value or self.base_value) <= (other._base_value or other.base_value)
+        elif kind == _NUMBER:
+            return self._value <= other
+        elif _defers(other):
+            return NotImplemented
         else:
-            if issubclass(type(other), BaseUnit):
-                raise TypeError('Can not compare Unit {0} to Unit {1}'.format(self.name, type(other).__name__))
-            else:
-                raise TypeError(
-                    'Can not compare Unit {0} to object of type {1}'.format(self.name, type(other).__name__))
+            self._compare_error(other, kind)
 
     def __ge__(self, other):
         """Defines behavior for the greater-than-or-equal-to operator, >=."""
 
-        if isinstance(other, (float, int)):
-            return self.value >= other
-        elif issubclass(type(other), self.type):
-            return self.base_value >= other.base_value
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            return (self._base_value or self.base_value) >= (other._base_value or other.base_value)
+        elif kind == _NUMBER:
+            return self._value >= other
+        elif _defers(other):
+            return NotImplemented
         else:
-            if issubclass(type(other), BaseUnit):
-                raise TypeError('Can not compare Unit {0} to Unit {1}'.format(self.name, type(other).__name__))
-            else:
-                raise TypeError(
-                    'Can not compare Unit {0} to object of type {1}'.format(self.name, type(other).__name__))
+            self._compare_error(other, kind)
+
+    def _compare_error(self, other, kind):
+        """Raises the TypeError of comparisons with objects which are neither numbers nor units of the same type."""
+
+        if kind is not None:
+            raise TypeError('Can not compare Unit {0} to Unit {1}'.format(self.name, type(other).__name__))
+        raise TypeError('Can not compare Unit {0} to object of type {1}'.format(self.name, type(other).__name__))
 
     def __abs__(self):
         """Implements behavior for the built in abs() function."""
@@ -315,17 +579,22 @@ class BaseUnit:
     def __add__(self, other):
         """Implements addition."""
 
-        # check input
-        if isinstance(other, (int, float)):
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            # like the __iadd__ the result is in the unit of self
+            base_value = (self._base_value or self.base_value) + (other._base_value or other.base_value)
+            return type(self)(self.from_base(base_value))
+        elif kind == _NUMBER:
             self.value += other
             return self
-        elif issubclass(type(other), BaseUnit):
-            # check if both operands are of the same unit type, because can not add meters to degrees celsius
-            if self._type != other.type:
-                raise TypeError('Can not add {0} to {1}.'.format(other._type, self._type))
-
-            self_type = type(self)
-            return self_type(self._base_value + other.base_value)
+        elif _defers(other):
+            return NotImplemented
+        elif kind is not None:
+            # can not add meters to degrees celsius
+            raise TypeError('Can not add {0} to {1}.'.format(other._type, self._type))
         else:
             raise TypeError('Can not add objects of type {0} to object of type {1}'.format(type(other).__name__,
                                                                                            type(self).__name__))
@@ -338,17 +607,20 @@ class BaseUnit:
     def __iadd__(self, other):
         """Implements addition."""
 
-        # check input
-        if isinstance(other, (int, float)):
-            self.value += other
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            self.value = self.from_base((self._base_value or self.base_value) + (other._base_value or other.base_value))
             return self
-        elif issubclass(type(other), BaseUnit):
-            # check if both operands are of the same unit type, because can not add meters to degrees celsius
-            if self._type != other.type:
-                raise TypeError('Can not add {0} to {1}.'.format(other.type, self._type))
-
-            self.value = self.from_base(self._base_value + other.base_value)
+        elif kind == _NUMBER:
+            self.value += other
             return self
+        elif _defers(other):
+            return NotImplemented
+        elif kind is not None:
+            raise TypeError('Can not add {0} to {1}.'.format(other._type, self._type))
         else:
             raise TypeError('Can not add objects of type {0} to object of type {1}'.format(type(other).__name__,
                                                                                            type(self).__name__))
@@ -356,17 +628,22 @@ class BaseUnit:
     def __sub__(self, other):
         """Implements subtraction."""
 
-        # check input
-        if isinstance(other, (int, float)):
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            # like the __isub__ the result is in the unit of self
+            base_value = (self._base_value or self.base_value) - (other._base_value or other.base_value)
+            return type(self)(self.from_base(base_value))
+        elif kind == _NUMBER:
             self.value -= other
             return self
-        elif issubclass(type(other), BaseUnit):
-            # check if both operands are of the same unit type, because can not add meters to degrees celsius
-            if self._type != other.type:
-                raise TypeError('Can not subtract {0} from {1}.'.format(other.type, self._type))
-
-            self_type = type(self)
-            return self_type(self._base_value - other.base_value)
+        elif _defers(other):
+            return NotImplemented
+        elif kind is not None:
+            # can not subtract degrees celsius from meters
+            raise TypeError('Can not subtract {0} from {1}.'.format(other._type, self._type))
         else:
             raise TypeError('Can not subtract objects of type {0} from object of type {1}'.format(type(other).__name__,
                                                                                                   type(self).__name__))
@@ -374,48 +651,72 @@ class BaseUnit:
     def __rsub__(self, other):
         """Implements reflected subtraction."""
 
-        # check input
-        if isinstance(other, (int, float)):
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == _NUMBER:
             self.value = other - self.value
             return self
-        elif issubclass(type(other), BaseUnit):  # pragma: no cover
-            # check if both operands are of the same unit type, because can not add meters to degrees celsius
-            if self._type != other.type:
-                raise TypeError('Can not subtract {0} from {1}.'.format(other.type, self._type))
-
-            self_type = type(self)
-            return self_type(other.base_value - self._base_value)
         else:
+            # units of the same unit type are handled by their __sub__
             raise TypeError('Can not subtract objects of type {0} from object of type {1}'.format(type(other).__name__,
                                                                                                   type(self).__name__))
 
     def __isub__(self, other):
         """Implements subtraction."""
 
-        # check input
-        if isinstance(other, (int, float)):
-            self.value -= other
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == self._dimension_id:
+            self.value = self.from_base((self._base_value or self.base_value) - (other._base_value or other.base_value))
             return self
-        elif issubclass(type(other), BaseUnit):
-            # check if both operands are of the same unit type, because can not add meters to degrees celsius
-            if self._type != other.type:
-                raise TypeError('Can not subtract {0} from {1}.'.format(other.type, self._type))
-
-            self.value = self.from_base(self._base_value - other.base_value)
+        elif kind == _NUMBER:
+            self.value -= other
             return self
+        elif _defers(other):
+            return NotImplemented
+        elif kind is not None:
+            raise TypeError('Can not subtract {0} from {1}.'.format(other._type, self._type))
         else:
             raise TypeError('Can not subtract objects of type {0} from object of type {1}'.format(type(other).__name__,
                                                                                                   type(self).__name__))
 
+    def _derive(self, other, divide):
+        """Returns the product or quotient of two unit objects. The result is an object of the base class of the
+        resulting unit type or a float if the result is dimensionless."""
+
+        result_type = _result_type(self._type, other._type, divide)
+        if result_type is None:
+            if divide:
+                raise UnknownUnitDivisionError('So far the division of {0} by {1} is unknown.'.format(self.name,
+                                                                                                     other.name))
+            raise UnknownUnitMultiplicationError('So far the multiplication of {0} by {1} is unknown.'.format(
+                self.name, other.name))
+
+        a = (self._base_value or self.base_value) * self._si_factor
+        b = (other._base_value or other.base_value) * other._si_factor
+        result = a / b if divide else a * b
+        if result_type is float:
+            return result
+        return result_type._base_class(result / result_type._si_factor)
+
     def __mul__(self, other):
         """Implements multiplication."""
 
-        if isinstance(other, (float, int)):
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == _NUMBER:
             self.value *= other
             return self
-        elif issubclass(type(other), BaseUnit):
-            raise UnknownUnitMultiplicationError('So far the multiplication of {0} by {1} is unknown.', self.name,
-                                                 other.name)
+        elif kind is not None:
+            return self._derive(other, divide=False)
+        elif _defers(other):
+            return NotImplemented
         else:
             raise TypeError(
                 'Can not multiply Unit {0} with object of type {1}'.format(self.name, type(other).__name__))
@@ -428,25 +729,22 @@ class BaseUnit:
     def __imul__(self, other):
         """Implements multiplication."""
 
-        if isinstance(other, (float, int)):
-            self.value *= other
-            return self
-        elif issubclass(type(other), BaseUnit):
-            raise UnknownUnitMultiplicationError('So far the multiplication of {0} by {1} is unknown.', self.name,
-                                                 other.name)
-        else:
-            raise TypeError(
-                'Can not multiply Unit {0} with object of type {1}'.format(self.name, type(other).__name__))
+        return self * other
 
     def __div__(self, other):
         """Implements division using the / operator."""
 
-        if isinstance(other, (float, int)):
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == _NUMBER:
             self.value /= other
             return self
-        elif issubclass(type(other), BaseUnit):
-            raise UnknownUnitDivisionError(
-                'So far the division of {0} by {1} is unknown.'.format(self.name, other.name))
+        elif kind is not None:
+            return self._derive(other, divide=True)
+        elif _defers(other):
+            return NotImplemented
         else:
             raise TypeError(
                 'Can not divide Unit {0} by object of type {1}'.format(self.name, type(other).__name__))
@@ -459,6 +757,15 @@ class BaseUnit:
     def __rdiv__(self, other):
         """Implements reflected division using the / operator."""
 
+        try:
+            kind = _OPERAND_KINDS[other.__class__]
+        except KeyError:
+            kind = _operand_kind(other.__class__)
+        if kind == _NUMBER:
+            result_type = _result_type(None, self._type, True)
+            if result_type is not None:
+                base_value = self._base_value or self.base_value
+                return result_type._base_class(other / (base_value * self._si_factor) / result_type._si_factor)
         raise UnknownUnitDivisionError('No method to divide by unit {0} has been implemented.'.format(self.name))
 
     def __rtruediv__(self, other):
@@ -470,15 +777,7 @@ class BaseUnit:
     def __idiv__(self, other):
         """Implements division using the / operator."""
 
-        if isinstance(other, (float, int)):
-            self.value /= other
-            return self
-        elif issubclass(type(other), BaseUnit):
-            raise UnknownUnitDivisionError('So far the division of {0} by {1} is unknown.', self.name,
-                                           other.name)
-        else:
-            raise TypeError(
-                'Can not divide Unit {0} by object of type {1}'.format(self.name, type(other).__name__))
+        return self.__div__(other)
 
     def __itruediv__(self, other):
         """Implements true division with assignment. Note that this only works when from __future__ import division is
@@ -493,15 +792,340 @@ class BaseUnit:
 
     @value.setter
     def value(self, new_value):
-        # store the value
+        # store the value, the base value is only converted again when it is read
         self._value = float(new_value)
-        # convert the value into the base class
-        self._base_value = self.to_base(self._value)
+        self._base_value = None
 
     @property
     def base_value(self):
-        return self._base_value
+        base_value = self._base_value
+        if base_value is None:
+            # convert the value into the base class on the first read after the value changed
+            base_value = self._base_value = self.to_base(self._value)
+        return base_value
 
     @property
     def type(self):
         return self._type
+
+
+def _reduce(quantity):
+    """Returns the pickle data of a unit object. The pyUnitTypes.wire module (which imports this module) is imported on
+    the first call and its function replaces this one."""
+
+    global _reduce
+    _reduce = import_module('pyUnitTypes.wire')._reduce
+    return _reduce(quantity)
+
+
+# memoized unit types of products and quotients: (unit type, unit type, divide) -> unit type, float or None. Cleared
+# when a unit type of a new dimension is defined.
+_RESULT_TYPES = {}
+
+
+def _result_type(type_a, type_b, divide):
+    """Returns the unit type of the product or quotient of two unit types. The unit types stand for their dimension, so
+    after the first calculation the result is a single dict lookup.
+
+    :param type_a: (mandatory, type) unit type of the first operand, None for plain numbers
+    :param type_b: (mandatory, type) unit type of the second operand
+    :param divide: (mandatory, bool) True for the quotient, False for the product
+    :returns type: the resulting unit type, float for dimensionless results or None if the unit type is unknown
+    """
+
+    key = (type_a, type_b, divide)
+    try:
+        return _RESULT_TYPES[key]
+    except KeyError:
+        pass
+
+    dimension_a = Dimension() if type_a is None else type_a.dimension
+    dimension_b = type_b.dimension
+    if dimension_a is None or dimension_b is None or None in (getattr(type_a, '_si_factor', 1.0), type_b._si_factor):
+        # unknown dimensions and units which are not proportional to their SI unit (e.g. temperatures)
+        result = None
+    else:
+        dimension = dimension_a / dimension_b if divide else dimension_a * dimension_b
+        result = unit_type(dimension) if dimension else float
+
+    _RESULT_TYPES[key] = result
+    return result
+
+
+# memoized conversions between two unit classes
+_CONVERSIONS = {}
+
+# called with (src, dst, error) for every conversion between two unit classes requested through conversion() and the
+# converter functions while pyUnitTypes.profiling is collecting, None otherwise
+_conversion_hook = None
+
+
+def conversion(src, dst):
+    """Returns the composed conversion from one unit class to another unit class of the same unit type. The conversion
+    is only composed on first request and then reused.
+
+    :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert from
+    :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert to
+    :returns pyUnitTypes.basics.Conversion: the conversion doing to_base of src and from_base of dst in one step
+    """
+
+    try:
+        composed = _CONVERSIONS[src, dst]
+    except KeyError:
+        try:
+            composed = _compose(src, dst)
+        except TypeError as error:
+            if _conversion_hook is not None:
+                _conversion_hook(src, dst, error)
+            raise
+    if _conversion_hook is not None:
+        _conversion_hook(src, dst, None)
+    return composed
+
+
+def _compose(src, dst):
+    for unit in (src, dst):
+        if not (isinstance(unit, type) and issubclass(unit, BaseUnit) and unit.to_base is not None):
+            raise TypeError('Expected a unit class, got {0}'.format(getattr(unit, '__name__', type(unit).__name__)))
+    if src._type is not dst._type:
+        raise TypeError('Can not convert {0} to {1}'.format(src.__name__, dst.__name__))
+
+    composed = dst.from_base @ src.to_base
+    _CONVERSIONS[src, dst] = composed
+    return composed
+
+
+def conversion_table(unit_type):
+    """Returns the composed conversions between all units registered to the given unit type.
+
+    :param unit_type: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit type, e.g. Length or Temperature
+    :returns dict: (source unit class, target unit class) -> pyUnitTypes.basics.Conversion
+    """
+
+    units = getattr(unit_type, '_units', None)
+    if units is None:
+        raise TypeError('{0} is not a unit type'.format(getattr(unit_type, '__name__', type(unit_type).__name__)))
+
+    return {(src, dst): _CONVERSIONS.get((src, dst)) or _compose(src, dst) for src in units for dst in units}
+
+
+def convert(value, src, dst):
+    """Converts a numeric value from one unit class to another with a single multiply-add.
+
+    :param value: (mandatory, float or int) the value in the src unit
+    :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert from
+    :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert to
+    :returns float: the value in the dst unit
+    """
+
+    return conversion(src, dst).convert(value)
+
+
+def _literal(value, namespace):
+    """Returns the source code of a float constant. Constants without literal (inf and nan) are passed by name."""
+
+    if math.isfinite(value):
+        return repr(value)
+    name = '_c{0}'.format(len(namespace))
+    namespace[name] = value
+    return name
+
+
+def _expression(conversions, namespace):
+    """Returns the source code of the conversions applied one after the other on x with all constants inlined. Steps
+    which don't change the result bit by bit are left out: multiplications by 1, additions of -0.0 and additions of 0.0,
+    which only turn -0.0 into 0.0, if a later addition does the same or if the value is a sum and can't be -0.0."""
+
+    steps = []
+    for step in conversions:
+        if step.factor != 1:
+            steps.append(('*', step.factor))
+        if step.offset != 0 or math.copysign(1.0, step.offset) > 0:
+            steps.append(('+', step.offset))
+
+    last_addition = max((index for index, (operator, _) in enumerate(steps) if operator == '+'), default=-1)
+    expression = 'x'
+    previous = None
+    for index, (operator, constant) in enumerate(steps):
+        if operator == '*':
+            if ' ' in expression:
+                expression = '(' + expression + ')'
+            expression = '{0} * {1}'.format(_literal(constant, namespace), expression)
+        elif constant == 0 and (index < last_addition or previous == '+'):
+            continue
+        else:
+            expression = '{0} {1} {2}'.format(expression, '-' if constant < 0 else '+',
+                                              _literal(abs(constant), namespace))
+        previous = operator
+    # the result is a float like the one of the conversions, also for int input
+    return 'float(x)' if expression == 'x' else expression
+
+
+def _compile(name, conversions):
+    """Generates a function converting a number and a function converting an iterable of numbers into a list.
+
+    :param name: (mandatory, str) the name of the functions, a valid identifier
+    :param conversions: (mandatory, tuple of pyUnitTypes.basics.Conversion) the conversions, the first one is applied
+    first
+    :returns tuple: (function(x) -> float, function(values) -> list)
+    """
+
+    namespace = {}
+    expression = _expression(conversions, namespace)
+    source = 'def {0}(x):\n    return {1}\n\n\ndef {0}_list(values):\n    return [{1} for x in values]\n'.format(
+        name, expression)
+    exec(compile(source, '<pyUnitTypes {0}>'.format(name), 'exec'), namespace)
+    return namespace[name], namespace[name + '_list']
+
+
+# memoized generated list functions per conversion, the conversions are interned and serve as keys
+_CONVERSION_KERNELS = {}
+
+
+def _list_kernel(step):
+    """Returns the generated function converting an iterable of numbers into a list with a single conversion."""
+
+    try:
+        return _CONVERSION_KERNELS[step]
+    except KeyError:
+        pass
+    kernel = _CONVERSION_KERNELS[step] = _compile('convert', (step,))[1]
+    return kernel
+
+
+# memoized generated plain number converters between two unit classes: (src, dst) -> (function, list function)
+_CONVERTERS = {}
+
+
+def _set_conversion_hook(hook):
+    """Sets the function called for every conversion, see _conversion_hook. The converters are never wrapped, a
+    converter is counted once when it is handed out.
+
+    :param hook: (mandatory, function or None) called with the source unit, the target unit and the raised error
+    """
+
+    global _conversion_hook
+    _conversion_hook = hook
+
+
+def _converters(src, dst):
+    try:
+        functions = _CONVERTERS[src, dst]
+    except KeyError:
+        # validates the unit classes
+        if (src, dst) not in _CONVERSIONS:
+            try:
+                _compose(src, dst)
+            except TypeError as error:
+                if _conversion_hook is not None:
+                    _conversion_hook(src, dst, error)
+                raise
+        functions = _CONVERTERS[src, dst] = _compile('{0}_to_{1}'.format(src.__name__, dst.__name__),
+                                                     (src.to_base, dst.from_base))
+    if _conversion_hook is not None:
+        _conversion_hook(src, dst, None)
+    return functions
+
+
+def converter(src, dst):
+    """Returns a plain function converting numbers from one unit class to another without creating any unit objects.
+    The function applies to_base of src and from_base of dst exactly like ``dst(src(x)).value`` does, so the results are
+    bit-identical to the class path. The function is generated with the factors and offsets inlined as constants, e.g.
+    ``0.5555555555555556 * x - 17.77777777777778`` for Fahrenheit to Celsius, only on first request and then reused.
+
+    :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert from
+    :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert to
+    :returns function: function taking a float or int in the src unit and returning the float in the dst unit
+    """
+
+    return _converters(src, dst)[0]
+
+
+def list_converter(src, dst):
+    """Returns a generated function converting an iterable of numbers from one unit class to another into a list, see
+    converter. The conversion runs in a list comprehension without any function call per value.
+
+    :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert from
+    :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert to
+    :returns function: function taking an iterable of floats or ints in the src unit and returning a list of floats in
+    the dst unit
+    """
+
+    return _converters(src, dst)[1]
+
+
+def convert_list(values, src, dst):
+    """Converts numbers from one unit class to another, see list_converter.
+
+    :param values: (mandatory, iterable of float or int) the values in the src unit
+    :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert from
+    :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert to
+    :returns list: the values in the dst unit
+    """
+
+    try:
+        function = _CONVERTERS[src, dst][1]
+    except KeyError:
+        return _converters(src, dst)[1](values)
+    if _conversion_hook is not None:
+        _conversion_hook(src, dst, None)
+    return function(values)
+
+
+def convert_iter(values, src, dst):
+    """Returns an iterator converting numbers from one unit class to another one by one, for streams which can't be
+    held in a list, see converter.
+
+    :param values: (mandatory, iterable of float or int) the values in the src unit
+    :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert from
+    :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert to
+    :returns iterator: the values in the dst unit
+    """
+
+    return map(converter(src, dst), values)
+
+
+def convert_scalar(value, src, dst):
+    """Converts a number from one unit class to another. The result is bit-identical to ``dst(src(value)).value``.
+
+    :param value: (mandatory, float or int) the value in the src unit
+    :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert from
+    :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class to convert to
+    :returns float: the value in the dst unit
+    """
+
+    try:
+        function = _CONVERTERS[src, dst][0]
+    except KeyError:
+        return _converters(src, dst)[0](value)
+    if _conversion_hook is not None:
+        _conversion_hook(src, dst, None)
+    return function(value)
+
+
+def unregister_unit(unit):
+    """Removes a unit class from its unit type and from the caches and indexes of the package, e.g. a unit created by
+    a test. Existing objects of the unit keep working, but the unit isn't found by the parser and has no wire format id
+    anymore.
+
+    :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class, not a unit type
+    """
+
+    if not (isinstance(unit, type) and issubclass(unit, BaseUnit) and unit.to_base is not None):
+        raise TypeError('Can not unregister {0!r}, it is not a unit class.'.format(unit))
+    if unit not in unit._type._units:
+        raise UnknownUnitError('The unit {0} is not registered.'.format(unit.__name__))
+    if unit is unit._type._base_class:
+        raise ValueError('The base class {0} of a unit type can not be unregistered.'.format(unit.__name__))
+
+    unit._type._units.remove(unit)
+    _OPERAND_KINDS.pop(unit, None)
+    for cache in (_CONVERSIONS, _CONVERTERS):
+        for key in [key for key in cache if unit in key]:
+            del cache[key]
+
+    # the modules indexing the units are only updated if they are used at all
+    for module_name in ('pyUnitTypes.parser', 'pyUnitTypes.wire'):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            module._unregister(unit)
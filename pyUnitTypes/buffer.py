@@ -0,0 +1,233 @@
+import math
+from array import array
+
+from pyUnitTypes.basics import BaseUnit, _list_kernel, conversion
+
+_NUMBER_TYPES = {float, int}
+
+
+def _converted(values, step):
+    """Returns the values converted with the generated kernel of the conversion step, or the values themselves if the
+    step does not change them."""
+
+    if step.is_identity:
+        return values
+    return _list_kernel(step)(values)
+
+
+class QuantityBuffer:
+    """
+    The QuantityBuffer holds many values of the same unit in a stdlib array('d') for deployments without numpy. Every
+    value needs 8 bytes instead of a whole unit object. The buffer supports bulk conversion in place, appending and
+    slicing, where slices are memoryview based views sharing the values with the buffer. Views take the unit from the
+    buffer they were sliced from, so they follow its in place conversions.
+
+    The values are exposed through the buffer protocol (``value`` on every Python version, the buffer itself on Python
+    3.12+), so they can be written to files and sockets without copying them. Like for array('d') the buffer can't grow
+    while a memoryview of it exists.
+    """
+
+    __slots__ = ('_values', '_own_unit', '_parent', '_type')
+
+    def __init__(self, values, unit):
+        """Creates a new QuantityBuffer.
+
+        :param values: (mandatory, iterable of float, int or pyUnitTypes.basics.BaseUnit or QuantityBuffer) the values
+        in the given unit. Unit objects and QuantityBuffers of the same unit type will be converted into the given unit.
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class of all values, e.g. Meter
+        """
+
+        if not (isinstance(unit, type) and issubclass(unit, BaseUnit) and unit.to_base is not None):
+            raise TypeError('Expected a unit class as unit, got {0}'.format(getattr(unit, '__name__',
+                                                                                    type(unit).__name__)))
+        self._own_unit = unit
+        self._parent = None
+        self._type = unit._type
+        self._values = array('d')
+        self.extend(values)
+
+    @classmethod
+    def _wrap(cls, values, unit, parent=None):
+        """Wraps an array('d') or memoryview of doubles without copying it. Views of a buffer are wrapped with the
+        buffer owning the array as parent and use its unit."""
+
+        obj = cls.__new__(cls)
+        obj._values = values
+        obj._own_unit = unit
+        obj._parent = parent
+        obj._type = unit._type
+        return obj
+
+    @classmethod
+    def from_bytes(cls, data, unit):
+        """Creates a QuantityBuffer from the bytes of float64 values in native byte order, e.g. as read from a file
+        written from a QuantityBuffer.
+
+        :param data: (mandatory, bytes-like object) the values, the length needs to be a multiple of 8
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class of the values
+        """
+
+        buffer = cls((), unit)
+        buffer._values.frombytes(data)
+        return buffer
+
+    def _number(self, value):
+        """Returns a single value in the unit of the buffer."""
+
+        if isinstance(value, (float, int)):
+            return value
+        if isinstance(value, BaseUnit):
+            if value._type is not self._type:
+                raise TypeError('Can not add {0} to QuantityBuffer of {1}'.format(type(value).__name__,
+                                                                                  self._unit.__name__))
+            return self._unit.from_base(value._base_value or value.base_value)
+        raise TypeError('Can not add object of type {0} to QuantityBuffer of {1}'.format(type(value).__name__,
+                                                                                         self._unit.__name__))
+
+    def _array(self, values):
+        """Returns the values as array('d') in the unit of the buffer."""
+
+        if isinstance(values, QuantityBuffer):
+            return values.to(self._unit)._values
+        if isinstance(values, array) and values.typecode == 'd':
+            return values
+        if isinstance(values, array):
+            return array('d', values)
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        # plain numbers are copied by the array without running any Python code. Unit objects need to be converted,
+        # array('d') would take their value in their own unit through __float__.
+        if set(map(type, values)) <= _NUMBER_TYPES:
+            return array('d', values)
+        return array('d', map(self._number, values))
+
+    def append(self, value):
+        """Appends a value to the end of the buffer.
+
+        :param value: (mandatory, float, int or pyUnitTypes.basics.BaseUnit) the value in the unit of the buffer or a
+        unit object of the same unit type
+        """
+
+        if self._parent is not None:
+            raise TypeError('Can not append to a view of a QuantityBuffer.')
+        self._values.append(self._number(value))
+
+    def extend(self, values):
+        """Appends many values to the end of the buffer.
+
+        :param values: (mandatory, iterable of float, int or pyUnitTypes.basics.BaseUnit or QuantityBuffer) the values
+        in the unit of the buffer or unit objects of the same unit type
+        """
+
+        if self._parent is not None:
+            raise TypeError('Can not extend a view of a QuantityBuffer.')
+        self._values.extend(self._array(values))
+
+    def to(self, unit):
+        """Returns a new QuantityBuffer with all values converted into the given unit.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        """
+
+        return QuantityBuffer._wrap(array('d', _converted(self._values, conversion(self._unit, unit))), unit)
+
+    def convert(self, unit):
+        """Converts all values in place into the given unit. Views of the buffer see the converted values in the new
+        unit. Views themselves can't be converted, as the other values of the buffer would keep their unit.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        """
+
+        if self._parent is not None:
+            raise TypeError('Can not convert a view of a QuantityBuffer in place, use to() for a converted copy.')
+        composed = conversion(self._unit, unit)
+        if not composed.is_identity:
+            self._values[:] = array('d', _list_kernel(composed)(self._values))
+        self._own_unit = unit
+        return self
+
+    def copy(self):
+        """Returns a copy of the QuantityBuffer with its own array."""
+
+        return QuantityBuffer._wrap(array('d', self._values), self._unit)
+
+    def sum(self):
+        """Returns the sum of the values as unit object. Like pyUnitTypes.reductions.qsum the values are summed up in
+        the base unit with compensated summation."""
+
+        total = math.fsum(_converted(self._values, self._unit.to_base))
+        return self._unit(self._unit.from_base(total))
+
+    def mean(self):
+        """Returns the arithmetic mean of the values as unit object, see sum."""
+
+        self._check_not_empty()
+        total = math.fsum(_converted(self._values, self._unit.to_base))
+        return self._unit(self._unit.from_base(total / len(self._values)))
+
+    def min(self):
+        """Returns the smallest value as unit object."""
+
+        self._check_not_empty()
+        return self._unit(min(self._values))
+
+    def max(self):
+        """Returns the largest value as unit object."""
+
+        self._check_not_empty()
+        return self._unit(max(self._values))
+
+    def _check_not_empty(self):
+        if not len(self._values):
+            raise ValueError('Can not aggregate an empty QuantityBuffer.')
+
+    def __buffer__(self, flags):
+        return memoryview(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return map(self._unit, self._values)
+
+    def __getitem__(self, item):
+        """Returns a unit object for integer indices and a view sharing the values for slices."""
+
+        if isinstance(item, slice):
+            parent = self if self._parent is None else self._parent
+            return QuantityBuffer._wrap(memoryview(self._values)[item], self._unit, parent)
+        return self._unit(self._values[item])
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            self._values[key] = self._array(value)
+        else:
+            self._values[key] = self._number(value)
+
+    def __repr__(self):  # pragma: no cover
+        return "QuantityBuffer({0}, {1})".format(self._values.tolist(), self._unit.__name__)
+
+    def __str__(self):  # pragma: no cover
+        return "{0} {1}".format(self._values.tolist(), self._unit.symbol)
+
+    @property
+    def _unit(self):
+        if self._parent is None:
+            return self._own_unit
+        return self._parent._own_unit
+
+    @property
+    def value(self):
+        return self._values
+
+    @property
+    def nbytes(self):
+        return len(self._values) * self._values.itemsize
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def type(self):
+        return self._type
@@ -0,0 +1,291 @@
+import operator
+from array import array
+
+from pyUnitTypes.arrays import QuantityArray, np
+from pyUnitTypes.basics import BaseUnit, UnknownUnitDivisionError, UnknownUnitMultiplicationError, conversion
+from pyUnitTypes.buffer import QuantityBuffer
+
+_NUMBERS = (int, float) if np is None else (int, float, np.number)
+
+
+def _raw(leaf):
+    """Returns the values of a leaf in its own unit: a number, a numpy array or a sequence of floats."""
+
+    if isinstance(leaf, (BaseUnit, QuantityArray, QuantityBuffer)):
+        return leaf.value
+    return leaf
+
+
+def _is_numpy(raw):
+    return np is not None and isinstance(raw, np.ndarray)
+
+
+class LazyQuantity:
+    """
+    The LazyQuantity records conversions and arithmetic of quantities instead of executing them. All supported
+    operations are affine, so the expression is kept simplified as
+
+        result = offset + sum(factor * values of leaf)
+
+    in the unit of the expression: conversions are composed into the factors and the offset, the same leaf used twice
+    is merged into one term and identity steps disappear. evaluate() then computes the result in one pass over the
+    values of every leaf, for unit objects as well as for QuantityArray and QuantityBuffer. The values of the leaves
+    are read on evaluation, not when the expression is built.
+
+    Like QuantityArray, quantities of the same unit type are added in the base unit and the result is in the unit of
+    the left operand. Numbers are added to and multiplied with the values in the unit of the expression.
+    """
+
+    __slots__ = ('_unit', '_terms', '_offset')
+
+    # let numpy hand over mixed operations like ndarray + LazyQuantity to the reflected operators of this class
+    __array_ufunc__ = None
+
+    def __init__(self, values, unit=None):
+        """Creates a new LazyQuantity of a single leaf.
+
+        :param values: (mandatory, pyUnitTypes.basics.BaseUnit, QuantityArray, QuantityBuffer or raw values) the leaf.
+        Raw values (numbers, numpy arrays or array('d')) need the unit.
+        :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of raw values. Default: the unit of
+        the leaf
+        """
+
+        if isinstance(values, BaseUnit):
+            default = type(values)
+        elif isinstance(values, (QuantityArray, QuantityBuffer)):
+            default = values.unit
+        else:
+            default = None
+        if unit is None:
+            if default is None:
+                raise TypeError('The unit of values of type {0} is needed.'.format(type(values).__name__))
+            unit = default
+        elif default is not None and default is not unit:
+            raise TypeError('The values are in {0}, not in {1}.'.format(default.__name__, unit.__name__))
+        if not (isinstance(unit, type) and issubclass(unit, BaseUnit) and unit.to_base is not None):
+            raise TypeError('Expected a unit class as unit, got {0}'.format(getattr(unit, '__name__',
+                                                                                    type(unit).__name__)))
+
+        self._unit = unit
+        self._terms = ((values, 1.0),)
+        self._offset = 0.0
+
+    @classmethod
+    def _new(cls, unit, terms, offset):
+        obj = cls.__new__(cls)
+        obj._unit = unit
+        obj._terms = terms
+        obj._offset = offset
+        return obj
+
+    def _apply(self, factor, offset, unit):
+        """Returns the expression with y = factor * x + offset applied on the result."""
+
+        if factor == 1 and offset == 0 and unit is self._unit:
+            return self
+        terms = tuple((leaf, coefficient * factor) for leaf, coefficient in self._terms)
+        return LazyQuantity._new(unit, terms, self._offset * factor + offset)
+
+    def _quantity(self, other):
+        """Returns the other operand as LazyQuantity if it is a quantity of the same unit type, None if it's not a
+        quantity at all and raises a TypeError if the unit types don't match."""
+
+        if isinstance(other, (BaseUnit, QuantityArray, QuantityBuffer)):
+            other = LazyQuantity(other)
+        elif not isinstance(other, LazyQuantity):
+            return None
+        if other._unit._type is not self._unit._type:
+            raise TypeError('Can not combine {0} with {1}.'.format(other._unit._type.__name__,
+                                                                   self._unit._type.__name__))
+        return other
+
+    def _add(self, other, sign):
+        """Returns self + sign * other for quantities, numbers and raw arrays in the unit of the expression."""
+
+        quantity = self._quantity(other)
+        if quantity is not None:
+            # both sides in the base unit, the sum back in the unit of the left operand
+            to_base, from_base = self._unit.to_base, self._unit.from_base
+            left = self._apply(to_base.factor, to_base.offset, self._unit)
+            right = quantity._apply(sign * quantity._unit.to_base.factor, sign * quantity._unit.to_base.offset,
+                                    self._unit)
+            return LazyQuantity._sum(left, right)._apply(from_base.factor, from_base.offset, self._unit)
+        if isinstance(other, _NUMBERS):
+            return LazyQuantity._new(self._unit, self._terms, self._offset + sign * other)
+        if _is_numpy(other) or isinstance(other, array):
+            return LazyQuantity._sum(self, LazyQuantity._new(self._unit, ((other, float(sign)),), 0.0))
+        return NotImplemented
+
+    @staticmethod
+    def _sum(left, right):
+        """Returns the sum of two expressions in the same unit, terms of the same leaf are merged."""
+
+        terms = {}
+        for leaf, coefficient in left._terms + right._terms:
+            key = id(leaf)
+            if key in terms:
+                coefficient += terms[key][1]
+            terms[key] = (leaf, coefficient)
+        return LazyQuantity._new(left._unit, tuple(terms.values()), left._offset + right._offset)
+
+    def to(self, unit):
+        """Returns the expression converted into the given unit.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        """
+
+        composed = conversion(self._unit, unit)
+        return self._apply(composed.factor, composed.offset, unit)
+
+    def evaluate(self):
+        """Computes the expression.
+
+        :returns: a unit object if all leaves are scalars, a QuantityArray if a leaf is a QuantityArray or a numpy
+        array and a QuantityBuffer otherwise
+        """
+
+        constant = self._offset
+        leaves = []
+        for leaf, coefficient in self._terms:
+            raw = _raw(leaf)
+            if isinstance(raw, _NUMBERS):
+                constant += coefficient * raw
+            elif coefficient != 0:
+                leaves.append((raw, float(coefficient)))
+
+        if not leaves:
+            for leaf, _ in self._terms:
+                if not isinstance(_raw(leaf), _NUMBERS):
+                    return self._evaluate_empty(_raw(leaf), constant)
+            return self._unit(constant)
+        if any(_is_numpy(raw) for raw, _ in leaves):
+            return self._evaluate_numpy(leaves, constant)
+        return self._evaluate_buffer(leaves, constant)
+
+    def _evaluate_empty(self, raw, constant):
+        """All arrays cancel out, e.g. x - x: the result is the constant for every value."""
+
+        if _is_numpy(raw):
+            return QuantityArray._from_buffer(np.full(np.shape(raw), constant, dtype=np.float64), self._unit)
+        return QuantityBuffer._wrap(array('d', [constant]) * len(raw), self._unit)
+
+    def _evaluate_numpy(self, leaves, constant):
+        out = None
+        for raw, coefficient in leaves:
+            values = np.asarray(raw, dtype=np.float64)
+            if out is None:
+                out = np.multiply(values, coefficient) if coefficient != 1 else values.copy()
+                continue
+            if coefficient != 1:
+                values = np.multiply(values, coefficient)
+            if out.shape == np.broadcast_shapes(out.shape, values.shape):
+                np.add(out, values, out=out)
+            else:
+                out = out + values
+        if constant != 0:
+            np.add(out, constant, out=out)
+        return QuantityArray._from_buffer(out, self._unit)
+
+    def _evaluate_buffer(self, leaves, constant):
+        if len({len(raw) for raw, _ in leaves}) > 1:
+            raise ValueError('Can not combine sequences of different length.')
+
+        # the multiply-adds run in map, no Python code is executed per value
+        values = None
+        for raw, coefficient in leaves:
+            term = map(coefficient.__mul__, raw) if coefficient != 1 else iter(raw)
+            values = term if values is None else map(operator.add, values, term)
+        if constant != 0:
+            values = map(float(constant).__add__, values)
+        return QuantityBuffer._wrap(array('d', values), self._unit)
+
+    def __repr__(self):  # pragma: no cover
+        terms = ' + '.join('{0} * {1}'.format(coefficient, type(leaf).__name__) for leaf, coefficient in self._terms)
+        return 'LazyQuantity({0} + {1} in {2})'.format(terms, self._offset, self._unit.__name__)
+
+    def __pos__(self):
+        """Implements behavior for unary positive (e.g. +some_object)"""
+
+        return self
+
+    def __neg__(self):
+        """Implements behavior for negation (e.g. -some_object)"""
+
+        return self._apply(-1, 0, self._unit)
+
+    def __add__(self, other):
+        """Implements addition."""
+
+        return self._add(other, 1)
+
+    def __radd__(self, other):
+        """Implements reflected addition."""
+
+        if isinstance(other, (BaseUnit, QuantityArray, QuantityBuffer)):
+            return LazyQuantity(other)._add(self, 1)
+        return self._add(other, 1)
+
+    def __sub__(self, other):
+        """Implements subtraction."""
+
+        return self._add(other, -1)
+
+    def __rsub__(self, other):
+        """Implements reflected subtraction."""
+
+        if isinstance(other, (BaseUnit, QuantityArray, QuantityBuffer)):
+            return LazyQuantity(other)._add(self, -1)
+        return (-self)._add(other, 1)
+
+    def __mul__(self, other):
+        """Implements multiplication."""
+
+        if isinstance(other, _NUMBERS):
+            return self._apply(other, 0, self._unit)
+        if isinstance(other, (LazyQuantity, BaseUnit, QuantityArray, QuantityBuffer)):
+            raise UnknownUnitMultiplicationError('Lazy quantities can only be multiplied by numbers.')
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """Implements reflected multiplication."""
+
+        return self * other
+
+    def __truediv__(self, other):
+        """Implements true division."""
+
+        if isinstance(other, _NUMBERS):
+            if other == 0:
+                raise ZeroDivisionError('LazyQuantity division by zero')
+            return self._apply(1 / other, 0, self._unit)
+        if isinstance(other, (LazyQuantity, BaseUnit, QuantityArray, QuantityBuffer)):
+            raise UnknownUnitDivisionError('Lazy quantities can only be divided by numbers.')
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        """Implements reflected true division."""
+
+        raise UnknownUnitDivisionError('No method to divide by unit {0} has been implemented.'.format(
+            self._unit.__name__))
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def type(self):
+        return self._unit._type
+
+
+def lazy(values, unit=None):
+    """Starts a lazy expression: the conversions and arithmetic on the result are recorded and simplified, and only
+    computed by evaluate():
+
+        celsius = ((lazy(Fahrenheit(x)) + Fahrenheit(y)).to(Celsius) * 2).evaluate()
+
+    :param values: (mandatory, pyUnitTypes.basics.BaseUnit, QuantityArray, QuantityBuffer or raw values) the values
+    :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of raw values, e.g. a numpy array
+    :returns pyUnitTypes.lazy.LazyQuantity: the expression
+    """
+
+    return LazyQuantity(values, unit)
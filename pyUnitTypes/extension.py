@@ -0,0 +1,508 @@
+import numbers
+import re
+
+import numpy as np
+
+try:
+    import pandas as pd
+    from pandas.api.extensions import ExtensionArray, ExtensionDtype, register_extension_dtype, \
+        register_series_accessor, take
+    from pandas.api.indexers import check_array_indexer
+    from pandas.api.types import is_list_like
+except ImportError:  # pragma: no cover
+    raise ImportError('The pandas extension types of pyUnitTypes require pandas to be installed.')
+
+from pyUnitTypes.arrays import QuantityArray, _affine, _unit_info
+from pyUnitTypes.basics import BaseUnit, conversion
+
+# reductions and groupby aggregations which keep the unit of the values
+_UNIT_REDUCTIONS = {'sum', 'mean', 'median', 'min', 'max', 'std', 'sem', 'first', 'last', 'nth', 'cummin', 'cummax',
+                    'cumsum'}
+
+# groupby operations which return plain numbers, e.g. ranks and positions
+_PLAIN_REDUCTIONS = {'rank', 'idxmin', 'idxmax', 'any', 'all', 'ohlc'}
+
+# reductions which would change the unit type, e.g. the product of lengths is an area
+_UNSUPPORTED_REDUCTIONS = {'prod', 'cumprod', 'var', 'skew', 'kurt'}
+
+
+def _is_na(value):
+    return value is None or value is pd.NA or (isinstance(value, float) and value != value)
+
+
+@register_extension_dtype
+class UnitDtype(ExtensionDtype):
+    """
+    The UnitDtype is the pandas dtype of columns of values of one unit, e.g. UnitDtype(Meter) or 'unit[Meter]'. The
+    values are stored in a float64 buffer (see UnitArray), missing values are NaN.
+    """
+
+    _metadata = ('unit',)
+    _match = re.compile(r'^unit\[(?P<unit>.+)\]$')
+    na_value = np.nan
+
+    def __init__(self, unit):
+        """Creates a new UnitDtype.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class of the values, e.g. Meter
+        """
+
+        _unit_info(unit)
+        self.unit = unit
+
+    @classmethod
+    def construct_from_string(cls, string):
+        """Creates the UnitDtype of a string like 'unit[Meter]' or 'unit[km]', see pyUnitTypes.parser.parse_unit."""
+
+        if not isinstance(string, str):
+            raise TypeError("'construct_from_string' expects a string, got {0}".format(type(string).__name__))
+        match = cls._match.match(string)
+        if match is None:
+            raise TypeError("Cannot construct a 'UnitDtype' from '{0}'".format(string))
+
+        from pyUnitTypes.parser import parse_unit
+        return cls(parse_unit(match.group('unit')))
+
+    @classmethod
+    def construct_array_type(cls):
+        return UnitArray
+
+    @property
+    def name(self):
+        return 'unit[{0}]'.format(self.unit.__name__)
+
+    @property
+    def type(self):
+        return self.unit
+
+    @property
+    def _is_numeric(self):
+        return True
+
+    def _get_common_dtype(self, dtypes):
+        """Columns of units of the same unit type are concatenated in the unit of the first column."""
+
+        if all(isinstance(dtype, UnitDtype) and dtype.unit._type is self.unit._type for dtype in dtypes):
+            return self
+        return None
+
+
+class UnitArray(ExtensionArray):
+    """
+    The UnitArray is the pandas ExtensionArray of UnitDtype columns. It holds the values in one float64 numpy buffer and
+    implements conversions, arithmetic, comparisons, reductions and groupby aggregations on the whole buffer with the
+    semantics of pyUnitTypes.arrays.QuantityArray, so no unit objects are created.
+    """
+
+    # let numpy hand over mixed operations like ndarray + UnitArray to the reflected operators of this class
+    __array_ufunc__ = None
+
+    def __init__(self, values, unit, copy=False):
+        """Creates a new UnitArray.
+
+        :param values: (mandatory, array like of float) the values in the given unit, NaN for missing values
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit of the values
+        :param copy: (optional, bool) copy the values even if they are a float64 numpy array already. Default: False
+        """
+
+        values = np.array(values, dtype=np.float64, copy=True if copy else None)
+        if values.ndim != 1:
+            raise ValueError('The values need to be one dimensional.')
+        self._data = values
+        self._dtype = UnitDtype(unit)
+
+    @classmethod
+    def _wrap(cls, values, unit):
+        """Wraps a float64 buffer without copying it."""
+
+        obj = cls.__new__(cls)
+        obj._data = values
+        obj._dtype = UnitDtype(unit)
+        return obj
+
+    @staticmethod
+    def _unit_of_dtype(dtype):
+        if dtype is None:
+            return None
+        if isinstance(dtype, str):
+            dtype = UnitDtype.construct_from_string(dtype)
+        if isinstance(dtype, UnitDtype):
+            return dtype.unit
+        return dtype
+
+    @classmethod
+    def from_units(cls, units, unit=None):
+        """Creates a UnitArray from unit objects of the same unit type in any mix of units, e.g. for
+        pd.Series(UnitArray.from_units(readings)). None and NaN are missing values.
+
+        :param units: (mandatory, iterable of pyUnitTypes.basics.BaseUnit) the unit objects
+        :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the array. Default: unit of the
+        first unit object
+        """
+
+        return cls._from_sequence(units, dtype=unit)
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        """Creates a UnitArray from unit objects of the same unit type, a UnitArray or QuantityArray, or from numbers
+        in the unit of the dtype. Missing values (None, NaN, pd.NA) are kept as NaN."""
+
+        unit = cls._unit_of_dtype(dtype)
+        if isinstance(scalars, UnitArray):
+            return scalars.to(scalars.unit if unit is None else unit, copy=copy)
+        if isinstance(scalars, QuantityArray):
+            return cls._wrap(scalars.to(scalars.unit if unit is None else unit).value.reshape(-1), unit or scalars.unit)
+        if isinstance(scalars, np.ndarray) and scalars.dtype.kind in 'biuf':
+            if unit is None:
+                raise ValueError('The unit of plain numbers is needed, use dtype=UnitDtype(unit).')
+            return cls(scalars, unit, copy=copy)
+
+        scalars = list(scalars)
+        if unit is None:
+            unit = next((type(value) for value in scalars if isinstance(value, BaseUnit)), None)
+            if unit is None:
+                raise ValueError('The unit of plain numbers is needed, use dtype=UnitDtype(unit).')
+
+        dimension_id = unit._dimension_id
+        values = np.empty(len(scalars), dtype=np.float64)
+        conversions = {}
+        for index, value in enumerate(scalars):
+            if isinstance(value, BaseUnit):
+                if value._dimension_id != dimension_id:
+                    raise TypeError('Can not create UnitArray of {0} from object of type {1}'.format(
+                        unit.__name__, type(value).__name__))
+                try:
+                    composed = conversions[type(value)]
+                except KeyError:
+                    composed = conversions[type(value)] = conversion(type(value), unit)
+                values[index] = composed.factor * value._value + composed.offset
+            elif _is_na(value):
+                values[index] = np.nan
+            else:
+                values[index] = value
+        return cls._wrap(values, unit)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype, copy=False):
+        return cls(np.asarray(strings, dtype=np.float64), cls._unit_of_dtype(dtype))
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values, original.unit)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        """Concatenates UnitArrays of the same unit type, all values are converted into the unit of the first one."""
+
+        unit = to_concat[0].unit
+        return cls._wrap(np.concatenate([array.to(unit)._data for array in to_concat]), unit)
+
+    def _values_in_unit(self, value):
+        """Returns unit objects, UnitArrays, sequences and numbers as float64 values in the unit of the array."""
+
+        if isinstance(value, UnitArray):
+            return value.to(self.unit)._data
+        if isinstance(value, BaseUnit):
+            if value._dimension_id != self.unit._dimension_id:
+                raise TypeError('Can not set object of type {0} in UnitArray of {1}'.format(type(value).__name__,
+                                                                                         self.unit.__name__))
+            return conversion(type(value), self.unit).convert(value._value)
+        if _is_na(value):
+            return np.nan
+        if is_list_like(value):
+            return self._from_sequence(value, dtype=self._dtype)._data
+        return value
+
+    def __getitem__(self, item):
+        """Returns a unit object (or NaN for missing values) for integer indices and a UnitArray otherwise."""
+
+        if isinstance(item, numbers.Integral):
+            value = self._data[item]
+            return self._dtype.na_value if np.isnan(value) else self.unit(float(value))
+        if is_list_like(item) or not isinstance(item, (slice, type(Ellipsis))):
+            item = check_array_indexer(self, item)
+        return self._wrap(self._data[item], self.unit)
+
+    def __setitem__(self, key, value):
+        if is_list_like(key):
+            key = check_array_indexer(self, key)
+        self._data[key] = self._values_in_unit(value)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        unit = self.unit
+        na_value = self._dtype.na_value
+        for value in self._data.tolist():
+            yield na_value if value != value else unit(value)
+
+    def __array__(self, dtype=None, copy=None):
+        """Returns the float64 values in the unit of the array, like pyUnitTypes.arrays.QuantityArray."""
+
+        if dtype is None or np.dtype(dtype) == np.float64:
+            return self._data.copy() if copy else self._data
+        return np.array(self._data, dtype=dtype)
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+    @property
+    def unit(self):
+        return self._dtype.unit
+
+    def isna(self):
+        return np.isnan(self._data)
+
+    def copy(self):
+        return self._wrap(self._data.copy(), self.unit)
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        if allow_fill:
+            fill_value = np.nan if fill_value is None else self._values_in_unit(fill_value)
+        return self._wrap(take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value), self.unit)
+
+    def _values_for_factorize(self):
+        return self._data, np.nan
+
+    def _values_for_argsort(self):
+        return self._data
+
+    def to(self, unit, copy=True):
+        """Returns the values converted into another unit of the same unit type with one affine transformation.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        :param copy: (optional, bool) copy the values even if the unit doesn't change. Default: True
+        """
+
+        if unit is self.unit:
+            return self.copy() if copy else self
+        composed = conversion(self.unit, unit)
+        return self._wrap(_affine(self._data, composed.factor, composed.offset), unit)
+
+    def astype(self, dtype, copy=True):
+        """Converts the values into another unit (a UnitDtype, a string like 'unit[Feet]' or a unit class) or returns
+        them as numpy array of another dtype, e.g. float."""
+
+        if isinstance(dtype, type) and issubclass(dtype, BaseUnit):
+            return self.to(dtype, copy=copy)
+        if isinstance(dtype, str) and UnitDtype._match.match(dtype):
+            dtype = UnitDtype.construct_from_string(dtype)
+        if isinstance(dtype, UnitDtype):
+            return self.to(dtype.unit, copy=copy)
+        if np.dtype(dtype) == object:
+            return np.array(list(self), dtype=object)
+        return super().astype(dtype, copy=copy)
+
+    def unique(self):
+        return self._wrap(pd.unique(self._data), self.unit)
+
+    def value_counts(self, dropna=True):
+        """Returns the number of occurrences of every value as Series with a UnitDtype index."""
+
+        counts = pd.Series(self._data).value_counts(dropna=dropna)
+        index = pd.Index(self._wrap(counts.index.to_numpy(dtype=np.float64), self.unit))
+        return pd.Series(counts.to_numpy(), index=index, name='count')
+
+    # arithmetic and comparisons: the semantics of pyUnitTypes.arrays.QuantityArray on the whole buffer
+
+    def _quantity_array(self):
+        return QuantityArray._from_buffer(self._data, self.unit)
+
+    def _operand(self, other):
+        if isinstance(other, UnitArray):
+            return other._quantity_array()
+        if isinstance(other, (BaseUnit, numbers.Number, np.ndarray)):
+            return other
+        if is_list_like(other):
+            return np.asarray(other, dtype=np.float64)
+        return other
+
+    def _result(self, result):
+        if isinstance(result, QuantityArray):
+            return self._wrap(result.value, result.unit)
+        return result
+
+    def _binary(self, other, operator):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        return self._result(operator(self._quantity_array(), self._operand(other)))
+
+    def __add__(self, other):
+        return self._binary(other, lambda a, b: a + b)
+
+    def __radd__(self, other):
+        return self._binary(other, lambda a, b: b + a)
+
+    def __sub__(self, other):
+        return self._binary(other, lambda a, b: a - b)
+
+    def __rsub__(self, other):
+        return self._binary(other, lambda a, b: b - a)
+
+    def __mul__(self, other):
+        return self._binary(other, lambda a, b: a * b)
+
+    def __rmul__(self, other):
+        return self._binary(other, lambda a, b: b * a)
+
+    def __truediv__(self, other):
+        return self._binary(other, lambda a, b: a / b)
+
+    def __rtruediv__(self, other):
+        return self._binary(other, lambda a, b: b / a)
+
+    def __neg__(self):
+        return self._wrap(-self._data, self.unit)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self._wrap(np.abs(self._data), self.unit)
+
+    def __eq__(self, other):
+        return self._binary(other, lambda a, b: a == b)
+
+    def __ne__(self, other):
+        return self._binary(other, lambda a, b: a != b)
+
+    def __lt__(self, other):
+        return self._binary(other, lambda a, b: a < b)
+
+    def __gt__(self, other):
+        return self._binary(other, lambda a, b: a > b)
+
+    def __le__(self, other):
+        return self._binary(other, lambda a, b: a <= b)
+
+    def __ge__(self, other):
+        return self._binary(other, lambda a, b: a >= b)
+
+    # reductions: like pyUnitTypes.reductions, sums are calculated on the base values
+
+    def _check_reduction(self, name):
+        if name in _UNSUPPORTED_REDUCTIONS:
+            raise TypeError("'{0}' of {1} values is not supported, the result would be of another unit type.".format(
+                name, self.unit.__name__))
+        if name not in _UNIT_REDUCTIONS and name not in _PLAIN_REDUCTIONS:
+            raise TypeError("'{0}' is not supported for {1}".format(name, self._dtype.name))
+
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        self._check_reduction(name)
+
+        values = self._data
+        if name in ('any', 'all'):
+            values = values[~np.isnan(values)] if skipna else values
+            return bool(getattr(np, name)(values != 0))
+        if name not in ('sum', 'mean', 'median', 'min', 'max', 'std', 'sem'):
+            raise TypeError("'{0}' is not supported for {1}".format(name, self._dtype.name))
+
+        if skipna:
+            values = values[~np.isnan(values)]
+        count = len(values)
+        if name == 'sum':
+            _, to_base, from_base = _unit_info(self.unit)
+            if count < kwargs.get('min_count', 0):
+                result = np.nan
+            else:
+                result = from_base.convert(np.sum(_affine(values, to_base.factor, to_base.offset)))
+        elif not count:
+            result = np.nan
+        elif name in ('std', 'sem'):
+            ddof = kwargs.get('ddof', 1)
+            result = np.std(values, ddof=ddof) if count > ddof else np.nan
+            if name == 'sem' and count > ddof:
+                result /= np.sqrt(count)
+        else:
+            result = getattr(np, name)(values)
+
+        if keepdims:
+            return self._wrap(np.array([result], dtype=np.float64), self.unit)
+        return self._dtype.na_value if np.isnan(result) else self.unit(float(result))
+
+    def _accumulate(self, name, *, skipna=True, **kwargs):
+        if name not in ('cumsum', 'cummin', 'cummax'):
+            self._check_reduction(name)
+            raise TypeError("'{0}' is not supported for {1}".format(name, self._dtype.name))
+
+        values = self._data
+        if name == 'cumsum':
+            _, to_base, from_base = _unit_info(self.unit)
+            values = _affine(values, to_base.factor, to_base.offset)
+        mask = np.isnan(values)
+        if skipna and mask.any():
+            neutral = {'cumsum': 0.0, 'cummin': np.inf, 'cummax': -np.inf}[name]
+            values = np.where(mask, neutral, values)
+        result = {'cumsum': np.cumsum, 'cummin': np.minimum.accumulate, 'cummax': np.maximum.accumulate}[name](values)
+        if name == 'cumsum':
+            result = _affine(result, from_base.factor, from_base.offset, out=result)
+        if skipna:
+            result[mask] = np.nan
+        return self._wrap(result, self.unit)
+
+    def _quantile(self, qs, interpolation):
+        values = self._data[~np.isnan(self._data)]
+        if not len(values):
+            return self._wrap(np.full(len(qs), np.nan), self.unit)
+        return self._wrap(np.quantile(values, qs, method=interpolation), self.unit)
+
+    def _groupby_op(self, *, how, has_dropped_na, min_count, ngroups, ids, **kwargs):
+        """Runs the groupby aggregations and transformations of the nullable Float64 columns on the float64 buffer, NaN
+        being the missing values, and returns the results as float64 columns do."""
+
+        self._check_reduction(how)
+
+        values = self._data
+        if how in ('sum', 'cumsum'):
+            _, to_base, from_base = _unit_info(self.unit)
+            values = _affine(values, to_base.factor, to_base.offset)
+
+        result = pd.arrays.FloatingArray(values, np.isnan(values))._groupby_op(
+            how=how, has_dropped_na=has_dropped_na, min_count=min_count, ngroups=ngroups, ids=ids, **kwargs)
+        if isinstance(result, ExtensionArray):
+            if result.dtype.kind == 'f':
+                result = result.to_numpy(dtype=np.float64, na_value=np.nan)
+            elif not result.isna().any():
+                result = result.to_numpy(dtype=result.dtype.numpy_dtype)
+
+        if how in _PLAIN_REDUCTIONS:
+            return result
+        if how in ('sum', 'cumsum'):
+            result = _affine(result, from_base.factor, from_base.offset, out=result)
+        return self._wrap(result, self.unit)
+
+
+@register_series_accessor('units')
+class UnitAccessor:
+    """
+    The units accessor converts UnitDtype columns of a Series, e.g. ``series.units.to(Feet)``.
+    """
+
+    def __init__(self, series):
+        if not isinstance(series.dtype, UnitDtype):
+            raise AttributeError('The units accessor is only available for UnitDtype columns.')
+        self._series = series
+
+    def to(self, unit):
+        """Returns the Series converted into another unit of the same unit type.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        """
+
+        return self._series.astype(UnitDtype(unit))
+
+    @property
+    def unit(self):
+        return self._series.dtype.unit
+
+    @property
+    def values(self):
+        """The values as float64 numpy array in the unit of the Series."""
+
+        return self._series.array._data
@@ -0,0 +1,53 @@
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+
+
+class Flow(BaseUnit):
+    """
+    The Flow class is the superclass of all volumetric flow based unit classes. It provides the
+    magic method to calculate with the different flow based units.
+    """
+
+    dimension = Dimension(length=3, time=-1)
+
+
+class CubicMeterPerSecond(Flow):
+    """The SI unit of volumetric flows. Rivers."""
+
+    name = 'CubicMeterPerSecond'
+    symbol = 'm³/s'
+    to_base = Conversion()
+
+
+class CubicMeterPerHour(Flow):
+    """Pumps and ventilation."""
+
+    name = 'CubicMeterPerHour'
+    symbol = 'm³/h'
+    to_base = Conversion(1 / 3600)
+
+
+class LiterPerSecond(Flow):
+    """Water supply."""
+
+    name = 'LiterPerSecond'
+    symbol = 'l/s'
+    to_base = Conversion(1e-3)
+
+
+class LiterPerMinute(Flow):
+    """Shower heads and taps."""
+
+    name = 'LiterPerMinute'
+    symbol = 'l/min'
+    to_base = Conversion(1e-3 / 60)
+
+
+class GallonPerMinute(Flow):
+    """Pumps in the US."""
+
+    name = 'GallonPerMinute'
+    symbol = 'gpm'
+    to_base = Conversion(3.785411784e-3 / 60)
+
+
+__all__ = ['Flow', 'CubicMeterPerSecond', 'CubicMeterPerHour', 'LiterPerSecond', 'LiterPerMinute', 'GallonPerMinute']
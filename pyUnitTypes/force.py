@@ -0,0 +1,53 @@
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+
+
+class Force(BaseUnit):
+    """
+    The Force class is the superclass of all force based unit classes. It provides the magic method to calculate
+    with the different force based units.
+    """
+
+    dimension = Dimension(length=1, mass=1, time=-2)
+
+
+class Newton(Force):
+    """The SI unit of forces: kg * m / s²."""
+
+    name = 'Newton'
+    symbol = 'N'
+    to_base = Conversion()
+
+
+class KiloNewton(Force):
+    """Thrust of engines."""
+
+    name = 'KiloNewton'
+    symbol = 'kN'
+    to_base = Conversion(1e3)
+
+
+class Dyne(Force):
+    """The CGS unit of forces."""
+
+    name = 'Dyne'
+    symbol = 'dyn'
+    to_base = Conversion(1e-5)
+
+
+class KiloGramForce(Force):
+    """The weight of one kilogram on earth."""
+
+    name = 'KiloGramForce'
+    symbol = 'kgf'
+    to_base = Conversion(9.80665)
+
+
+class PoundForce(Force):
+    """The weight of one pound on earth."""
+
+    name = 'PoundForce'
+    symbol = 'lbf'
+    to_base = Conversion(4.4482216152605)
+
+
+__all__ = ['Force', 'Newton', 'KiloNewton', 'Dyne', 'KiloGramForce', 'PoundForce']
@@ -0,0 +1,250 @@
+import math
+import threading
+
+from pyUnitTypes.basics import BaseUnit, _NUMBER, _OPERAND_KINDS, _operand_kind
+
+# values every frozen unit class interns from the start
+INTERNED_VALUES = (0.0, 1.0)
+
+# unit class -> frozen unit class
+_FROZEN_CLASSES = {}
+_FROZEN_CLASSES_LOCK = threading.Lock()
+
+
+def _kind(other):
+    """Returns the operand kind of the other operand, see pyUnitTypes.basics._OPERAND_KINDS."""
+
+    try:
+        return _OPERAND_KINDS[other.__class__]
+    except KeyError:
+        return _operand_kind(other.__class__)
+
+
+def _freeze_result(result):
+    """Returns results of the BaseUnit operators which are unit objects as frozen objects."""
+
+    if isinstance(result, BaseUnit) and not isinstance(result, FrozenUnit):
+        return frozen(type(result))(result._value)
+    return result
+
+
+def _frozen_unit(unit, value):
+    """Recreates a frozen unit object from its unit class and value. Used to pickle the frozen unit objects."""
+
+    return frozen(unit)(value)
+
+
+class FrozenUnit:
+    """
+    Mixin of the immutable versions of the unit classes, see frozen(). Frozen unit objects never change their value:
+    all operators return new objects, so they can be shared between threads and caches without copying them. They are
+    hashable consistent to the equality of units: units of the same unit type with the same base value have the same
+    hash, e.g. frozen(Meter)(1) and frozen(CentiMeter)(100). Note that comparisons with plain numbers use the value of
+    the unit, so units and numbers should not be mixed as keys of the same dict.
+
+    Frequently used values are interned: creating a frozen unit object of an interned value returns the shared object.
+    -0.0 is never interned, so it keeps its sign.
+    """
+
+    __slots__ = ()
+
+    # the mutable unit class and the interned objects: value -> object, set per frozen class by frozen()
+    _unfrozen = None
+    _interned = None
+
+    def __new__(cls, value=float()):
+        if value.__class__ is float or value.__class__ is int:
+            obj = cls._interned.get(value)
+            # -0.0 equals the interned 0.0, but keeps its own sign like the mutable units
+            if obj is not None and (value or math.copysign(1.0, value) > 0):
+                return obj
+            value = float(value)
+        elif isinstance(value, (float, int)):
+            value = float(value)
+        elif isinstance(value, cls._type):
+            value = cls.from_base(value._base_value or value.base_value)
+        else:
+            raise TypeError('Can not create object of type {0} from object of type {1}'.format(cls.__name__,
+                                                                                               type(value).__name__))
+
+        obj = object.__new__(cls)
+        object.__setattr__(obj, '_value', value)
+        object.__setattr__(obj, '_base_value', cls.to_base(value))
+        return obj
+
+    def __init__(self, value=float()):
+        # everything is done by __new__, interned objects must not be initialized again
+        pass
+
+    @classmethod
+    def intern(cls, *values):
+        """Interns the given values of this unit, so creating objects of these values returns shared objects.
+
+        :param values: (mandatory, float or int) the values to intern, e.g. common setpoints
+        :returns list: the interned objects
+        """
+
+        objects = []
+        with _FROZEN_CLASSES_LOCK:
+            for value in values:
+                value = float(value)
+                obj = cls._interned.get(value)
+                if not (value or math.copysign(1.0, value) > 0):
+                    obj = FrozenUnit.__new__(cls, value)
+                elif obj is None:
+                    obj = FrozenUnit.__new__(cls, value)
+                    # copy on write, readers never see a dict which is changed
+                    cls._interned = {**cls._interned, value: obj}
+                objects.append(obj)
+        return objects
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{0} objects are immutable.'.format(type(self).__name__))
+
+    def __delattr__(self, key):
+        raise AttributeError('{0} objects are immutable.'.format(type(self).__name__))
+
+    def __hash__(self):
+        return hash((self._dimension_id, self._base_value))
+
+    def __reduce__(self):
+        return _frozen_unit, (self._unfrozen, self._value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memodict={}):
+        return self
+
+    def __neg__(self):
+        """Implements behavior for negation (e.g. -some_object)"""
+
+        return type(self)(-self._value)
+
+    def __abs__(self):
+        """Implements behavior for the built in abs() function."""
+
+        return type(self)(abs(self._value))
+
+    def __round__(self, n=None):
+        """Implements behavior for the built in round() function. n is the number of decimal places to round to."""
+
+        return type(self)(round(self._value) if n is None else round(self._value, ndigits=n))
+
+    def __floor__(self):
+        """Implements behavior for math.floor(), i.e., rounding down to the nearest integer."""
+
+        return type(self)(math.floor(self._value))
+
+    def __ceil__(self):
+        """Implements behavior for math.ceil(), i.e., rounding up to the nearest integer."""
+
+        return type(self)(math.ceil(self._value))
+
+    def __add__(self, other):
+        """Implements addition."""
+
+        if _kind(other) == _NUMBER:
+            return type(self)(self._value + other)
+        return BaseUnit.__add__(self, other)
+
+    def __sub__(self, other):
+        """Implements subtraction."""
+
+        if _kind(other) == _NUMBER:
+            return type(self)(self._value - other)
+        return BaseUnit.__sub__(self, other)
+
+    def __rsub__(self, other):
+        """Implements reflected subtraction."""
+
+        if _kind(other) == _NUMBER:
+            return type(self)(other - self._value)
+        return BaseUnit.__rsub__(self, other)
+
+    def __mul__(self, other):
+        """Implements multiplication."""
+
+        if _kind(other) == _NUMBER:
+            return type(self)(self._value * other)
+        return _freeze_result(BaseUnit.__mul__(self, other))
+
+    def __div__(self, other):
+        """Implements division using the / operator."""
+
+        if _kind(other) == _NUMBER:
+            return type(self)(self._value / other)
+        return _freeze_result(BaseUnit.__div__(self, other))
+
+    def __rdiv__(self, other):
+        """Implements reflected division using the / operator."""
+
+        return _freeze_result(BaseUnit.__rdiv__(self, other))
+
+    def __iadd__(self, other):
+        """Implements addition with assignment, which returns a new object."""
+
+        return self + other
+
+    def __isub__(self, other):
+        """Implements subtraction with assignment, which returns a new object."""
+
+        return self - other
+
+    def __imul__(self, other):
+        """Implements multiplication with assignment, which returns a new object."""
+
+        return self * other
+
+    def __idiv__(self, other):
+        """Implements division with assignment, which returns a new object."""
+
+        return self.__div__(other)
+
+    @property
+    def value(self):
+        return self._value
+
+
+def frozen(unit):
+    """Returns the immutable and hashable version of a unit class, see FrozenUnit. The class is created once per unit
+    class and is a subclass of the unit class, e.g. isinstance(frozen(Meter)(1), Meter) is True.
+
+    :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class, e.g. Meter
+    :returns type: the frozen unit class, e.g. FrozenMeter
+    """
+
+    try:
+        return _FROZEN_CLASSES[unit]
+    except KeyError:
+        pass
+
+    if not (isinstance(unit, type) and issubclass(unit, BaseUnit) and unit.to_base is not None):
+        raise TypeError('Can not freeze {0!r}, it is not a unit class.'.format(unit))
+    if issubclass(unit, FrozenUnit):
+        return unit
+
+    with _FROZEN_CLASSES_LOCK:
+        if unit not in _FROZEN_CLASSES:
+            # to_base is not part of the namespace, so the frozen class is not registered as unit of its unit type
+            FrozenClass = type(unit)('Frozen' + unit.__name__, (FrozenUnit, unit), {
+                '__module__': unit.__module__,
+                '_unfrozen': unit,
+                '_interned': {},
+            })
+            FrozenClass._interned = {value: FrozenUnit.__new__(FrozenClass, value) for value in INTERNED_VALUES}
+            _FROZEN_CLASSES[unit] = FrozenClass
+
+    return _FROZEN_CLASSES[unit]
+
+
+def freeze(quantity):
+    """Returns the immutable version of a unit object.
+
+    :param quantity: (mandatory, pyUnitTypes.basics.BaseUnit) the unit object, e.g. Meter(1)
+    :returns pyUnitTypes.immutable.FrozenUnit: the frozen unit object with the same value
+    """
+
+    if isinstance(quantity, FrozenUnit):
+        return quantity
+    return frozen(type(quantity))(quantity._value)
@@ -0,0 +1,93 @@
+import csv
+import json
+from itertools import islice
+
+from pyUnitTypes.basics import conversion
+from pyUnitTypes.parser import parse_unit
+
+# number of rows converted at once
+CHUNK_SIZE = 4096
+
+# supported formats of file objects
+FORMATS = ('csv', 'ndjson')
+
+
+def _unit(unit):
+    """Returns the unit class of a unit class, name or symbol."""
+
+    return parse_unit(unit) if isinstance(unit, str) else unit
+
+
+def _read_rows(source, format):
+    """Returns an iterator over the rows of a file object."""
+
+    if format == 'csv':
+        return csv.DictReader(source)
+    elif format == 'ndjson':
+        return (json.loads(line) for line in source if line.strip())
+    raise ValueError('Unknown format {0}, use one of {1}'.format(format, ', '.join(FORMATS)))
+
+
+def convert_stream(source, columns, chunk_size=CHUNK_SIZE, format='csv'):
+    """Converts columns of a stream of rows from one unit into another. The rows are converted chunk by chunk, so the
+    memory needed does not depend on the length of the stream. No unit objects are created, every column is converted
+    with the composed conversion of its unit pair.
+
+    :param source: (mandatory, iterable or file object) iterable of rows (dicts or sequences) or a file object with
+    rows in the given format
+    :param columns: (mandatory, dict) column name or index -> (source unit, target unit). The units can be unit classes
+    or their names or symbols, e.g. {'temp': ('°F', Celsius)}
+    :param chunk_size: (optional, int) number of rows converted at once. Default: CHUNK_SIZE
+    :param format: (optional, string) format of file objects: 'csv' (with header) or 'ndjson'. Default: 'csv'
+    :returns generator: the converted rows. Dict rows stay dicts and sequences become lists. Empty cells are kept.
+    """
+
+    if chunk_size < 1:
+        raise ValueError('The chunk size needs to be positive.')
+
+    # compose the conversions once for the whole stream
+    conversions = [(column, conversion(_unit(src), _unit(dst))) for column, (src, dst) in columns.items()]
+
+    rows = iter(_read_rows(source, format) if hasattr(source, 'read') else source)
+    while True:
+        chunk = [dict(row) if isinstance(row, dict) else list(row) for row in islice(rows, chunk_size)]
+        if not chunk:
+            return
+
+        for column, composed in conversions:
+            factor, offset = composed.factor, composed.offset
+            for row in chunk:
+                value = row[column]
+                if value is not None and value != '':
+                    row[column] = factor * float(value) + offset
+
+        yield from chunk
+
+
+def convert_file(source, target, columns, chunk_size=CHUNK_SIZE, format='csv'):
+    """Converts columns of a csv or ndjson file object and writes the rows in the same format into another file object.
+
+    :param source: (mandatory, file object) the file to read, see convert_stream
+    :param target: (mandatory, file object) the file to write the converted rows to
+    :param columns: (mandatory, dict) column name -> (source unit, target unit), see convert_stream
+    :param chunk_size: (optional, int) number of rows converted at once. Default: CHUNK_SIZE
+    :param format: (optional, string) 'csv' (with header) or 'ndjson'. Default: 'csv'
+    :returns int: the number of rows written
+    """
+
+    rows = convert_stream(source, columns, chunk_size=chunk_size, format=format)
+
+    count = 0
+    if format == 'csv':
+        writer = None
+        for count, row in enumerate(rows, 1):
+            if writer is None:
+                writer = csv.DictWriter(target, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+    else:
+        for count, row in enumerate(rows, 1):
+            target.write(json.dumps(row))
+            target.write('\n')
+
+    return count
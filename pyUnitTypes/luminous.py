@@ -1,5 +1,5 @@
-from pyUnitTypes.basics import BaseUnit, Conversion, SI_PREFIXES
-from pyUnitTypes.auxiliary import class_factory
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+from pyUnitTypes.auxiliary import si_prefixed_units, lazy_units
 
 
 class Luminous(BaseUnit):
@@ -8,29 +8,7 @@ class Luminous(BaseUnit):
     with the different length based units.
     """
 
-    def __init__(self, name, symbol, to_base, value, from_base=None):
-        """Constructor of the Luminous Superclass. Please don't use this class as standalone.
-
-        :param name: (mandatory, string) name of the unit as word
-        :param symbol: (mandatory, string) symbol of the unit
-        :param to_base: (mandatory, pyUnitTypes.basics.Conversion) conversion object to convert the value to the base
-        value
-        :param value: (mandatory, float, int or subclass of pyUnitTypes subclass) The actual value of the class.
-        :param from_base: (optional, pyUnitTypes.basics.Conversion) conversion object to convert the value back from
-        the base to the value of the actual class. Default: inversion of to_base
-        """
-
-        super().__init__(name=name, symbol=symbol, unit_type=Luminous, base_class=Candela, to_base=to_base,
-                         from_base=from_base)
-
-        # store the value and calculate the value in the base class
-        if isinstance(value, (float, int)):
-            self.value = value
-        elif issubclass(type(value), Luminous):
-            self.value = self.from_base(value.base_value)
-        else:
-            raise TypeError('Can not create object of type {0} from object of type {1}'.format(type(self).__name__,
-                                                                                               type(value).__name__))
+    dimension = Dimension(luminous=1)
 
 
 class Candela(Luminous):
@@ -38,22 +16,15 @@ class Candela(Luminous):
     of a source that emits monochromatic radiation of frequency 540 × 1012 hertz 
     and that has a radiant intensity in that direction of 1/683 watts per steridian."""
 
-    def __init__(self, value=float()):
-        """Create instance of the Candela class.
-
-        :param value: (optional, int or float) the amount of Candela
-        """
+    name = 'Candela'
+    symbol = 'cd'
+    to_base = Conversion()
 
-        super().__init__(name='Candela', symbol='cd', to_base=Conversion(), value=value)
 
+# the SI derives of luminous intensities
+_SI_UNITS = si_prefixed_units(name='Candela', symbol='cd')
 
-# define all SI derives of lengths
-for name, symbol, base10 in SI_PREFIXES:
-    class_name = '{}Candela'.format(name)
+# the SI derives are only created when they are accessed for the first time
+__getattr__ = lazy_units(globals(), Luminous, _SI_UNITS)
 
-    # generate the new class
-    generatedClass = class_factory(BaseClass=Luminous, name=class_name, symbol=symbol, to_base=Conversion(base10))
-    # register the class to the module
-    globals()[generatedClass.__name__] = generatedClass
-    # get rid of the temporary stuff
-    del generatedClass
+__all__ = ['Luminous', 'Candela'] + list(_SI_UNITS)
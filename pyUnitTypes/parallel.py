@@ -0,0 +1,157 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyUnitTypes.arrays import _affine
+from pyUnitTypes.basics import conversion
+
+# number of values converted by one task of a worker
+CHUNK_SIZE = 1 << 20
+
+# size of the float64 values in bytes
+_ITEM_SIZE = 8
+
+
+def _convert_chunk(name, start, stop, factor, offset):
+    """Converts the values start:stop of a shared memory block of float64 values in place. Runs in the workers."""
+
+    # the workers share the resource tracker of the pool's process, so the block is still unlinked once by its creator
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        if np is not None:
+            values = np.ndarray((stop - start,), dtype=np.float64, buffer=block.buf, offset=start * _ITEM_SIZE)
+            _affine(values, factor, offset, out=values)
+            del values
+        else:  # pragma: no cover
+            values = block.buf[start * _ITEM_SIZE:stop * _ITEM_SIZE].cast('d')
+            for index, value in enumerate(values):
+                values[index] = factor * value + offset
+            values.release()
+    finally:
+        block.close()
+    return stop - start
+
+
+def _chunks(length, chunk_size):
+    """Yields the (start, stop) ranges of the chunks of a buffer."""
+
+    for start in range(0, length, chunk_size):
+        yield start, min(start + chunk_size, length)
+
+
+class ParallelConverter:
+    """
+    The ParallelConverter converts large float64 buffers with a pool of worker processes. The values live in a
+    multiprocessing.shared_memory block, every worker converts its chunks of the block in place with the composed
+    conversion of the unit pair, so no values are pickled. The pool is kept for all conversions until shutdown() is
+    called or the with block ends.
+    """
+
+    def __init__(self, workers=None, chunk_size=CHUNK_SIZE):
+        """Creates a new ParallelConverter.
+
+        :param workers: (optional, int) number of worker processes. Default: number of CPUs
+        :param chunk_size: (optional, int) number of values converted by one task. Default: CHUNK_SIZE
+        """
+
+        if chunk_size < 1:
+            raise ValueError('The chunk size needs to be positive.')
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._chunk_size = chunk_size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def shutdown(self):
+        """Stops the worker processes."""
+
+        self._executor.shutdown()
+
+    def convert_shared(self, block, src, dst, length=None):
+        """Converts float64 values in a shared memory block in place.
+
+        :param block: (mandatory, multiprocessing.shared_memory.SharedMemory) the block holding the values
+        :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit of the values
+        :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit to convert to
+        :param length: (optional, int) the number of values. Default: as many values as fit into the block
+        :returns int: the number of converted values
+        """
+
+        if length is None:
+            length = block.size // _ITEM_SIZE
+        if length * _ITEM_SIZE > block.size:
+            raise ValueError('The block holds less than {0} values.'.format(length))
+
+        composed = conversion(src, dst)
+        if composed.is_identity:
+            return length
+
+        futures = [self._executor.submit(_convert_chunk, block.name, start, stop, composed.factor, composed.offset)
+                   for start, stop in _chunks(length, self._chunk_size)]
+        return sum(future.result() for future in futures)
+
+    def convert(self, values, src, dst):
+        """Converts a buffer of values. The values are copied into a shared memory block, converted by the workers and
+        copied back in one block each.
+
+        :param values: (mandatory, buffer of float64 or iterable of floats) the values, e.g. array('d') or a numpy array
+        :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit of the values
+        :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit to convert to
+        :returns: the converted values, a numpy array for numpy arrays and array('d') for everything else
+        """
+
+        is_numpy = np is not None and isinstance(values, np.ndarray)
+        if is_numpy:
+            source = np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+        elif isinstance(values, array) and values.typecode == 'd':
+            source = values
+        else:
+            source = array('d', values)
+
+        length = len(source)
+        if length <= self._chunk_size:
+            # not worth the round trip through the workers
+            composed = conversion(src, dst)
+            if is_numpy:
+                return _affine(source, composed.factor, composed.offset).reshape(np.shape(values))
+            return array('d', (composed.factor * value + composed.offset for value in source))
+
+        block = shared_memory.SharedMemory(create=True, size=length * _ITEM_SIZE)
+        try:
+            with block.buf[:length * _ITEM_SIZE] as view:
+                view[:] = memoryview(source).cast('B')
+                self.convert_shared(block, src, dst, length)
+
+                if is_numpy:
+                    result = np.frombuffer(view, dtype=np.float64).copy().reshape(np.shape(values))
+                else:
+                    result = array('d')
+                    result.frombytes(view)
+        finally:
+            block.close()
+            block.unlink()
+        return result
+
+
+def convert_parallel(values, src, dst, workers=None, chunk_size=CHUNK_SIZE):
+    """Converts a large buffer of values with a temporary pool of worker processes, see ParallelConverter. Keep a
+    ParallelConverter for repeated conversions to start the workers only once.
+
+    :param values: (mandatory, buffer of float64 or iterable of floats) the values, e.g. array('d') or a numpy array
+    :param src: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit of the values
+    :param dst: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit to convert to
+    :param workers: (optional, int) number of worker processes. Default: number of CPUs
+    :param chunk_size: (optional, int) number of values converted by one task. Default: CHUNK_SIZE
+    :returns: the converted values, a numpy array for numpy arrays and array('d') for everything else
+    """
+
+    with ParallelConverter(workers=workers, chunk_size=chunk_size) as converter:
+        return converter.convert(values, src, dst)
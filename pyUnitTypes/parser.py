@@ -0,0 +1,131 @@
+import re
+import threading
+from functools import lru_cache
+from importlib import import_module
+
+from pyUnitTypes.basics import BaseUnit, UnknownUnitError
+
+# modules of the package defining units
+_UNIT_MODULES = ('acceleration', 'area', 'current', 'flow', 'force', 'length', 'luminous', 'mass', 'speed', 'substance',
+                 'temperature', 'time', 'volume', 'work')
+
+# a number followed by the unit, e.g. '12.5 KiloMeter', '-3e2°F' or '.5km'
+_QUANTITY = re.compile(r'^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(\S.*?)\s*$')
+
+# alternative spellings of symbols
+_ALIASES = {
+    'µ': 'μ',  # micro sign -> greek small letter mu, the symbol of the Micro prefix
+}
+
+# maximum number of unit strings kept in the cache of parse_unit
+CACHE_SIZE = 1024
+
+_index_lock = threading.Lock()
+_symbols = {}
+_names = {}
+_indexed_units = 0
+
+
+def _registered_units():
+    """Yields all unit classes which are registered to a unit type."""
+
+    # every direct subclass of the BaseUnit is a unit type
+    for unit_type in BaseUnit.__subclasses__():
+        yield from unit_type._units
+
+
+def _build_index():
+    """Creates the symbol and name index of all registered units. The units of the package, including all SI prefixed
+    units, are loaded first."""
+
+    global _indexed_units
+
+    for module_name in _UNIT_MODULES:
+        module = import_module('pyUnitTypes.' + module_name)
+        for name in getattr(module, '__all__', ()):
+            getattr(module, name)
+
+    symbols = {}
+    names = {}
+    units = list(_registered_units())
+    for unit in units:
+        symbols.setdefault(unit.symbol, unit)
+        names.setdefault(unit.__name__.lower(), unit)
+        names.setdefault(unit.name.lower(), unit)
+
+    with _index_lock:
+        _symbols.clear()
+        _symbols.update(symbols)
+        _names.clear()
+        _names.update(names)
+        _indexed_units = len(units)
+
+
+def _unregister(unit):
+    """Drops the index and the cache of parse_unit, see pyUnitTypes.basics.unregister_unit."""
+
+    global _indexed_units
+
+    with _index_lock:
+        _indexed_units = 0
+    parse_unit.cache_clear()
+
+
+def _lookup(text):
+    """Finds the unit class of a symbol or name. Symbols are case sensitive (mm vs. Mm), names are not."""
+
+    for key, replacement in _ALIASES.items():
+        text = text.replace(key, replacement)
+
+    try:
+        return _symbols[text]
+    except KeyError:
+        pass
+    try:
+        return _names[text.lower()]
+    except KeyError:
+        return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_unit(text):
+    """Returns the unit class of a unit name (e.g. 'KiloMeter', 'kilometer') or symbol (e.g. 'km', '°F'). The results
+    are kept in a bounded LRU cache, so parsing many strings with a few different units stays fast.
+
+    :param text: (mandatory, string) the name or symbol of the unit
+    :returns type: the unit class, subclass of pyUnitTypes.basics.BaseUnit
+    """
+
+    if not isinstance(text, str):
+        raise TypeError('Can not parse unit from object of type {0}'.format(type(text).__name__))
+
+    text = text.strip()
+    if not _indexed_units:
+        _build_index()
+
+    unit = _lookup(text)
+    if unit is None and _indexed_units != sum(1 for _ in _registered_units()):
+        # units have been defined since the index was built
+        _build_index()
+        unit = _lookup(text)
+    if unit is None:
+        raise UnknownUnitError('Unknown unit {0!r}'.format(text))
+
+    return unit
+
+
+def parse(text):
+    """Creates a unit object from a string like '12.5 KiloMeter', '12.5km' or '-40 °F'.
+
+    :param text: (mandatory, string) the value followed by the name or symbol of the unit
+    :returns pyUnitTypes.basics.BaseUnit: object of the unit class with the parsed value
+    """
+
+    if not isinstance(text, str):
+        raise TypeError('Can not parse quantity from object of type {0}'.format(type(text).__name__))
+
+    match = _QUANTITY.match(text)
+    if match is None:
+        raise ValueError('Can not parse quantity from {0!r}'.format(text))
+
+    return parse_unit(match.group(2))(float(match.group(1)))
@@ -0,0 +1,262 @@
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+from pyUnitTypes import basics
+from pyUnitTypes.basics import BaseUnit, UnknownUnitDivisionError, UnknownUnitError, UnknownUnitMultiplicationError
+
+# the operators of the unit objects which are counted
+OPERATORS = ('__add__', '__radd__', '__iadd__', '__sub__', '__rsub__', '__isub__', '__mul__', '__rmul__', '__imul__',
+             '__truediv__', '__rtruediv__', '__itruediv__', '__neg__', '__pos__', '__abs__', '__eq__', '__ne__',
+             '__lt__', '__le__', '__gt__', '__ge__')
+
+# the errors which are counted
+ERRORS = (TypeError, UnknownUnitError, UnknownUnitMultiplicationError, UnknownUnitDivisionError)
+
+# the ProfileStats which are currently collecting. The methods of the unit classes are only replaced by counting
+# wrappers while this list is not empty, so profiling costs nothing while it is disabled.
+_active = []
+_lock = threading.Lock()
+
+# (class, name, original attribute) of the replaced methods
+_patched = []
+
+# number of active ProfileStats measuring the time of the calls
+_timed = 0
+
+# the nesting depth of the operators and the last counted error per thread, replaced as a whole when profiling stops
+_state = threading.local()
+
+
+class ProfileStats:
+    """
+    The ProfileStats collects the counters of a profiled block, see profile(): the unit objects created per unit class,
+    the conversions per (source unit, target unit) pair, the operators per (unit class, operator) and the raised errors
+    per exception class. Optionally the duration of the constructions and operators is collected in histograms with
+    power of two buckets in nanoseconds. The counters are not synchronized, so they are approximate if units are used
+    in many threads at once.
+    """
+
+    def __init__(self, timing=False):
+        """Creates new empty ProfileStats.
+
+        :param timing: (optional, bool) measure the duration of the constructions and operators. Default: False
+        """
+
+        self.timing = timing
+        self.constructions = Counter()
+        self.conversions = Counter()
+        self.operations = Counter()
+        self.errors = Counter()
+        # 'construction' or operator name -> Counter of bucket (upper bound in ns) -> number of calls
+        self.timings = {}
+
+    def _observe(self, name, duration):
+        try:
+            histogram = self.timings[name]
+        except KeyError:
+            histogram = self.timings[name] = Counter()
+        histogram[1 << (duration - 1).bit_length() if duration > 0 else 0] += 1
+
+    def reset(self):
+        """Sets all counters back to zero."""
+
+        self.constructions.clear()
+        self.conversions.clear()
+        self.operations.clear()
+        self.errors.clear()
+        self.timings.clear()
+
+    def snapshot(self):
+        """Returns a copy of the counters as plain dicts with string keys which can be exported to a metrics system:
+
+        {'constructions': {'Meter': 3}, 'conversions': {'Mile->Meter': 1}, 'operations': {'Meter.__add__': 2},
+        'errors': {'TypeError': 1}, 'timings': {'construction': {256: 2, 512: 1}}}
+
+        :returns dict: the counters
+        """
+
+        return {
+            'constructions': dict(self.constructions),
+            'conversions': {'{0}->{1}'.format(*pair): count for pair, count in self.conversions.items()},
+            'operations': {'{0}.{1}'.format(*key): count for key, count in self.operations.items()},
+            'errors': dict(self.errors),
+            'timings': {name: dict(sorted(histogram.items())) for name, histogram in self.timings.items()},
+        }
+
+
+def _record_error(error):
+    # an error passes through the wrappers of all nested calls, count it only once
+    if getattr(_state, 'error', None) is error:
+        return
+    _state.error = error
+    name = type(error).__name__
+    for stats in _active:
+        stats.errors[name] += 1
+
+
+def _wrap_init(original):
+    def __init__(self, *args, **kwargs):
+        start = perf_counter_ns() if _timed else 0
+        try:
+            original(self, *args, **kwargs)
+        except ERRORS as error:
+            _record_error(error)
+            raise
+        duration = perf_counter_ns() - start if _timed else 0
+
+        unit = type(self).__name__
+        source = args[0] if args else kwargs.get('value')
+        pair = (type(source).__name__, unit) if isinstance(source, BaseUnit) else None
+        for stats in _active:
+            stats.constructions[unit] += 1
+            if pair is not None:
+                stats.conversions[pair] += 1
+            if stats.timing:
+                stats._observe('construction', duration)
+
+    __init__.__wrapped__ = original
+    return __init__
+
+
+def _wrap_operator(original, name):
+    def operator(self, *args):
+        # operators implemented by other operators, e.g. __radd__ by __add__, are counted once
+        depth = getattr(_state, 'depth', 0)
+        _state.depth = depth + 1
+        start = perf_counter_ns() if _timed else 0
+        try:
+            return original(self, *args)
+        except ERRORS as error:
+            _record_error(error)
+            raise
+        finally:
+            _state.depth = depth
+            if not depth:
+                duration = perf_counter_ns() - start if _timed else 0
+                key = (type(self).__name__, name)
+                for stats in _active:
+                    stats.operations[key] += 1
+                    if stats.timing:
+                        stats._observe(name, duration)
+
+    operator.__name__ = name
+    operator.__wrapped__ = original
+    return operator
+
+
+def _count_conversion(src, dst, error):
+    # the conversion hook of pyUnitTypes.basics: conversion() and the converter functions are the common entry point of
+    # QuantityArray, QuantityBuffer, the pandas columns, the streams and the plain number conversions
+    if error is not None:
+        _record_error(error)
+        return
+    pair = (src.__name__, dst.__name__)
+    for stats in _active:
+        stats.conversions[pair] += 1
+
+
+def _unit_classes():
+    """Returns the classes which implement the methods of the unit classes: all subclasses of BaseUnit and their
+    mixins, e.g. pyUnitTypes.immutable.FrozenUnit."""
+
+    classes = set()
+    pending = [BaseUnit]
+    while pending:
+        cls = pending.pop()
+        for base in cls.__mro__[:-1]:
+            classes.add(base)
+        pending.extend(cls.__subclasses__())
+
+    # the mixin is needed for the frozen classes created later on
+    immutable = sys.modules.get('pyUnitTypes.immutable')
+    if immutable is not None:
+        classes.add(immutable.FrozenUnit)
+    return classes
+
+
+def _patch(cls, name, wrapper):
+    original = cls.__dict__[name]
+    _patched.append((cls, name, original))
+    setattr(cls, name, wrapper)
+
+
+def _install():
+    for cls in _unit_classes():
+        if '__init__' in cls.__dict__:
+            _patch(cls, '__init__', _wrap_init(cls.__dict__['__init__']))
+        for name in OPERATORS:
+            if name in cls.__dict__:
+                _patch(cls, name, _wrap_operator(cls.__dict__[name], name))
+    basics._set_conversion_hook(_count_conversion)
+
+
+def _uninstall():
+    global _state
+    basics._set_conversion_hook(None)
+    while _patched:
+        cls, name, original = _patched.pop()
+        setattr(cls, name, original)
+    # resets the state of all threads, not only of the calling one
+    _state = threading.local()
+
+
+def enable_profiling(stats=None):
+    """Starts collecting the counters of the unit objects. Unit classes created while profiling is enabled are
+    profiled through the methods they inherit only.
+
+    :param stats: (optional, pyUnitTypes.profiling.ProfileStats) the stats to fill. Default: new ProfileStats
+    :returns pyUnitTypes.profiling.ProfileStats: the collecting stats
+    """
+
+    global _timed
+    if stats is None:
+        stats = ProfileStats()
+    with _lock:
+        if stats in _active:
+            raise ValueError('The stats are already collecting.')
+        if not _active:
+            _install()
+        _active.append(stats)
+        _timed += bool(stats.timing)
+    return stats
+
+
+def disable_profiling(stats):
+    """Stops collecting counters into the given stats. The methods of the unit classes are restored as soon as no stats
+    are collecting anymore.
+
+    :param stats: (mandatory, pyUnitTypes.profiling.ProfileStats) the stats returned by enable_profiling
+    """
+
+    global _timed
+    with _lock:
+        if stats not in _active:
+            return
+        _active.remove(stats)
+        _timed -= bool(stats.timing)
+        if not _active:
+            _uninstall()
+
+
+@contextmanager
+def profile(timing=False):
+    """Profiles the unit objects used in the with block:
+
+        with pyUnitTypes.profile() as stats:
+            handle(request)
+        export(stats.snapshot())
+
+    Without an active profile the unit classes run without any instrumentation.
+
+    :param timing: (optional, bool) also collect histograms of the durations. Default: False
+    :returns pyUnitTypes.profiling.ProfileStats: the counters of the block
+    """
+
+    stats = enable_profiling(ProfileStats(timing=timing))
+    try:
+        yield stats
+    finally:
+        disable_profiling(stats)
@@ -0,0 +1,134 @@
+import itertools
+import math
+
+from pyUnitTypes.basics import BaseUnit
+
+
+def _base_values(quantities, unit):
+    """Returns the unit of the result and an iterator over the base values of the quantities. The iterator checks that
+    all quantities are of the same unit type without creating any objects."""
+
+    iterator = iter(quantities)
+    first = next(iterator, None)
+    if first is None:
+        if unit is None:
+            raise ValueError('Can not reduce an empty iterable without a unit.')
+        return unit, iter(())
+    if not isinstance(first, BaseUnit):
+        raise TypeError('Can not reduce object of type {0}'.format(type(first).__name__))
+    if unit is None:
+        unit = type(first)
+
+    def base_values(dimension_id):
+        for quantity in itertools.chain((first,), iterator):
+            if getattr(quantity, '_dimension_id', None) != dimension_id:
+                raise TypeError('Can not reduce {0} with object of type {1}'.format(unit.name,
+                                                                                   type(quantity).__name__))
+            yield quantity._base_value or quantity.base_value
+
+    return unit, base_values(unit._dimension_id)
+
+
+def _result(unit, base_value):
+    """Returns the object of the unit with the given base value."""
+
+    return unit(unit.from_base(base_value))
+
+
+def _check_not_empty(count):
+    if not count:
+        raise ValueError('Can not aggregate an empty iterable.')
+
+
+def qsum(quantities, unit=None):
+    """Returns the sum of quantities of the same unit type in any mix of units, e.g. Mile, Yard and KiloMeter. Like
+    adding unit objects the values are summed up in the base unit, here with compensated summation (math.fsum). No unit
+    objects are created except the result and the quantities are not changed (unlike sum(), which changes the first
+    one).
+
+    :param quantities: (mandatory, iterable of pyUnitTypes.basics.BaseUnit) the quantities
+    :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the result. Default: unit of the first
+    quantity. Needed if the iterable can be empty.
+    :returns pyUnitTypes.basics.BaseUnit: the sum as object of the unit
+    """
+
+    unit, base_values = _base_values(quantities, unit)
+    return _result(unit, math.fsum(base_values))
+
+
+def qmean(quantities, unit=None):
+    """Returns the arithmetic mean of quantities of the same unit type in any mix of units, see qsum.
+
+    :param quantities: (mandatory, iterable of pyUnitTypes.basics.BaseUnit) the quantities
+    :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the result. Default: unit of the first
+    quantity
+    :returns pyUnitTypes.basics.BaseUnit: the mean as object of the unit
+    """
+
+    unit, base_values = _base_values(quantities, unit)
+
+    # zip only advances the counter for values which have been summed up
+    counter = itertools.count()
+    total = math.fsum(base_value for base_value, _ in zip(base_values, counter))
+    count = next(counter)
+    _check_not_empty(count)
+    return _result(unit, total / count)
+
+
+def qmin(quantities, unit=None):
+    """Returns the smallest of quantities of the same unit type in any mix of units.
+
+    :param quantities: (mandatory, iterable of pyUnitTypes.basics.BaseUnit) the quantities
+    :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the result. Default: unit of the first
+    quantity
+    :returns pyUnitTypes.basics.BaseUnit: the minimum as object of the unit
+    """
+
+    unit, base_values = _base_values(quantities, unit)
+    smallest = min(base_values, default=None)
+    _check_not_empty(smallest is not None)
+    return _result(unit, smallest)
+
+
+def qmax(quantities, unit=None):
+    """Returns the largest of quantities of the same unit type in any mix of units.
+
+    :param quantities: (mandatory, iterable of pyUnitTypes.basics.BaseUnit) the quantities
+    :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the result. Default: unit of the first
+    quantity
+    :returns pyUnitTypes.basics.BaseUnit: the maximum as object of the unit
+    """
+
+    unit, base_values = _base_values(quantities, unit)
+    largest = max(base_values, default=None)
+    _check_not_empty(largest is not None)
+    return _result(unit, largest)
+
+
+def qstd(quantities, unit=None, ddof=0):
+    """Returns the standard deviation of quantities of the same unit type in any mix of units. The values are
+    accumulated in one pass with Welford's algorithm. A standard deviation is a difference of values, so only the
+    factor of the unit is applied and not its offset, e.g. a deviation of 1 °C is a deviation of 1.8 °F.
+
+    :param quantities: (mandatory, iterable of pyUnitTypes.basics.BaseUnit) the quantities
+    :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the result. Default: unit of the first
+    quantity
+    :param ddof: (optional, int) delta degrees of freedom, the divisor is the number of values minus ddof. Default: 0
+    :returns pyUnitTypes.basics.BaseUnit: the standard deviation as object of the unit
+    """
+
+    unit, base_values = _base_values(quantities, unit)
+
+    count = 0
+    mean = 0.0
+    squares = 0.0
+    for base_value in base_values:
+        count += 1
+        delta = base_value - mean
+        mean += delta / count
+        squares += delta * (base_value - mean)
+
+    _check_not_empty(count)
+    if count <= ddof:
+        raise ValueError('Need more than {0} values to calculate the standard deviation.'.format(ddof))
+    return unit(math.sqrt(squares / (count - ddof)) * unit.from_base.factor)
@@ -0,0 +1,228 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyUnitTypes.basics import conversion
+from pyUnitTypes.arrays import QuantityArray, _affine, _unit_info
+
+# aggregation functions of the resampling: name -> numpy ufunc reducing the buckets
+_REDUCERS = {
+    'sum': 'add',
+    'mean': 'add',
+    'min': 'minimum',
+    'max': 'maximum',
+}
+
+
+class QuantitySeries:
+    """
+    The QuantitySeries stores a time series of values of the same unit in columns: one float64 column for the values,
+    one int64 column for the timestamps and one unit class for all values. The timestamps need to be sorted, their
+    resolution (seconds, milliseconds, ...) is up to the user.
+
+    Slices and windows are views sharing the columns with the series. They take the unit from the series they were
+    sliced from, so they follow its in place conversions.
+    """
+
+    def __init__(self, values, timestamps, unit):
+        """Creates a new QuantitySeries.
+
+        :param values: (mandatory, array like or QuantityArray) the values in the given unit. A QuantityArray of the
+        same unit type will be converted into the given unit.
+        :param timestamps: (mandatory, array like of int) the sorted timestamps of the values
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class of all values, e.g. Celsius
+        """
+
+        if np is None:  # pragma: no cover
+            raise ImportError('The QuantitySeries requires numpy to be installed.')
+
+        values = QuantityArray(values, unit).value
+        timestamps = np.array(timestamps, dtype=np.int64)
+        if values.ndim != 1 or values.shape != timestamps.shape:
+            raise ValueError('values and timestamps need to be one dimensional and of the same length.')
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            raise ValueError('The timestamps need to be sorted.')
+
+        self._values = values
+        self._timestamps = timestamps
+        self._own_unit = unit
+        self._parent = None
+        self._type = _unit_info(unit)[0]
+
+    @classmethod
+    def _from_columns(cls, values, timestamps, unit, parent=None):
+        """Wraps existing columns without copying or checking them. Views of a series are wrapped with the series
+        owning the columns as parent and use its unit."""
+
+        obj = cls.__new__(cls)
+        obj._values = values
+        obj._timestamps = timestamps
+        obj._own_unit = unit
+        obj._parent = parent
+        obj._type = _unit_info(unit)[0]
+        return obj
+
+    @property
+    def _unit(self):
+        if self._parent is None:
+            return self._own_unit
+        return self._parent._own_unit
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        unit = self._unit
+        for timestamp, value in zip(self._timestamps.tolist(), self._values.tolist()):
+            yield timestamp, unit(value)
+
+    def __getitem__(self, item):
+        """Returns a (timestamp, unit object) tuple for integer indices and a QuantitySeries for slices. The slices
+        share the columns with this series."""
+
+        if isinstance(item, slice):
+            if item.step is not None and item.step < 0:
+                raise ValueError('The timestamps of a QuantitySeries need to stay sorted.')
+            parent = self if self._parent is None else self._parent
+            return QuantitySeries._from_columns(self._values[item], self._timestamps[item], self._unit, parent)
+        return int(self._timestamps[item]), self._unit(float(self._values[item]))
+
+    def __repr__(self):  # pragma: no cover
+        return "QuantitySeries({0} values, {1})".format(len(self), self._unit.__name__)
+
+    def window(self, start=None, stop=None):
+        """Returns the part of the series with start <= timestamp < stop. The timestamps are found by binary search and
+        the returned series shares the columns with this series.
+
+        :param start: (optional, int) first timestamp of the window. Default: start of the series
+        :param stop: (optional, int) the end of the window, not included. Default: end of the series
+        """
+
+        first = 0 if start is None else int(np.searchsorted(self._timestamps, start, side='left'))
+        last = len(self) if stop is None else int(np.searchsorted(self._timestamps, stop, side='left'))
+        return self[first:max(first, last)]
+
+    def to(self, unit):
+        """Returns a new QuantitySeries with the values converted into the given unit. The timestamps are shared.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        """
+
+        composed = conversion(self._unit, unit)
+        return QuantitySeries._from_columns(_affine(self._values, composed.factor, composed.offset), self._timestamps,
+                                            unit)
+
+    def convert(self, unit):
+        """Converts the whole value column in place into the given unit. Slices and windows of the series see the
+        converted values in the new unit. They can't be converted in place themselves, as the other values of the
+        series would keep their unit.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the target unit
+        """
+
+        if self._parent is not None:
+            raise TypeError('Can not convert a view of a QuantitySeries in place, use to() for a converted copy.')
+        composed = conversion(self._unit, unit)
+        _affine(self._values, composed.factor, composed.offset, out=self._values)
+        self._own_unit = unit
+        return self
+
+    def sum(self):
+        """Returns the sum of all values as unit object. Like adding unit objects the values are summed up in the base
+        unit, so the result does not depend on the offset of the unit (e.g. Fahrenheit vs. Celsius). The sum of an
+        empty series is 0 in its unit."""
+
+        if not len(self):
+            return self._unit(0)
+        return self._unit(float(self._sum(np.add.reduce(self._values), len(self))))
+
+    def mean(self):
+        """Returns the mean of all values as unit object."""
+
+        self._check_not_empty()
+        return self._unit(float(np.mean(self._values)))
+
+    def min(self):
+        """Returns the smallest value as unit object."""
+
+        self._check_not_empty()
+        return self._unit(float(np.min(self._values)))
+
+    def max(self):
+        """Returns the largest value as unit object."""
+
+        self._check_not_empty()
+        return self._unit(float(np.max(self._values)))
+
+    def resample(self, interval, how='mean', origin=None):
+        """Aggregates the values into buckets of the given interval. Every bucket which contains at least one value
+        results in one value with the start of the bucket as timestamp.
+
+        :param interval: (mandatory, int) the length of the buckets in the resolution of the timestamps
+        :param how: (optional, string) the aggregation: 'mean', 'min', 'max' or 'sum'. Default: 'mean'
+        :param origin: (optional, int) the start of the first bucket. Default: first timestamp rounded down to the
+        interval
+        :returns pyUnitTypes.series.QuantitySeries: the resampled series
+        """
+
+        if how not in _REDUCERS:
+            raise ValueError('Unknown aggregation {0}, use one of {1}'.format(how, ', '.join(sorted(_REDUCERS))))
+        if interval <= 0:
+            raise ValueError('The interval needs to be positive.')
+        if not len(self):
+            return QuantitySeries._from_columns(self._values.copy(), self._timestamps.copy(), self._unit)
+
+        if origin is None:
+            origin = self._timestamps[0] - self._timestamps[0] % interval
+        buckets = (self._timestamps - origin) // interval
+
+        # the timestamps are sorted, so every bucket is a contiguous block of values
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+        counts = np.diff(np.append(starts, len(self)))
+        reduced = getattr(np, _REDUCERS[how]).reduceat(self._values, starts)
+
+        if how == 'mean':
+            reduced /= counts
+        elif how == 'sum':
+            reduced = self._sum(reduced, counts)
+
+        timestamps = (origin + buckets[starts] * interval).astype(np.int64)
+        return QuantitySeries._from_columns(reduced, timestamps, self._unit)
+
+    def _sum(self, sums, counts):
+        """Moves sums of values with an offset (e.g. Fahrenheit) into the base unit: sum(x) in the unit needs to be
+        sum(to_base(x)) in the base unit, which differs by (counts - 1) times the offset."""
+
+        to_base = self._unit.to_base
+        if to_base.offset == 0:
+            return sums
+        base_sums = to_base.factor * sums + counts * to_base.offset
+        return _affine(base_sums, self._unit.from_base.factor, self._unit.from_base.offset)
+
+    def _check_not_empty(self):
+        if not len(self):
+            raise ValueError('Can not aggregate an empty QuantitySeries.')
+
+    @property
+    def value(self):
+        return self._values
+
+    @property
+    def timestamps(self):
+        return self._timestamps
+
+    @property
+    def quantities(self):
+        """The values as QuantityArray sharing the buffer of the series. Like the slices of the series, it follows
+        the in place conversions of the series and can't be converted in place itself."""
+
+        return QuantityArray._from_buffer(self._values, self._unit, self if self._parent is None else self._parent)
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def type(self):
+        return self._type
@@ -0,0 +1,53 @@
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+
+
+class Speed(BaseUnit):
+    """
+    The Speed class is the superclass of all speed based unit classes. It provides the magic method to calculate
+    with the different speed based units.
+    """
+
+    dimension = Dimension(length=1, time=-1)
+
+
+class MeterPerSecond(Speed):
+    """The SI unit of speeds."""
+
+    name = 'MeterPerSecond'
+    symbol = 'm/s'
+    to_base = Conversion()
+
+
+class KiloMeterPerHour(Speed):
+    """Speed limits almost everywhere."""
+
+    name = 'KiloMeterPerHour'
+    symbol = 'km/h'
+    to_base = Conversion(1 / 3.6)
+
+
+class MilePerHour(Speed):
+    """Speed limits in the US and the UK."""
+
+    name = 'MilePerHour'
+    symbol = 'mph'
+    to_base = Conversion(0.44704)
+
+
+class FeetPerSecond(Speed):
+    """Speed of bullets in the US."""
+
+    name = 'FeetPerSecond'
+    symbol = 'ft/s'
+    to_base = Conversion(0.3048)
+
+
+class Knot(Speed):
+    """One nautical mile per hour. Ships and planes."""
+
+    name = 'Knot'
+    symbol = 'kn'
+    to_base = Conversion(1852 / 3600)
+
+
+__all__ = ['Speed', 'MeterPerSecond', 'KiloMeterPerHour', 'MilePerHour', 'FeetPerSecond', 'Knot']
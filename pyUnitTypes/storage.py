@@ -0,0 +1,340 @@
+import mmap
+import os
+import struct
+import sys
+import uuid
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyUnitTypes.basics import conversion
+from pyUnitTypes.wire import unit_id, unit_from_id
+
+# number of values converted at once when a file is scanned
+CHUNK_SIZE = 1 << 16
+
+# header of a quantity file: magic, version, dtype of the values, flags, unit id (see pyUnitTypes.wire) and number of
+# values. The header is padded to HEADER_SIZE bytes, the value column follows and after it, aligned to 8 bytes, the
+# optional int64 timestamp column. All numbers are little endian.
+MAGIC = b'PUTQ'
+VERSION = 1
+HEADER = struct.Struct('<4sBcBxHxxQ')
+HEADER_SIZE = 32
+
+# supported dtypes of the value column: array typecode -> item size
+DTYPES = {'d': 8, 'f': 4}
+
+# flags of the header
+_HAS_TIMESTAMPS = 1
+
+
+def _timestamps_offset(length, dtype):
+    """Returns the offset of the timestamp column, the end of the value column aligned to 8 bytes."""
+
+    timestamps_offset = HEADER_SIZE + length * DTYPES[dtype]
+    timestamps_offset += -timestamps_offset % 8
+    return timestamps_offset
+
+
+def _write_chunk(file, chunk):
+    """Writes an array little endian, see wire.encode_batch."""
+
+    if sys.byteorder != 'little':
+        chunk = array(chunk.typecode, chunk)
+        chunk.byteswap()
+    file.write(chunk.tobytes())
+
+
+def _read_column(buffer, typecode):
+    """Returns a little endian column of the file as memoryview of the given typecode: the mapped column itself on
+    little endian machines, a byteswapped copy of it on big endian machines."""
+
+    if sys.byteorder == 'little':
+        return buffer.cast(typecode)
+    column = array(typecode)
+    column.frombytes(buffer)
+    buffer.release()
+    column.byteswap()
+    return memoryview(column)
+
+
+def _write_column(file, values, typecode, chunk_size):
+    """Writes a column chunk by chunk and returns the number of values written."""
+
+    if isinstance(values, array) and values.typecode == typecode:
+        _write_chunk(file, values)
+        return len(values)
+    if np is not None and isinstance(values, np.ndarray):
+        column = np.ascontiguousarray(values, dtype=np.dtype(typecode)).reshape(-1)
+        if sys.byteorder != 'little':
+            column = column.byteswap()
+        file.write(memoryview(column).cast('B'))
+        return len(column)
+
+    count = 0
+    iterator = iter(values)
+    while True:
+        chunk = array(typecode)
+        for value in iterator:
+            chunk.append(value)
+            if len(chunk) == chunk_size:
+                break
+        if not chunk:
+            return count
+        _write_chunk(file, chunk)
+        count += len(chunk)
+
+
+def write_quantities(path, values, unit, timestamps=None, dtype='d', chunk_size=CHUNK_SIZE):
+    """Writes values of one unit and optionally their timestamps into a quantity file. The file is replaced only after
+    all values have been written, if writing fails an existing file is kept as it is.
+
+    :param path: (mandatory, string or path like) the file to write
+    :param values: (mandatory, iterable of float) the values, e.g. array('d'), a numpy array or a list
+    :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit of the values, needs a wire format id
+    :param timestamps: (optional, iterable of int) the timestamps of the values. Default: no timestamps
+    :param dtype: (optional, string) 'd' for float64 or 'f' for float32 values. Default: 'd'
+    :param chunk_size: (optional, int) number of values written at once for iterables. Default: CHUNK_SIZE
+    :returns int: the number of values written
+    """
+
+    if dtype not in DTYPES:
+        raise ValueError('Unknown dtype {0}, use one of {1}'.format(dtype, ', '.join(DTYPES)))
+    identifier = unit_id(unit)
+    flags = 0 if timestamps is None else _HAS_TIMESTAMPS
+
+    # the file is written next to the path and only replaces it when it is complete, so an error leaves an existing
+    # file untouched
+    path = os.fspath(path)
+    temporary = '{0}.{1}.tmp'.format(path, uuid.uuid4().hex[:8])
+    try:
+        with open(temporary, 'xb') as file:
+            file.write(bytes(HEADER_SIZE))
+            length = _write_column(file, values, dtype, chunk_size)
+
+            if timestamps is not None:
+                file.write(bytes(_timestamps_offset(length, dtype) - file.tell()))
+                if _write_column(file, timestamps, 'q', chunk_size) != length:
+                    raise ValueError('values and timestamps need to be of the same length.')
+
+            # the length is known after the values have been written
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, VERSION, dtype.encode(), flags, identifier, length))
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    return length
+
+
+class QuantityView:
+    """
+    The QuantityView is a unit tagged view on a column of values, e.g. of a memory mapped quantity file. It never copies
+    the column: slices are views as well and converting the view into another unit of the same unit type only stores
+    the composed conversion, which is applied chunk by chunk when the values are read.
+    """
+
+    def __init__(self, values, unit, source_unit=None):
+        """Creates a new QuantityView.
+
+        :param values: (mandatory, memoryview) the column of float64 or float32 values in the source unit
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit of the view
+        :param source_unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the column. Default: unit
+        """
+
+        self._values = values
+        self._unit = unit
+        self._source_unit = unit if source_unit is None else source_unit
+        composed = conversion(self._source_unit, unit)
+        self._factor = composed.factor
+        self._offset = composed.offset
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, item):
+        """Returns a unit object for integer indices and a QuantityView sharing the column for slices."""
+
+        if isinstance(item, slice):
+            return QuantityView(self._values[item], self._unit, self._source_unit)
+        return self._unit(self._factor * self._values[item] + self._offset)
+
+    def __iter__(self):
+        unit = self._unit
+        for chunk in self.chunks():
+            for value in chunk.tolist():
+                yield unit(value)
+
+    def __repr__(self):  # pragma: no cover
+        return "QuantityView({0} values, {1})".format(len(self), self._unit.__name__)
+
+    def to(self, unit):
+        """Returns a view of the same column in another unit of the same unit type. Nothing is converted until the
+        values are read.
+
+        :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit of the new view
+        """
+
+        return QuantityView(self._values, unit, self._source_unit)
+
+    def chunks(self, chunk_size=CHUNK_SIZE):
+        """Yields the values converted into the unit of the view, chunk by chunk, so scanning needs constant memory.
+
+        :param chunk_size: (optional, int) number of values per chunk. Default: CHUNK_SIZE
+        :returns generator: float64 numpy arrays if numpy is installed, otherwise array('d')
+        """
+
+        if chunk_size < 1:
+            raise ValueError('The chunk size needs to be positive.')
+
+        factor, offset = self._factor, self._offset
+        for start in range(0, len(self._values), chunk_size):
+            column = self._values[start:start + chunk_size]
+            if np is not None:
+                chunk = np.array(column, dtype=np.float64)
+                if factor != 1:
+                    chunk *= factor
+                if offset != 0:
+                    chunk += offset
+            elif factor == 1 and offset == 0 and column.format == 'd':  # pragma: no cover
+                chunk = array('d', column)
+            else:  # pragma: no cover
+                chunk = array('d', (factor * value + offset for value in column))
+            # don't keep the file mapped by the slice while the chunk is used
+            column.release()
+            yield chunk
+
+    @property
+    def values(self):
+        """The column in the unit of the file as zero copy memoryview."""
+
+        return self._values
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def type(self):
+        return self._unit._type
+
+
+class QuantityFile:
+    """
+    The QuantityFile memory maps a quantity file (see write_quantities) read only. The values and timestamps are
+    exposed as zero copy views on the mapped file, so files larger than the memory can be opened and scanned. On big
+    endian machines the columns are read into byteswapped copies instead.
+    """
+
+    def __init__(self, path):
+        """Opens a quantity file.
+
+        :param path: (mandatory, string or path like) the file written by write_quantities
+        """
+
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._open()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _open(self):
+        buffer = memoryview(self._mmap)
+        if len(buffer) < HEADER_SIZE:
+            buffer.release()
+            raise ValueError('The file is no quantity file.')
+
+        magic, version, dtype, flags, identifier, length = HEADER.unpack_from(buffer)
+        dtype = dtype.decode('ascii', 'replace')
+        if magic != MAGIC or version != VERSION or dtype not in DTYPES:
+            buffer.release()
+            raise ValueError('The file is no quantity file of version {0}.'.format(VERSION))
+
+        values_end = HEADER_SIZE + length * DTYPES[dtype]
+        timestamps_offset = _timestamps_offset(length, dtype)
+        size = timestamps_offset + 8 * length if flags & _HAS_TIMESTAMPS else values_end
+        if len(buffer) < size:
+            buffer.release()
+            raise ValueError('The quantity file is truncated: {0} values expected.'.format(length))
+
+        self._buffer = buffer
+        self._unit = unit_from_id(identifier)
+        self._dtype = dtype
+        self._values = _read_column(buffer[HEADER_SIZE:values_end], dtype)
+        if flags & _HAS_TIMESTAMPS:
+            self._timestamps = _read_column(buffer[timestamps_offset:timestamps_offset + 8 * length], 'q')
+        else:
+            self._timestamps = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._values)
+
+    def close(self):
+        """Closes the file. Views of the file which are still used need to be released first."""
+
+        if self._mmap.closed:
+            return
+        for view in (self._values, self._timestamps, self._buffer):
+            if view is not None:
+                view.release()
+        self._mmap.close()
+
+    def window(self, start=None, stop=None):
+        """Returns the values with start <= timestamp < stop as QuantityView. The timestamps are found by binary search
+        and need to be sorted.
+
+        :param start: (optional, int) first timestamp of the window. Default: start of the file
+        :param stop: (optional, int) the end of the window, not included. Default: end of the file
+        """
+
+        if self._timestamps is None:
+            raise ValueError('The quantity file has no timestamps.')
+
+        first = 0 if start is None else bisect_left(self._timestamps, start)
+        last = len(self) if stop is None else bisect_left(self._timestamps, stop)
+        return self.values[first:max(first, last)]
+
+    @property
+    def values(self):
+        """The values as QuantityView in the unit of the file."""
+
+        return QuantityView(self._values, self._unit)
+
+    @property
+    def timestamps(self):
+        """The timestamps as zero copy memoryview of int64 or None if the file has no timestamps."""
+
+        return self._timestamps
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+
+def open_quantities(path):
+    """Memory maps a quantity file, see QuantityFile.
+
+    :param path: (mandatory, string or path like) the file written by write_quantities
+    :returns pyUnitTypes.storage.QuantityFile: the opened file
+    """
+
+    return QuantityFile(path)
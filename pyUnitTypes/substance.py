@@ -1,5 +1,5 @@
-from pyUnitTypes.basics import BaseUnit, Conversion, SI_PREFIXES
-from pyUnitTypes.auxiliary import class_factory
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+from pyUnitTypes.auxiliary import si_prefixed_units, lazy_units
 
 
 class Substance(BaseUnit):
@@ -8,29 +8,7 @@ class Substance(BaseUnit):
     with the different length based units.
     """
 
-    def __init__(self, name, symbol, to_base, value, from_base=None):
-        """Constructor of the Substance Superclass. Please don't use this class as standalone.
-
-        :param name: (mandatory, string) name of the unit as word
-        :param symbol: (mandatory, string) symbol of the unit
-        :param to_base: (mandatory, pyUnitTypes.basics.Conversion) conversion object to convert the value to the base
-        value
-        :param value: (mandatory, float, int or subclass of pyUnitTypes.length.Length) The actual value of the class.
-        :param from_base: (optional, pyUnitTypes.basics.Conversion) conversion object to convert the value back from
-        the base to the value of the actual class. Default: inversion of to_base
-        """
-
-        super().__init__(name=name, symbol=symbol, unit_type=Substance, base_class=Mole, to_base=to_base,
-                         from_base=from_base)
-
-        # store the value and calculate the value in the base class
-        if isinstance(value, (float, int)):
-            self.value = value
-        elif issubclass(type(value), Substance):
-            self.value = self.from_base(value.base_value)
-        else:
-            raise TypeError('Can not create object of type {0} from object of type {1}'.format(type(self).__name__,
-                                                                                               type(value).__name__))
+    dimension = Dimension(substance=1)
 
 
 class Mole(Substance):
@@ -39,22 +17,15 @@ class Mole(Substance):
     (elementary entities, which must be specified, may be atoms, molecules, ions, 
     electrons, other particles or specified groups of such particles)."""
 
-    def __init__(self, value=float()):
-        """Create instance of the Mole class.
-
-        :param value: (optional, int or float) the amount of Moles
-        """
+    name = 'Mole'
+    symbol = 'mol'
+    to_base = Conversion()
 
-        super().__init__(name='Mole', symbol='mol', to_base=Conversion(), value=value)
 
+# the SI derives of substances
+_SI_UNITS = si_prefixed_units(name='Mole', symbol='mol')
 
-for name, symbol, base10 in SI_PREFIXES:
-    class_name = '{}Mole'.format(name)
+# the SI derives are only created when they are accessed for the first time
+__getattr__ = lazy_units(globals(), Substance, _SI_UNITS)
 
-    # generate the new class
-    generatedClass = class_factory(BaseClass=Substance, name='{}mol'.format(symbol), symbol=symbol,
-                                   to_base=Conversion(base10))
-    # register the class to the module
-    globals()[generatedClass.__name__] = generatedClass
-    # get rid of the temporary stuff
-    del generatedClass
+__all__ = ['Substance', 'Mole'] + list(_SI_UNITS)
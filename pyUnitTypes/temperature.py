@@ -1,4 +1,4 @@
-from pyUnitTypes.basics import BaseUnit, Conversion
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
 
 
 class Temperature(BaseUnit):
@@ -7,63 +7,32 @@ class Temperature(BaseUnit):
     with the different length based units.
     """
 
-    def __init__(self, name, symbol, to_base, value, from_base=None):
-        """Constructor of the Length Superclass. Please don't use this class as standalone.
+    dimension = Dimension(temperature=1)
 
-        :param name: (mandatory, string) name of the unit as word
-        :param symbol: (mandatory, string) symbol of the unit
-        :param to_base: (mandatory, pyUnitTypes.basics.Conversion) conversion object to convert the value to the base
-        value
-        :param value: (mandatory, float, int or subclass of pyUnitTypes.length.Length) The actual value of the class.
-        :param from_base: (optional, pyUnitTypes.basics.Conversion) conversion object to convert the value back from
-        the base to the value of the actual class. Default: inversion of to_base
-        """
-
-        super().__init__(name=name, symbol=symbol, unit_type=Temperature, base_class=Celsius, to_base=to_base,
-                         from_base=from_base)
-
-        # store the value and calculate the value in the base class
-        if isinstance(value, (float, int)):
-            self.value = value
-        elif issubclass(type(value), Temperature):
-            self.value = self.from_base(value.base_value)
-        else:
-            raise TypeError('Can not create object of type {0} from object of type {1}'.format(type(self).__name__,
-                                                                                               type(value).__name__))
+    # the base unit (Celsius) has an offset to the SI unit (Kelvin), so temperatures are not multiplied or divided
+    _si_factor = None
 
 
 class Celsius(Temperature):
     """Celsius: 0°C is at water freezing at sea level and 100°C is boiling temperature of water at sea level."""
 
-    def __init__(self, value=float()):
-        """Create instance of the kelvin class.
-
-        :param value: (optional, int or float)
-        """
-
-        super().__init__(name='Celsius', symbol='°C', to_base=Conversion(), value=value)
+    name = 'Celsius'
+    symbol = '°C'
+    to_base = Conversion()
 
 
 class Kelvin(Temperature):
     """Kelvin 0 is at absolute min temperature possible"""
 
-    def __init__(self, value=float()):
-        """Create instance of the kelvin class.
-
-        :param value: (optional, int or float)
-        """
-
-        super().__init__(name='Kelvin', symbol='K', to_base=Conversion(1, -273.15), value=value)
+    name = 'Kelvin'
+    symbol = 'K'
+    to_base = Conversion(1, -273.15)
 
 
 class Fahrenheit(Temperature):
     """Fahrenheit... that strange temperature the americans use."""
 
-    def __init__(self, value=float()):
-        """Create instance of the kelvin class.
-
-        :param value: (optional, int or float)
-        """
-
-        super().__init__(name='Fahrenheit', symbol='°F', to_base=Conversion(5 / 9, -160 / 9),
-                         from_base=Conversion(1.8, 32), value=value)
+    name = 'Fahrenheit'
+    symbol = '°F'
+    to_base = Conversion(5 / 9, -160 / 9)
+    from_base = Conversion(1.8, 32)
@@ -0,0 +1,94 @@
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+
+
+class Volume(BaseUnit):
+    """
+    The Volume class is the superclass of all volume based unit classes. It provides the magic method to calculate
+    with the different volume based units.
+    """
+
+    dimension = Dimension(length=3)
+
+
+class CubicMeter(Volume):
+    """The SI unit of volumes."""
+
+    name = 'CubicMeter'
+    symbol = 'm³'
+    to_base = Conversion()
+
+
+class CubicCentiMeter(Volume):
+    """Displacement of engines."""
+
+    name = 'CubicCentiMeter'
+    symbol = 'cm³'
+    to_base = Conversion(1e-6)
+
+
+class Liter(Volume):
+    """A cube with 10 cm edges."""
+
+    name = 'Liter'
+    symbol = 'l'
+    to_base = Conversion(1e-3)
+
+
+class HectoLiter(Volume):
+    """Beer is brewed in hectoliters."""
+
+    name = 'HectoLiter'
+    symbol = 'hl'
+    to_base = Conversion(1e-1)
+
+
+class CentiLiter(Volume):
+    """Cocktail recipes."""
+
+    name = 'CentiLiter'
+    symbol = 'cl'
+    to_base = Conversion(1e-5)
+
+
+class MilliLiter(Volume):
+    """Cooking recipes."""
+
+    name = 'MilliLiter'
+    symbol = 'ml'
+    to_base = Conversion(1e-6)
+
+
+class CubicFeet(Volume):
+    """Natural gas in the US."""
+
+    name = 'CubicFeet'
+    symbol = 'ft³'
+    to_base = Conversion(0.028316846592)
+
+
+class CubicInch(Volume):
+    """Displacement of US engines."""
+
+    name = 'CubicInch'
+    symbol = 'in³'
+    to_base = Conversion(1.6387064e-5)
+
+
+class Gallon(Volume):
+    """The US liquid gallon."""
+
+    name = 'Gallon'
+    symbol = 'gal'
+    to_base = Conversion(3.785411784e-3)
+
+
+class ImperialGallon(Volume):
+    """The gallon of the UK."""
+
+    name = 'ImperialGallon'
+    symbol = 'imp gal'
+    to_base = Conversion(4.54609e-3)
+
+
+__all__ = ['Volume', 'CubicMeter', 'CubicCentiMeter', 'Liter', 'HectoLiter', 'CentiLiter', 'MilliLiter', 'CubicFeet',
+           'CubicInch', 'Gallon', 'ImperialGallon']
@@ -0,0 +1,264 @@
+import struct
+import sys
+import threading
+from array import array
+from importlib import import_module
+
+from pyUnitTypes.basics import BaseUnit, SI_PREFIXES, UnknownUnitError, conversion
+
+# Stable ids of the units of the package: module -> (first id, unit names, unit with SI prefixes). The unit names get
+# the ids first id + position, the SI prefixed units first id + 0x80 + position of the prefix in SI_PREFIXES. The ids
+# are part of the encoded data, so never reorder or remove names, only append them. Modules get new blocks of ids.
+_UNIT_ID_BLOCKS = {
+    'length': (0x0100, ('Meter', 'Mile', 'Yard', 'Feet', 'Inch'), 'Meter'),
+    'mass': (0x0200, ('Tonne', 'KiloGram', 'Gram', 'Pound', 'Ounce', 'Ton', 'ShortTon'), 'Gram'),
+    'time': (0x0300, ('Day', 'Week', 'Year', 'Hour', 'Minute', 'Second', 'MilliSecond', 'MicroSecond'), None),
+    'temperature': (0x0400, ('Celsius', 'Kelvin', 'Fahrenheit'), None),
+    'current': (0x0500, ('Ampere',), 'Ampere'),
+    'substance': (0x0600, ('Mole',), 'Mole'),
+    'luminous': (0x0700, ('Candela',), 'Candela'),
+    'area': (0x0800, ('SquareMeter', 'SquareKiloMeter', 'SquareCentiMeter', 'SquareMilliMeter', 'Hectare', 'Acre',
+                      'SquareMile', 'SquareFeet', 'SquareInch'), None),
+    'volume': (0x0900, ('CubicMeter', 'CubicCentiMeter', 'Liter', 'HectoLiter', 'CentiLiter', 'MilliLiter', 'CubicFeet',
+                        'CubicInch', 'Gallon', 'ImperialGallon'), None),
+    'speed': (0x0A00, ('MeterPerSecond', 'KiloMeterPerHour', 'MilePerHour', 'FeetPerSecond', 'Knot'), None),
+    'acceleration': (0x0B00, ('MeterPerSecondSquared', 'StandardGravity', 'FeetPerSecondSquared'), None),
+    'flow': (0x0C00, ('CubicMeterPerSecond', 'CubicMeterPerHour', 'LiterPerSecond', 'LiterPerMinute',
+                      'GallonPerMinute'), None),
+    'force': (0x0D00, ('Newton', 'KiloNewton', 'Dyne', 'KiloGramForce', 'PoundForce'), None),
+    'work': (0x0E00, ('Joule', 'KiloJoule', 'MegaJoule', 'WattHour', 'KiloWattHour', 'Calorie', 'KiloCalorie',
+                      'BritishThermalUnit'), None),
+}
+
+# ids from this value on are free for the units of the users, see register_unit
+USER_UNIT_IDS = 0x8000
+
+# a single quantity: unit id, value
+SCALAR = struct.Struct('<Hd')
+
+# header of a batch: magic, version, unit id, number of values. The values follow as little endian float64.
+BATCH_MAGIC = b'QB'
+BATCH_VERSION = 1
+BATCH_HEADER = struct.Struct('<2sBHQ')
+
+_registry_lock = threading.Lock()
+_unit_ids = {}
+_units = {}
+
+
+def _build_registry():
+    """Creates the id -> (module name, unit name) index of the units of the package."""
+
+    names = {}
+    for module_name, (first_id, unit_names, si_unit) in _UNIT_ID_BLOCKS.items():
+        if si_unit is not None:
+            for position, (prefix, _, _) in enumerate(SI_PREFIXES):
+                names[first_id + 0x80 + position] = (module_name, prefix + si_unit)
+        for position, unit_name in enumerate(unit_names):
+            names[first_id + position] = (module_name, unit_name)
+    return names
+
+
+# unit id -> (module of the package, unit name)
+_PACKAGE_UNITS = _build_registry()
+
+# (module of the package, unit name) -> unit id. Units which are defined explicitly keep their id if their name is also
+# an SI prefixed name (e.g. KiloGram).
+_PACKAGE_UNIT_IDS = {}
+for _unit_id, _key in sorted(_PACKAGE_UNITS.items(), reverse=True):
+    _PACKAGE_UNIT_IDS[_key] = _unit_id
+del _unit_id, _key
+
+
+def register_unit(unit, unit_id):
+    """Registers an own unit class for the wire format.
+
+    :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class
+    :param unit_id: (mandatory, int) the id of the unit, USER_UNIT_IDS <= unit_id <= 0xFFFF. The id is part of the
+    encoded data, so it needs to be the same wherever the data is decoded.
+    """
+
+    if not (isinstance(unit, type) and issubclass(unit, BaseUnit) and unit.to_base is not None):
+        raise TypeError('Can not register {0!r}, it is not a unit class.'.format(unit))
+    if not USER_UNIT_IDS <= unit_id <= 0xFFFF:
+        raise ValueError('The ids of own units need to be between {0} and {1}.'.format(USER_UNIT_IDS, 0xFFFF))
+
+    with _registry_lock:
+        if _units.get(unit_id, unit) is not unit:
+            raise ValueError('The id {0} is already used by {1}.'.format(unit_id, _units[unit_id].__name__))
+        _units[unit_id] = unit
+        _unit_ids[unit] = unit_id
+
+
+def _unregister(unit):
+    """Removes the id of a unit, see pyUnitTypes.basics.unregister_unit."""
+
+    with _registry_lock:
+        identifier = _unit_ids.pop(unit, None)
+        if identifier is not None and _units.get(identifier) is unit:
+            del _units[identifier]
+
+
+def unit_id(unit):
+    """Returns the wire format id of a unit class.
+
+    :param unit: (mandatory, subclass of pyUnitTypes.basics.BaseUnit) the unit class
+    :returns int: the id of the unit
+    """
+
+    try:
+        return _unit_ids[unit]
+    except KeyError:
+        pass
+
+    module_name = getattr(unit, '__module__', '').rpartition('.')[2]
+    found = _PACKAGE_UNIT_IDS.get((module_name, getattr(unit, '__name__', None)))
+    if found is None or unit_from_id(found) is not unit:
+        raise UnknownUnitError('The unit {0!r} has no wire format id, see register_unit.'.format(unit))
+
+    with _registry_lock:
+        _unit_ids[unit] = found
+    return found
+
+
+def unit_from_id(unit_id):
+    """Returns the unit class of a wire format id.
+
+    :param unit_id: (mandatory, int) the id of the unit
+    :returns type: the unit class
+    """
+
+    try:
+        return _units[unit_id]
+    except KeyError:
+        pass
+
+    try:
+        module_name, unit_name = _PACKAGE_UNITS[unit_id]
+    except KeyError:
+        raise UnknownUnitError('Unknown unit id {0}'.format(unit_id))
+
+    unit = getattr(import_module('pyUnitTypes.' + module_name), unit_name)
+    with _registry_lock:
+        _units[unit_id] = unit
+    return unit
+
+
+def encode(quantity):
+    """Encodes a unit object into 10 bytes: the unit id (uint16) and the value (float64).
+
+    :param quantity: (mandatory, pyUnitTypes.basics.BaseUnit) the unit object
+    :returns bytes: the encoded quantity
+    """
+
+    return SCALAR.pack(unit_id(type(quantity)), quantity._value)
+
+
+def decode(data, offset=0):
+    """Decodes a unit object encoded by encode.
+
+    :param data: (mandatory, bytes like) the encoded data
+    :param offset: (optional, int) position of the quantity in the data. Default: 0
+    :returns pyUnitTypes.basics.BaseUnit: the unit object
+    """
+
+    identifier, value = SCALAR.unpack_from(data, offset)
+    return unit_from_id(identifier)(value)
+
+
+def encode_batch(values, unit=None):
+    """Encodes many values of the same unit into a header and one packed buffer of float64 values.
+
+    :param values: (mandatory, iterable) the values in the given unit as floats, array('d'), numpy array or
+    QuantityArray, or unit objects of the same unit type, which are converted into the given unit
+    :param unit: (optional, subclass of pyUnitTypes.basics.BaseUnit) the unit of the values. Default: the unit of the
+    QuantityArray or of the first unit object
+    :returns bytes: the encoded batch
+    """
+
+    if unit is None:
+        unit = getattr(values, 'unit', None)
+    if hasattr(values, 'base_value') and hasattr(values, 'to'):
+        # QuantityArray
+        values = values.to(unit).value
+
+    if isinstance(values, array) and values.typecode == 'd':
+        buffer = values
+    else:
+        try:
+            # bulk copy of float64 buffers like numpy arrays
+            view = memoryview(values)
+        except TypeError:
+            view = None
+        if view is not None and view.format == 'd' and view.ndim == 1:
+            buffer = array('d')
+            buffer.frombytes(view.cast('B') if view.contiguous else view.tobytes())
+        else:
+            buffer, unit = _to_array(values, unit)
+
+    if unit is None:
+        raise ValueError('The unit of the values is needed.')
+
+    if sys.byteorder != 'little':  # pragma: no cover
+        buffer = array('d', buffer)
+        buffer.byteswap()
+    return BATCH_HEADER.pack(BATCH_MAGIC, BATCH_VERSION, unit_id(unit), len(buffer)) + buffer.tobytes()
+
+
+def _to_array(values, unit):
+    """Returns the values of an iterable of floats or unit objects as array('d') in the given unit and the unit."""
+
+    buffer = array('d')
+    conversions = {}
+    for value in values:
+        if isinstance(value, BaseUnit):
+            if unit is None:
+                unit = type(value)
+            try:
+                factor, offset = conversions[type(value)]
+            except KeyError:
+                composed = conversion(type(value), unit)
+                factor, offset = conversions[type(value)] = composed.factor, composed.offset
+            buffer.append(factor * value._value + offset)
+        else:
+            buffer.append(value)
+    return buffer, unit
+
+
+def decode_batch(data):
+    """Decodes a batch encoded by encode_batch. The values are copied in one block into an array('d').
+
+    :param data: (mandatory, bytes like) the encoded batch
+    :returns tuple: (unit class, array('d') of the values)
+    """
+
+    view = memoryview(data).cast('B')
+    magic, version, identifier, count = BATCH_HEADER.unpack_from(view)
+    if magic != BATCH_MAGIC or version != BATCH_VERSION:
+        raise ValueError('The data is no encoded batch of version {0}.'.format(BATCH_VERSION))
+
+    end = BATCH_HEADER.size + 8 * count
+    if len(view) < end:
+        raise ValueError('The batch is truncated: {0} values expected.'.format(count))
+
+    values = array('d')
+    values.frombytes(view[BATCH_HEADER.size:end])
+    if sys.byteorder != 'little':  # pragma: no cover
+        values.byteswap()
+    return unit_from_id(identifier), values
+
+
+def _reduce(quantity):
+    """Returns the pickle data of a unit object: its unit id and its value. Units without id are pickled by their
+    class."""
+
+    try:
+        return _from_id, (unit_id(type(quantity)), quantity._value)
+    except UnknownUnitError:
+        return type(quantity), (quantity._value,)
+
+
+def _from_id(identifier, value):
+    """Recreates a pickled unit object."""
+
+    return unit_from_id(identifier)(value)
@@ -0,0 +1,78 @@
+from pyUnitTypes.basics import BaseUnit, Conversion, Dimension
+
+
+class Work(BaseUnit):
+    """
+    The Work class is the superclass of all work and energy based unit classes. It provides the
+    magic method to calculate with the different work based units.
+    """
+
+    dimension = Dimension(length=2, mass=1, time=-2)
+
+
+class Joule(Work):
+    """The SI unit of work and energy: N * m."""
+
+    name = 'Joule'
+    symbol = 'J'
+    to_base = Conversion()
+
+
+class KiloJoule(Work):
+    """Nutrition labels in Europe."""
+
+    name = 'KiloJoule'
+    symbol = 'kJ'
+    to_base = Conversion(1e3)
+
+
+class MegaJoule(Work):
+    """Energy content of fuels."""
+
+    name = 'MegaJoule'
+    symbol = 'MJ'
+    to_base = Conversion(1e6)
+
+
+class WattHour(Work):
+    """Capacity of batteries."""
+
+    name = 'WattHour'
+    symbol = 'Wh'
+    to_base = Conversion(3600)
+
+
+class KiloWattHour(Work):
+    """Your electricity bill."""
+
+    name = 'KiloWattHour'
+    symbol = 'kWh'
+    to_base = Conversion(3.6e6)
+
+
+class Calorie(Work):
+    """The thermochemical calorie."""
+
+    name = 'Calorie'
+    symbol = 'cal'
+    to_base = Conversion(4.184)
+
+
+class KiloCalorie(Work):
+    """Nutrition labels in the US."""
+
+    name = 'KiloCalorie'
+    symbol = 'kcal'
+    to_base = Conversion(4184)
+
+
+class BritishThermalUnit(Work):
+    """Heating and air conditioning in the US."""
+
+    name = 'BritishThermalUnit'
+    symbol = 'BTU'
+    to_base = Conversion(1055.05585262)
+
+
+__all__ = ['Work', 'Joule', 'KiloJoule', 'MegaJoule', 'WattHour', 'KiloWattHour', 'Calorie', 'KiloCalorie',
+           'BritishThermalUnit']
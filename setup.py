@@ -6,6 +6,10 @@ setup(
     version='0.0.1',
     description='python package to work with different physical units as types and pythons type annotations',
     packages=['pyUnitTypes'],
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['pandas'],
+    },
     test_suite='tests'
 )
 
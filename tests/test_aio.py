@@ -0,0 +1,114 @@
+import asyncio
+from unittest import TestCase
+
+from pyUnitTypes.aio import convert_async, convert_batches_async
+from pyUnitTypes.basics import convert
+from pyUnitTypes.length import Meter, KiloMeter, Mile
+from pyUnitTypes.mass import KiloGram
+from pyUnitTypes.temperature import Celsius, Fahrenheit, Kelvin
+
+
+async def _stream(items, delay=0.0, log=None):
+    for item in items:
+        if log is not None:
+            log.append(item)
+        await asyncio.sleep(delay)
+        yield item
+
+
+async def _collect(iterator, limit=None):
+    result = []
+    async for item in iterator:
+        result.append(item)
+        if limit is not None and len(result) >= limit:
+            break
+    return result
+
+
+class TestConvertAsync(TestCase):
+    """Tests for aio.py module"""
+
+    def test_convert_async(self):
+        readings = [Celsius(20), Fahrenheit(68), Kelvin(300), Celsius(-5.5)] * 10
+        result = asyncio.run(_collect(convert_async(_stream(readings), to=Celsius, max_batch=7)))
+
+        self.assertEqual(len(result), len(readings))
+        for reading, converted in zip(readings, result):
+            self.assertIsInstance(converted, Celsius)
+            self.assertAlmostEqual(converted.value, convert(reading.value, type(reading), Celsius))
+
+        # synchronous iterables and other unit types
+        result = asyncio.run(_collect(convert_async([Mile(1), KiloMeter(2), Meter(3)], to=Meter)))
+        self.assertEqual([round(value.value, 3) for value in result], [1609.344, 2000, 3])
+
+    def test_batches(self):
+        readings = [Fahrenheit(value) for value in range(10)]
+        batches = asyncio.run(_collect(convert_batches_async(_stream(readings), Celsius, max_batch=4)))
+
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        converted = [value for batch in batches for value in batch]
+        for value, result in zip(range(10), converted):
+            self.assertAlmostEqual(result, convert(value, Fahrenheit, Celsius))
+
+    def test_time_window(self):
+        # the source is slower than the time window, so every value is its own batch
+        readings = [Meter(value) for value in range(3)]
+        batches = asyncio.run(_collect(convert_batches_async(_stream(readings, delay=0.02), KiloMeter,
+                                                             max_delay=0.001)))
+        self.assertEqual([len(batch) for batch in batches], [1, 1, 1])
+
+    def test_backpressure(self):
+        log = []
+
+        async def consume():
+            iterator = convert_async(_stream([Meter(value) for value in range(1000)], log=log), to=Meter, max_batch=10,
+                                     max_pending=5)
+            first = await iterator.__anext__()
+            await asyncio.sleep(0.01)
+            await iterator.aclose()
+            return first
+
+        self.assertEqual(asyncio.run(consume()), Meter(0))
+        # the source is only read up to the free places of the queue
+        self.assertLess(len(log), 50)
+
+    def test_early_exit(self):
+        async def consume(close):
+            readings = _stream([Meter(value) for value in range(100)], delay=0.001)
+            iterator = (convert_async if close else convert_batches_async)(readings, to=Meter, max_batch=4)
+            async for _ in iterator:
+                break
+            if close:
+                await iterator.aclose()
+            else:
+                del iterator
+                await asyncio.sleep(0.01)
+            # the reader of the source has finished and isn't destroyed pending with the event loop
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+        for close in (True, False):
+            with self.assertNoLogs('asyncio', level='ERROR'):
+                self.assertEqual(asyncio.run(consume(close)), set())
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            asyncio.run(_collect(convert_async(_stream([Meter(1), KiloGram(1)]), to=Meter)))
+        with self.assertRaises(TypeError):
+            asyncio.run(_collect(convert_async([1.0], to=Meter)))
+        with self.assertRaises(ValueError):
+            asyncio.run(_collect(convert_async([Meter(1)], to=Meter, max_batch=0)))
+
+        async def failing():
+            yield Meter(1)
+            raise RuntimeError('device lost')
+
+        received = []
+
+        async def consume():
+            async for value in convert_async(failing(), to=Meter):
+                received.append(value)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(consume())
+        # the values read before the error are not lost
+        self.assertEqual(received, [Meter(1)])
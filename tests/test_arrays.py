@@ -0,0 +1,219 @@
+from unittest import TestCase, skipIf
+
+from pyUnitTypes.area import SquareMeter
+from pyUnitTypes.arrays import QuantityArray, np
+from pyUnitTypes.basics import UnknownUnitMultiplicationError, UnknownUnitDivisionError
+from pyUnitTypes.length import Meter, CentiMeter, KiloMeter, Mile
+from pyUnitTypes.speed import KiloMeterPerHour, MeterPerSecond
+from pyUnitTypes.temperature import Celsius, Fahrenheit, Kelvin
+from pyUnitTypes.time import Hour, Minute
+from pyUnitTypes.volume import CubicMeter
+
+
+@skipIf(np is None, 'numpy is not installed')
+class TestQuantityArray(TestCase):
+    """Tests the numpy backed QuantityArray."""
+
+    def test_constructor(self):
+        """Tests the different ways to create a QuantityArray."""
+
+        meters = QuantityArray([1, 2, 3], Meter)
+        self.assertEqual(meters.unit, Meter)
+        self.assertEqual(meters.type.__name__, 'Length')
+        self.assertEqual(meters.value.dtype, np.float64)
+        self.assertEqual(len(meters), 3)
+
+        centimeters = QuantityArray(meters, CentiMeter)
+        self.assertEqual(centimeters.value.tolist(), [100, 200, 300])
+
+        from_units = QuantityArray.from_units([Meter(1), CentiMeter(50), KiloMeter(1)], Meter)
+        self.assertEqual(from_units.value.tolist(), [1, 0.5, 1000])
+
+        with self.assertRaises(TypeError):
+            QuantityArray(meters, Celsius)
+        with self.assertRaises(TypeError):
+            QuantityArray([1], float)
+        with self.assertRaises(TypeError):
+            QuantityArray.from_units([Meter(1), Celsius(1)])
+
+    def test_unit_on_the_left(self):
+        """Tests the operators with a unit object as left operand, which hands them over to the array."""
+
+        kilometers = QuantityArray([1, 2], KiloMeter)
+
+        total = Meter(500) + kilometers
+        self.assertIs(total.unit, Meter)
+        self.assertEqual(total.value.tolist(), [1500, 2500])
+        difference = Meter(5000) - kilometers
+        self.assertIs(difference.unit, Meter)
+        self.assertEqual(difference.value.tolist(), [4000, 3000])
+        meter = Meter(500)
+        meter += kilometers
+        self.assertEqual(meter.value.tolist(), [1500, 2500])
+
+        self.assertEqual((Meter(1500) == kilometers).tolist(), [False, False])
+        self.assertEqual((Meter(2000) == kilometers).tolist(), [False, True])
+        self.assertEqual((Meter(2000) != kilometers).tolist(), [True, False])
+        self.assertEqual((Meter(1500) < kilometers).tolist(), [False, True])
+        self.assertEqual((Meter(1500) > kilometers).tolist(), [True, False])
+        self.assertEqual((Meter(2000) <= kilometers).tolist(), [False, True])
+        self.assertEqual((Meter(1000) >= kilometers).tolist(), [True, False])
+
+        with self.assertRaises(TypeError):
+            Celsius(1) + kilometers
+        with self.assertRaises(TypeError):
+            Celsius(1) < kilometers
+        self.assertEqual((Celsius(1) == kilometers).tolist(), [False, False])
+
+    def test_derived_units(self):
+        """Tests products and quotients of quantities, which are of the derived unit types like for unit objects."""
+
+        meters = QuantityArray([1, 2, 3], Meter)
+        kilometers = QuantityArray([1, 2, 3], KiloMeter)
+
+        area = meters * kilometers
+        self.assertIs(area.unit, SquareMeter)
+        self.assertEqual(area.value.tolist(), [1000, 4000, 9000])
+        self.assertEqual((meters * CentiMeter(100)).value.tolist(), [1, 2, 3])
+        self.assertEqual((Meter(2) * meters).value.tolist(), [2, 4, 6])
+        self.assertIs((meters * area).unit, CubicMeter)
+
+        speed = kilometers / Hour(2)
+        self.assertIs(speed.unit, MeterPerSecond)
+        np.testing.assert_allclose(speed.to(KiloMeterPerHour).value, [0.5, 1, 1.5])
+        np.testing.assert_allclose((KiloMeter(9) / QuantityArray([1, 2, 3], Hour)).to(KiloMeterPerHour).value,
+                                   [9, 4.5, 3])
+        self.assertEqual((area / meters).value.tolist(), [1000, 2000, 3000])
+
+        # the same values as unit object by unit object
+        for product, a, b in zip(meters * kilometers, meters, kilometers):
+            self.assertEqual(product, a * b)
+
+        # dimensionless results are float arrays
+        ratio = kilometers / meters
+        self.assertIsInstance(ratio, np.ndarray)
+        self.assertEqual(ratio.tolist(), [1000, 1000, 1000])
+        np.testing.assert_allclose(Hour(1) / QuantityArray([15, 30], Minute), [4, 2])
+
+        # in place operators return the new array of the derived unit
+        values = QuantityArray([1, 2], Meter)
+        values *= Meter(2)
+        self.assertIs(values.unit, SquareMeter)
+        values /= QuantityArray([1, 4], Meter)
+        self.assertIs(values.unit, Meter)
+        self.assertEqual(values.value.tolist(), [2, 1])
+
+    def test_conversion(self):
+        """Tests the vectorized conversion between units."""
+
+        fahrenheit = QuantityArray([32, 212, -40], Fahrenheit)
+        np.testing.assert_allclose(fahrenheit.to(Celsius).value, [0, 100, -40])
+        np.testing.assert_allclose(fahrenheit.to(Kelvin).value, [273.15, 373.15, 233.15])
+
+        # the results need to match the scalar path
+        for array_value, value in zip(fahrenheit.to(Kelvin), fahrenheit.value):
+            self.assertAlmostEqual(array_value.value, Kelvin(Fahrenheit(value)).value, places=9)
+
+        miles = QuantityArray([1, 2], Mile)
+        miles.convert(KiloMeter)
+        self.assertEqual(miles.unit, KiloMeter)
+        np.testing.assert_allclose(miles.value, [1.609344, 3.218688])
+
+        with self.assertRaises(TypeError):
+            miles.to(Celsius)
+
+    def test_views_and_conversion(self):
+        """Tests that slices stay in the unit of the array they share the buffer with."""
+
+        meters = QuantityArray([1, 2, 3], Meter)
+        view = meters[0:2]
+        nested = view[1:]
+
+        # a view can't be converted in place, the rest of the array would keep its unit
+        with self.assertRaises(TypeError):
+            meters[0:2].convert(KiloMeter)
+        with self.assertRaises(TypeError):
+            nested.convert(KiloMeter)
+        self.assertEqual(meters.value.tolist(), [1, 2, 3])
+        self.assertIs(meters.unit, Meter)
+        self.assertEqual(view.to(CentiMeter).value.tolist(), [100, 200])
+
+        # views follow the in place conversion of their array
+        meters.convert(KiloMeter)
+        for converted in (view, nested):
+            self.assertIs(converted.unit, KiloMeter)
+            self.assertEqual(converted[-1], Meter(2))
+        self.assertEqual((view + Meter(1)).value.tolist(), [0.002, 0.003])
+
+        # advanced indexing copies the values, so the result is an array of its own
+        copied = meters[[0, 2]]
+        copied.convert(Meter)
+        self.assertEqual(copied.value.tolist(), [1, 3])
+        self.assertIs(meters.unit, KiloMeter)
+
+    def test_indexing(self):
+        """Tests item access and slicing."""
+
+        meters = QuantityArray([1, 2, 3, 4], Meter)
+        self.assertEqual(meters[0], Meter(1))
+        self.assertIsInstance(meters[0], Meter)
+
+        view = meters[1:3]
+        self.assertIsInstance(view, QuantityArray)
+        view[0] = CentiMeter(500)
+        self.assertEqual(meters[1], Meter(5))
+
+        self.assertEqual(list(meters), [Meter(1), Meter(5), Meter(3), Meter(4)])
+
+    def test_comparison(self):
+        """Tests the element-wise comparison operators."""
+
+        meters = QuantityArray([1, 2, 3], Meter)
+        self.assertEqual((meters == CentiMeter(200)).tolist(), [False, True, False])
+        self.assertEqual((meters != 2).tolist(), [True, False, True])
+        self.assertEqual((meters < QuantityArray([200, 200, 200], CentiMeter)).tolist(), [True, False, False])
+        self.assertEqual((meters >= 2).tolist(), [False, True, True])
+        self.assertEqual((meters == Celsius(1)).tolist(), [False, False, False])
+        self.assertEqual((meters != Celsius(1)).tolist(), [True, True, True])
+
+        with self.assertRaises(TypeError):
+            meters < Celsius(1)
+        with self.assertRaises(TypeError):
+            meters > '1'
+
+    def test_arithmetic(self):
+        """Tests the element-wise arithmetic with broadcasting."""
+
+        meters = QuantityArray([1, 2, 3], Meter)
+        self.assertEqual((meters + 1).value.tolist(), [2, 3, 4])
+        self.assertEqual((1 + meters).value.tolist(), [2, 3, 4])
+        self.assertEqual((meters + CentiMeter(100)).value.tolist(), [2, 3, 4])
+        self.assertEqual((meters - np.array([1, 1, 1])).value.tolist(), [0, 1, 2])
+        self.assertEqual((np.array([3, 3, 3]) - meters).value.tolist(), [2, 1, 0])
+        self.assertEqual((meters * 2).value.tolist(), [2, 4, 6])
+        self.assertEqual((meters / 2).value.tolist(), [0.5, 1, 1.5])
+        self.assertEqual((-meters).value.tolist(), [-1, -2, -3])
+        self.assertEqual(abs(-meters).value.tolist(), [1, 2, 3])
+
+        # arithmetic does not touch the original buffer
+        self.assertEqual(meters.value.tolist(), [1, 2, 3])
+
+        meters += QuantityArray([100, 100, 100], CentiMeter)
+        self.assertEqual(meters.value.tolist(), [2, 3, 4])
+        meters *= 2
+        self.assertEqual(meters.value.tolist(), [4, 6, 8])
+
+        with self.assertRaises(TypeError):
+            meters + Celsius(1)
+        with self.assertRaises(TypeError):
+            meters + '1'
+        with self.assertRaises(UnknownUnitMultiplicationError):
+            meters * Celsius(1)
+        with self.assertRaises(UnknownUnitDivisionError):
+            meters / QuantityArray([1, 2, 3], Celsius)
+        with self.assertRaises(UnknownUnitDivisionError):
+            1 / meters
+        with self.assertRaises(ZeroDivisionError):
+            meters / Meter(0)
+        with self.assertRaises(ZeroDivisionError):
+            meters / 0
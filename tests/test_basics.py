@@ -1,10 +1,26 @@
 import copy
+import gc
 import math
+import pickle
 from unittest import TestCase
 
-from pyUnitTypes.basics import Conversion, UnknownUnitMultiplicationError, UnknownUnitDivisionError
-from pyUnitTypes.length import Meter, CentiMeter
-from pyUnitTypes.temperature import Celsius
+from pyUnitTypes.basics import Conversion, UnknownUnitMultiplicationError, UnknownUnitDivisionError, conversion, \
+    conversion_table, convert, converter, convert_iter, convert_list, convert_scalar, list_converter, Dimension, \
+    unit_type, unregister_unit, BaseUnit, UnknownUnitError, _INTERNED_CONVERSIONS, _UNIT_TYPES, _expression, \
+    _list_kernel
+from pyUnitTypes.acceleration import MeterPerSecondSquared
+from pyUnitTypes.area import SquareMeter
+from pyUnitTypes.flow import LiterPerSecond
+from pyUnitTypes.force import Newton
+from pyUnitTypes.expressions import lazy
+from pyUnitTypes.length import Length, Meter, CentiMeter, KiloMeter, Mile
+from pyUnitTypes.mass import KiloGram
+from pyUnitTypes.parser import parse_unit
+from pyUnitTypes.speed import MeterPerSecond, KiloMeterPerHour
+from pyUnitTypes.temperature import Temperature, Celsius, Fahrenheit, Kelvin
+from pyUnitTypes.time import Hour, Minute, Second
+from pyUnitTypes.volume import CubicMeter, Liter
+from pyUnitTypes.work import Joule
 
 
 class TestBaseUnit(TestCase):
@@ -29,6 +45,22 @@ class TestBaseUnit(TestCase):
         # __deepcopy__
         self.assertEqual(one_meter, copy.copy(one_meter))
 
+    def test_class_meta_data(self):
+        """Tests that the unit meta data lives in the class and the instances only store their values."""
+
+        one_meter = Meter(1)
+        self.assertFalse(hasattr(one_meter, '__dict__'))
+        self.assertFalse(hasattr(CentiMeter(1), '__dict__'))
+        with self.assertRaises(AttributeError):
+            one_meter.unknown = 1
+
+        self.assertEqual(one_meter.name, 'Meter')
+        self.assertEqual(one_meter.symbol, 'm')
+        self.assertIs(one_meter.type, Length)
+        self.assertIs(Length._base_class, Meter)
+        self.assertIs(Meter(2).from_base, one_meter.from_base)
+        self.assertEqual(CentiMeter.from_base, Conversion(100))
+
     def test_type_conversions(self):
         """Tests the conversion of types."""
 
@@ -171,6 +203,13 @@ class TestBaseUnit(TestCase):
         meter += CentiMeter(100)
         self.assertEqual(meter, 2)
 
+        # units which are not the base unit: the base values are added, the sum is in the unit of the left operand
+        self.assertEqual((Mile(1) + Mile(1)).value, 2)
+        self.assertIsInstance(Mile(1) + Meter(1609.344), Mile)
+        self.assertAlmostEqual((Mile(1) + Meter(1609.344)).value, 2, places=12)
+        self.assertAlmostEqual((Fahrenheit(50) + Fahrenheit(68)).value, (lazy(Fahrenheit(50)) + Fahrenheit(68))
+                               .evaluate().value, places=9)
+
         # unsupported Types
         with self.assertRaises(TypeError):
             a = Meter(1) + Celsius(1)
@@ -221,6 +260,12 @@ class TestBaseUnit(TestCase):
         meter -= CentiMeter(100)
         self.assertEqual(meter, -2)
 
+        # units which are not the base unit
+        self.assertEqual((Mile(3) - Mile(1)).value, 2)
+        self.assertAlmostEqual((KiloMeter(2) - Meter(500)).value, 1.5, places=12)
+        self.assertAlmostEqual((Celsius(30) - Kelvin(10)).value, (lazy(Celsius(30)) - Kelvin(10)).evaluate().value,
+                               places=9)
+
         # unsupported Types
         with self.assertRaises(TypeError):
             a = Meter(1) - Celsius(1)
@@ -283,7 +328,13 @@ class TestBaseUnit(TestCase):
         with self.assertRaises(TypeError):
             meter *= '1'
 
-        # unsupported Units
+        # derived units
+        self.assertEqual(type(Meter(2) * Meter(3)), SquareMeter)
+        self.assertEqual(Meter(2) * Meter(3), SquareMeter(6))
+        self.assertAlmostEqual((CentiMeter(10) * Meter(3)).value, 0.3)
+        self.assertEqual(type(Meter(2) * SquareMeter(3)), CubicMeter)
+        self.assertAlmostEqual((KiloGram(2) * MeterPerSecondSquared(3)).value, 6)
+        self.assertEqual(type(Meter(1) * Newton(1)), Joule)
 
     def test_div(self):
         """Test the division."""
@@ -309,9 +360,26 @@ class TestBaseUnit(TestCase):
         with self.assertRaises(ZeroDivisionError):
             meter /= 0
 
+        # derived units
+        self.assertEqual(type(KiloMeter(100) / Hour(2)), MeterPerSecond)
+        self.assertAlmostEqual(KiloMeterPerHour(KiloMeter(100) / Hour(2)).value, 50)
+        self.assertEqual(type(Meter(1) / Second(1) / Second(1)), MeterPerSecondSquared)
+        self.assertEqual(type(CubicMeter(6) / Meter(2)), SquareMeter)
+        self.assertEqual(CubicMeter(6) / Meter(2), SquareMeter(3))
+        self.assertAlmostEqual(LiterPerSecond(Liter(60) / Minute(1)).value, 1)
+
+        # dimensionless results are floats
+        self.assertEqual(KiloMeter(1) / Meter(250), 4)
+        self.assertIsInstance(KiloMeter(1) / Meter(250), float)
+        self.assertAlmostEqual(Hour(1) / Minute(15), 4)
+
         # unsupported Types
         with self.assertRaises(UnknownUnitDivisionError):
             a = Meter(1) / Celsius(1)
+        with self.assertRaises(UnknownUnitDivisionError):
+            a = Celsius(1) / Celsius(1)
+        with self.assertRaises(UnknownUnitDivisionError):
+            a = 1 / Second(1)
         with self.assertRaises(UnknownUnitDivisionError):
             meter /= Celsius(1)
         with self.assertRaises(UnknownUnitDivisionError):
@@ -325,6 +393,86 @@ class TestBaseUnit(TestCase):
         with self.assertRaises(TypeError):
             meter /= '1'
 
+    def test_operand_kinds(self):
+        """Tests the dispatch of the binary operators by the kind of the other operand."""
+
+        class Number(float):
+            pass
+
+        # subclasses of numbers are numbers
+        self.assertEqual(Meter(1), Number(1))
+        self.assertLess(Meter(1), Number(2))
+        self.assertEqual(Meter(1), True)
+        self.assertEqual((Meter(1) + Number(1)).value, 2)
+
+        # all units of a unit type share the dimension id
+        self.assertEqual(Meter._dimension_id, KiloMeter._dimension_id)
+        self.assertEqual(Meter._dimension_id, Length._dimension_id)
+        self.assertNotEqual(Meter._dimension_id, Celsius._dimension_id)
+
+        # unsupported types stay unsupported
+        for _ in range(2):
+            self.assertNotEqual(Meter(1), '1')
+            with self.assertRaises(TypeError):
+                Meter(1) < '1'
+            with self.assertRaises(TypeError):
+                Meter(1) < Celsius(1)
+
+    def test_result_types_of_new_unit_types(self):
+        """Tests that products and quotients find unit types which are defined after the first calculation."""
+
+        class Charge(BaseUnit):
+            dimension = Dimension(current=1, time=1)
+
+        class Coulomb(Charge):
+            name = 'Coulomb'
+            symbol = 'C'
+            to_base = Conversion()
+
+        with self.assertRaises(UnknownUnitMultiplicationError):
+            Coulomb(2) * Meter(3)
+
+        class ChargeLength(BaseUnit):
+            dimension = Dimension(current=1, time=1, length=1)
+
+        class CoulombMeter(ChargeLength):
+            name = 'CoulombMeter'
+            symbol = 'C*m'
+            to_base = Conversion()
+
+        self.addCleanup(_UNIT_TYPES.pop, ChargeLength.dimension)
+        self.addCleanup(_UNIT_TYPES.pop, Charge.dimension)
+        self.assertEqual(Coulomb(2) * Meter(3), CoulombMeter(6))
+        self.assertIsInstance(Coulomb(2) * Meter(3), CoulombMeter)
+
+    def test_unregister_unit(self):
+        """Tests the removal of a unit class from its unit type and the indexes of the package."""
+
+        class Chain(Length):
+            """A tenth of a furlong."""
+
+            name = 'Chain'
+            symbol = 'ch'
+            to_base = Conversion(20.1168)
+
+        self.assertIs(parse_unit('ch'), Chain)
+        self.assertAlmostEqual(Meter(Chain(1)).value, 20.1168)
+        unregister_unit(Chain)
+        self.assertNotIn(Chain, Length._units)
+        with self.assertRaises(UnknownUnitError):
+            parse_unit('ch')
+        with self.assertRaises(UnknownUnitError):
+            unregister_unit(Chain)
+
+        # objects of the unit keep working
+        self.assertAlmostEqual(Chain(1).base_value, 20.1168)
+
+        # neither base classes nor unit types can be unregistered
+        with self.assertRaises(ValueError):
+            unregister_unit(Meter)
+        with self.assertRaises(TypeError):
+            unregister_unit(Length)
+
     def test_round(self):
         """Tests the round(), math.floor() and math.ceil() functionality."""
 
@@ -355,6 +503,59 @@ class TestBaseUnit(TestCase):
         self.assertEqual(Meter(-1), math.ceil(Meter(-1.5)))
         self.assertEqual(Meter(-1), math.ceil(Meter(-1.6)))
 
+    def test_lazy_base_value(self):
+        """Tests that the base value is converted on its first read after the value changed."""
+
+        distance = KiloMeter(1)
+        self.assertIsNone(distance._base_value)
+        self.assertEqual(distance.base_value, 1000)
+        self.assertEqual(distance._base_value, 1000)
+
+        for _ in range(10):
+            distance += 0.5
+        self.assertIsNone(distance._base_value)
+        self.assertEqual(distance.base_value, 6000)
+
+        # comparisons and mixed operations see the changed values
+        distance.value = 2
+        self.assertEqual(distance, Meter(2000))
+        self.assertLess(Meter(1999), distance)
+        distance *= 2
+        self.assertGreater(distance, Meter(3999))
+        distance += Meter(500)
+        self.assertEqual(distance.value, 4.5)
+        self.assertEqual(distance.base_value, 4500)
+
+        # a base value of 0 is valid
+        zero = CentiMeter(0)
+        self.assertEqual(zero.base_value, 0)
+        self.assertEqual(zero, Meter(0))
+        self.assertLess(zero, Meter(1))
+        self.assertEqual(KiloMeter(zero).value, 0)
+
+
+class TestDimension(TestCase):
+    """Tests for the Dimension and the unit types of dimensions."""
+
+    def test_arithmetic(self):
+        length = Dimension(length=1)
+        time = Dimension(time=1)
+
+        self.assertEqual(length / time, Dimension(length=1, time=-1))
+        self.assertEqual(length * length, Dimension(length=2))
+        self.assertEqual(length ** 3, Dimension(length=3))
+        self.assertEqual(length / length, Dimension())
+        self.assertFalse(length / length)
+        self.assertTrue(length)
+
+    def test_unit_type(self):
+        self.assertIs(unit_type(Dimension(length=1)), Length)
+        self.assertIs(unit_type(Dimension(length=1, time=-1)), MeterPerSecond._type)
+        self.assertIs(unit_type(Dimension(length=2, mass=1, time=-2)), Joule._type)
+        self.assertIsNone(unit_type(Dimension(time=-1)))
+        for unit in (Length, Temperature, SquareMeter, CubicMeter, Newton):
+            self.assertIs(unit_type(unit.dimension), unit._type)
+
 
 class TestConversion(TestCase):
     """Tests the Conversion class."""
@@ -446,21 +647,166 @@ class TestConversion(TestCase):
 
         # non zero
         conv = Conversion(factor=2, offset=3)
-        conv_inv = copy.copy(conv).__invert__()
+        conv_inv = ~conv
 
         self.assertEqual(conv_inv.factor, 1 / conv.factor)
         self.assertEqual(conv_inv.offset, -conv.offset / conv.factor)
+        # the conversion itself is not changed
+        self.assertEqual(conv, Conversion(factor=2, offset=3))
+        self.assertIs(~conv, conv_inv)
 
         # zero factpr
         conv = Conversion(factor=0, offset=1)
-        conv_inv = copy.copy(conv).__invert__()
+        conv_inv = ~conv
 
         self.assertEqual(conv_inv.factor, 0)
         self.assertEqual(conv_inv.offset, -conv.offset)
 
         # zero offset
         conv = Conversion(factor=2, offset=0)
-        conv_inv = copy.copy(conv).__invert__()
+        conv_inv = ~conv
 
         self.assertEqual(conv_inv.factor, 1 / conv.factor)
         self.assertEqual(conv_inv.offset, 0)
+
+    def test_immutable(self):
+        """Tests the interning and immutability of the conversions."""
+
+        conv = Conversion(factor=2, offset=3)
+        self.assertIs(conv, Conversion(2.0, 3.0))
+        self.assertIs(conv, copy.copy(conv))
+        self.assertIs(conv, copy.deepcopy(conv))
+        self.assertIs(conv, pickle.loads(pickle.dumps(conv)))
+        self.assertEqual(hash(conv), hash(Conversion(factor=2, offset=3)))
+        self.assertEqual({conv: 1}[Conversion(2, 3)], 1)
+        self.assertEqual(str(conv), 'y = 2.0 * x + 3.0')
+        # equal, but the sign of zero is kept
+        self.assertEqual(Conversion(offset=-0.0), Conversion())
+        self.assertIsNot(Conversion(offset=-0.0), Conversion())
+
+        # NaN conversions are not interned, unused conversions are dropped
+        nan = Conversion(float('nan'))
+        self.assertTrue(math.isnan(nan(1)))
+        self.assertIsNot(nan, Conversion(float('nan')))
+        self.assertNotIn(nan, list(_INTERNED_CONVERSIONS.values()))
+        self.assertNotIn(Conversion(offset=float('nan')), list(_INTERNED_CONVERSIONS.values()))
+        Conversion(factor=12.345, offset=6.789)
+        gc.collect()
+        self.assertNotIn((12.345, 6.789, 1.0, 1.0), _INTERNED_CONVERSIONS)
+
+        with self.assertRaises(AttributeError):
+            conv.factor = 4
+        with self.assertRaises(AttributeError):
+            del conv.offset
+        self.assertEqual(conv.factor, 2)
+
+    def test_compose(self):
+        """Tests the composition of conversions."""
+
+        first = Conversion(factor=2, offset=3)
+        second = Conversion(factor=5, offset=-1)
+
+        for value in (-4, 0, 2.5):
+            self.assertEqual((second @ first)(value), second(first(value)))
+            self.assertEqual((first @ second)(value), first(second(value)))
+        self.assertIs(second @ first, Conversion(factor=10, offset=14))
+
+        self.assertTrue(Conversion().is_identity)
+        self.assertTrue((~first @ first).is_identity)
+        self.assertFalse(first.is_identity)
+        self.assertFalse(Conversion(offset=1).is_identity)
+        self.assertTrue(Meter.to_base.is_identity)
+        self.assertIs(KiloMeter.from_base, ~KiloMeter.to_base)
+
+        with self.assertRaises(TypeError):
+            first @ 2
+
+
+class TestConversionTable(TestCase):
+    """Tests the memoized conversions between unit classes."""
+
+    def test_conversion(self):
+        """Tests the composition of the conversions."""
+
+        self.assertEqual(conversion(Meter, Meter), Conversion())
+        self.assertAlmostEqual(conversion(Mile, KiloMeter).factor, 1.609344)
+        self.assertAlmostEqual(conversion(Fahrenheit, Kelvin).factor, 5 / 9)
+        self.assertAlmostEqual(conversion(Fahrenheit, Kelvin).offset, 255.37222222, places=6)
+
+        # the composed conversion is reused
+        self.assertIs(conversion(Mile, KiloMeter), conversion(Mile, KiloMeter))
+
+        with self.assertRaises(TypeError):
+            conversion(Meter, Celsius)
+        with self.assertRaises(TypeError):
+            conversion(Meter, float)
+        with self.assertRaises(TypeError):
+            conversion(Length, Meter)
+
+    def test_convert(self):
+        """Tests the conversion of plain numbers."""
+
+        for value in (-40, 0, 12.5, 100):
+            self.assertAlmostEqual(convert(value, Fahrenheit, Celsius), Celsius(Fahrenheit(value)).value, places=9)
+            self.assertAlmostEqual(convert(value, Celsius, Kelvin), Kelvin(Celsius(value)).value, places=9)
+            self.assertAlmostEqual(convert(value, Mile, CentiMeter), CentiMeter(Mile(value)).value, places=6)
+
+    def test_conversion_table(self):
+        """Tests the conversion table of a whole unit type."""
+
+        table = conversion_table(Temperature)
+        self.assertEqual(len(table), len(Temperature._units) ** 2)
+        self.assertIs(table[Fahrenheit, Celsius], conversion(Fahrenheit, Celsius))
+
+        with self.assertRaises(TypeError):
+            conversion_table(float)
+
+
+class TestScalarConversion(TestCase):
+    """Tests the plain number converters."""
+
+    def test_converter(self):
+        """Tests that the converters match the class path bit by bit."""
+
+        values = [-459.67, -40, -0.1, -0.0, 0, 0.1, 1, 12.5, 98.6, 1e12, 1234567, float('inf'), float('nan')]
+        pairs = [(Fahrenheit, Celsius), (Celsius, Fahrenheit), (Fahrenheit, Kelvin), (Mile, CentiMeter),
+                 (KiloMeter, Mile), (Meter, Meter), (Hour, Second), (Kelvin, Kelvin)]
+
+        for src, dst in pairs:
+            convert_value = converter(src, dst)
+            self.assertIs(convert_value, converter(src, dst))
+            self.assertEqual(convert_value.__name__, '{0}_to_{1}'.format(src.__name__, dst.__name__))
+            expected = [repr(dst(src(value)).value) for value in values]
+            # repr tells -0.0 from 0.0 and compares nan
+            self.assertEqual([repr(convert_value(value)) for value in values], expected)
+            self.assertEqual([repr(convert_scalar(value, src, dst)) for value in values], expected)
+            self.assertEqual([repr(value) for value in convert_list(values, src, dst)], expected)
+            self.assertEqual([repr(value) for value in list_converter(src, dst)(iter(values))], expected)
+            self.assertEqual([repr(value) for value in convert_iter(values, src, dst)], expected)
+
+        with self.assertRaises(TypeError):
+            converter(Meter, Celsius)
+        with self.assertRaises(TypeError):
+            convert_scalar(1, Celsius, float)
+        with self.assertRaises(TypeError):
+            convert_list([1], Meter, Celsius)
+        with self.assertRaises(TypeError):
+            convert_list(['1'], Meter, KiloMeter)
+
+    def test_generated_source(self):
+        """Tests that the constants are inlined and identity steps are left out."""
+
+        self.assertEqual(_expression((Fahrenheit.to_base, Celsius.from_base), {}),
+                         '0.5555555555555556 * x - 17.77777777777778')
+        self.assertEqual(_expression((Mile.to_base, CentiMeter.from_base), {}), '100.0 * (1609.344 * x + 0.0)')
+        self.assertEqual(_expression((Mile.to_base, Conversion(100)), {}), '100.0 * (1609.344 * x) + 0.0')
+        self.assertEqual(_expression((Conversion(2, 1), Conversion(1, 3)), {}), '2.0 * x + 1.0 + 3.0')
+        self.assertEqual(_expression((Conversion(1, 1), Conversion(1, -0.5)), {}), 'x + 1.0 - 0.5')
+
+        namespace = {}
+        self.assertEqual(_expression((Conversion(float('inf')),), namespace), '_c0 * x + 0.0')
+        self.assertEqual(namespace, {'_c0': float('inf')})
+
+        # the kernels of the conversions are shared
+        self.assertIs(_list_kernel(conversion(Mile, KiloMeter)), _list_kernel(conversion(Mile, KiloMeter)))
+        self.assertEqual(_list_kernel(Conversion(2, 1))([1, 2.5]), [3, 6])
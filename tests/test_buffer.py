@@ -0,0 +1,156 @@
+import io
+import sys
+from array import array
+from unittest import TestCase
+
+from pyUnitTypes.buffer import QuantityBuffer
+from pyUnitTypes.length import Meter, KiloMeter, Mile
+from pyUnitTypes.mass import KiloGram
+from pyUnitTypes.reductions import qsum
+from pyUnitTypes.temperature import Celsius, Fahrenheit, Kelvin
+
+
+class TestQuantityBuffer(TestCase):
+    """Tests for buffer.py module"""
+
+    def test_constructor(self):
+        celsius = QuantityBuffer([0, 100.0, Fahrenheit(212), Kelvin(0)], Celsius)
+        self.assertEqual(celsius.unit, Celsius)
+        self.assertIs(celsius.type, Celsius._type)
+        self.assertEqual(celsius.value.tolist(), [0, 100, 100, -273.15])
+        self.assertEqual(len(celsius), 4)
+        self.assertEqual(celsius.nbytes, 32)
+
+        self.assertEqual(QuantityBuffer(array('f', [1, 2]), Meter).value.tolist(), [1, 2])
+        self.assertEqual(QuantityBuffer((x / 2 for x in range(3)), Meter).value.tolist(), [0, 0.5, 1])
+        self.assertEqual(QuantityBuffer(QuantityBuffer([1, 2], KiloMeter), Meter).value.tolist(), [1000, 2000])
+
+        with self.assertRaises(TypeError):
+            QuantityBuffer([Meter(1)], Celsius)
+        with self.assertRaises(TypeError):
+            QuantityBuffer(['1'], Meter)
+        with self.assertRaises(TypeError):
+            QuantityBuffer([1], float)
+
+    def test_append_and_extend(self):
+        meters = QuantityBuffer([], Meter)
+        meters.append(1)
+        meters.append(KiloMeter(1))
+        meters.extend([2.5, Mile(1)])
+        meters.extend(QuantityBuffer([1], KiloMeter))
+        meters.extend(array('d', [3]))
+        self.assertEqual(meters.value.tolist(), [1, 1000, 2.5, 1609.344, 1000, 3])
+
+        with self.assertRaises(TypeError):
+            meters.append(KiloGram(1))
+        with self.assertRaises(TypeError):
+            meters.extend(QuantityBuffer([1], Celsius))
+
+        # views can't grow and the buffer can't grow while it is exported
+        with self.assertRaises(TypeError):
+            meters[1:].append(1)
+        with self.assertRaises(TypeError):
+            meters[1:].extend([1])
+        view = memoryview(meters.value)
+        with self.assertRaises(BufferError):
+            meters.append(1)
+        view.release()
+
+    def test_conversion(self):
+        fahrenheit = QuantityBuffer([32, 212, -40], Fahrenheit)
+
+        self.assertEqual(fahrenheit.to(Kelvin).unit, Kelvin)
+        for converted, value in zip(fahrenheit.to(Kelvin).value, fahrenheit.value):
+            self.assertEqual(converted, Kelvin(Fahrenheit(value)).value)
+        self.assertEqual(fahrenheit.value.tolist(), [32, 212, -40])
+
+        self.assertIs(fahrenheit.convert(Celsius), fahrenheit)
+        self.assertEqual(fahrenheit.unit, Celsius)
+        self.assertEqual([round(value, 9) for value in fahrenheit.value], [0, 100, -40])
+
+        miles = QuantityBuffer([1, 2], Mile)
+        self.assertEqual(miles.copy().convert(Mile).value.tolist(), [1, 2])
+        self.assertEqual(miles.to(KiloMeter).value.tolist(), [1.609344, 3.218688])
+
+        with self.assertRaises(TypeError):
+            miles.to(Celsius)
+        with self.assertRaises(TypeError):
+            miles.convert(Celsius)
+
+    def test_indexing(self):
+        meters = QuantityBuffer([1, 2, 3, 4], Meter)
+        self.assertEqual(meters[0], Meter(1))
+        self.assertIsInstance(meters[-1], Meter)
+        self.assertEqual(list(meters), [Meter(1), Meter(2), Meter(3), Meter(4)])
+
+        # slices share the values with the buffer
+        view = meters[::2]
+        self.assertIsInstance(view.value, memoryview)
+        self.assertEqual(view.value.tolist(), [1, 3])
+        view[:] = [KiloMeter(0.002), 3]
+        self.assertEqual(meters.value.tolist(), [2, 2, 3, 4])
+        del view
+
+        meters[1] = KiloMeter(1)
+        meters[2:] = [5, Meter(6), 7]
+        self.assertEqual(meters.value.tolist(), [2, 1000, 5, 6, 7])
+        self.assertEqual(meters[1:3].to(KiloMeter).value.tolist(), [1, 0.005])
+
+        with self.assertRaises(IndexError):
+            meters[5]
+        with self.assertRaises(TypeError):
+            meters[0] = Celsius(1)
+
+    def test_views_and_conversion(self):
+        celsius = QuantityBuffer([0, 100], Celsius)
+        view = celsius[1:]
+        nested = view[:]
+
+        # a view can't be converted in place, the rest of the buffer would keep its unit
+        with self.assertRaises(TypeError):
+            celsius[0:1].convert(Fahrenheit)
+        with self.assertRaises(TypeError):
+            nested.convert(Kelvin)
+        self.assertEqual(celsius.value.tolist(), [0, 100])
+        self.assertEqual(celsius.unit, Celsius)
+        self.assertEqual(view.to(Fahrenheit).value.tolist(), [212])
+
+        # views follow the in place conversion of their buffer
+        celsius.convert(Fahrenheit)
+        self.assertEqual(celsius.value.tolist(), [32, 212])
+        for converted in (view, nested):
+            self.assertEqual(converted.unit, Fahrenheit)
+            self.assertEqual(converted.value.tolist(), [212])
+            self.assertEqual(converted[0], Fahrenheit(212))
+            self.assertEqual(converted.to(Celsius).value.tolist(), [100])
+        view[0] = Celsius(0)
+        self.assertEqual(celsius.value.tolist(), [32, 32])
+
+        # views of an empty buffer have a parent as well
+        self.assertEqual(QuantityBuffer([], Meter)[:].unit, Meter)
+
+    def test_reductions(self):
+        fahrenheit = QuantityBuffer([32, 212, 50], Fahrenheit)
+        self.assertEqual(fahrenheit.sum(), qsum([Fahrenheit(32), Fahrenheit(212), Fahrenheit(50)]))
+        self.assertAlmostEqual(fahrenheit.mean().value, 98, places=9)
+        self.assertEqual(fahrenheit.min(), Fahrenheit(32))
+        self.assertEqual(fahrenheit.max(), Fahrenheit(212))
+        self.assertEqual(QuantityBuffer([], Meter).sum(), Meter(0))
+
+        for reduction in ('mean', 'min', 'max'):
+            with self.assertRaises(ValueError):
+                getattr(QuantityBuffer([], Meter), reduction)()
+
+    def test_buffer_protocol(self):
+        celsius = QuantityBuffer([21.5, 22, 19.25], Celsius)
+
+        file = io.BytesIO()
+        file.write(celsius.value)
+        if sys.version_info >= (3, 12):
+            self.assertEqual(bytes(celsius), file.getvalue())
+        self.assertEqual(len(file.getvalue()), celsius.nbytes)
+
+        restored = QuantityBuffer.from_bytes(file.getvalue(), Celsius)
+        self.assertEqual(restored.value, celsius.value)
+        self.assertEqual(restored.unit, Celsius)
+        self.assertEqual(bytes(celsius[1:].value), file.getvalue()[8:])
@@ -0,0 +1,119 @@
+from array import array
+from unittest import TestCase, skipIf
+
+from pyUnitTypes.arrays import QuantityArray, np
+from pyUnitTypes.basics import UnknownUnitMultiplicationError, UnknownUnitDivisionError
+from pyUnitTypes.buffer import QuantityBuffer
+from pyUnitTypes.expressions import LazyQuantity, lazy
+from pyUnitTypes.length import Meter, KiloMeter, Mile
+from pyUnitTypes.mass import KiloGram
+from pyUnitTypes.temperature import Celsius, Fahrenheit, Kelvin
+
+
+class TestLazyQuantity(TestCase):
+    """Tests for expressions.py module"""
+
+    def test_scalars(self):
+        x, y = Fahrenheit(50), Fahrenheit(68)
+
+        expression = (lazy(x) + y).to(Celsius) * 2
+        self.assertIsInstance(expression, LazyQuantity)
+        self.assertIs(expression.unit, Celsius)
+        self.assertIs(expression.type, Celsius._type)
+        self.assertAlmostEqual(expression.evaluate().value, 60, places=9)
+        self.assertIsInstance(expression.evaluate(), Celsius)
+
+        # the leaves are read on evaluation
+        x.value = 32
+        self.assertAlmostEqual(expression.evaluate().value, 40, places=9)
+
+        self.assertAlmostEqual((lazy(Mile(1)) + KiloMeter(1)).evaluate().value, 1 + 1 / 1.609344, places=12)
+        self.assertAlmostEqual((lazy(Meter(3)) - KiloMeter(0.001)).evaluate().value, 2, places=12)
+        self.assertEqual((1 - lazy(Meter(3)) * 2 / 4 + 0.5).evaluate(), Meter(0))
+        self.assertEqual((-lazy(Meter(3))).evaluate(), Meter(-3))
+        self.assertEqual((KiloMeter(1) + lazy(Meter(500))).evaluate(), Meter(1500))
+        self.assertIs((KiloMeter(1) + lazy(Meter(500))).unit, KiloMeter)
+        self.assertEqual((KiloMeter(1) - lazy(Meter(500))).evaluate(), Meter(500))
+        self.assertEqual((+lazy(2.5, Meter)).evaluate(), Meter(2.5))
+        self.assertAlmostEqual(lazy(Celsius(0)).to(Fahrenheit).to(Kelvin).evaluate().value, 273.15, places=9)
+
+    def test_simplification(self):
+        distance = Meter(2)
+
+        # conversions are composed and identity steps disappear
+        expression = lazy(distance).to(KiloMeter).to(Meter)
+        self.assertEqual(len(expression._terms), 1)
+        self.assertAlmostEqual(expression._terms[0][1], 1, places=15)
+        expression = lazy(distance)
+        self.assertIs(expression.to(Meter), expression)
+        self.assertIs(expression * 1, expression)
+
+        # the same leaf is merged into one term
+        expression = lazy(distance) + distance - distance * 1 + lazy(distance).to(KiloMeter)
+        self.assertEqual(len(expression._terms), 1)
+        self.assertEqual(expression._terms[0][1], 2)
+        self.assertEqual(expression.evaluate(), Meter(4))
+
+    def test_buffers(self):
+        kilometers = QuantityBuffer([1, 2], KiloMeter)
+        meters = QuantityBuffer([500, 250], Meter)
+
+        result = ((lazy(kilometers) + meters).to(Meter) + 1).evaluate()
+        self.assertIsInstance(result, QuantityBuffer)
+        self.assertIs(result.unit, Meter)
+        self.assertEqual(result.value.tolist(), [1501, 2251])
+        self.assertEqual(kilometers.value.tolist(), [1, 2])
+
+        self.assertEqual((meters + lazy(meters)).evaluate().value.tolist(), [1000, 500])
+        self.assertEqual((lazy(meters) - meters + 1).evaluate().value.tolist(), [1, 1])
+        self.assertEqual((lazy(meters) + array('d', [1, 2])).evaluate().value.tolist(), [501, 252])
+        self.assertEqual((lazy(meters) + Meter(1)).evaluate().value.tolist(), [501, 251])
+        self.assertEqual((lazy(meters[1:]) * 2).evaluate().value.tolist(), [500])
+        self.assertEqual(lazy([1.0, 2.0], Meter).to(KiloMeter).evaluate().value.tolist(), [0.001, 0.002])
+
+        with self.assertRaises(ValueError):
+            (lazy(meters) + meters[1:]).evaluate()
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_arrays(self):
+        fahrenheit = QuantityArray([32, 212, -40], Fahrenheit)
+        kelvin = QuantityArray([273.15, 373.15, 233.15], Kelvin)
+
+        result = ((lazy(fahrenheit) + kelvin).to(Celsius) * 2).evaluate()
+        eager = (fahrenheit + kelvin).to(Celsius) * 2
+        self.assertIsInstance(result, QuantityArray)
+        self.assertIs(result.unit, Celsius)
+        np.testing.assert_allclose(result.value, eager.value)
+
+        # like QuantityArray the difference is taken in the base unit
+        self.assertEqual((lazy(fahrenheit) - fahrenheit).evaluate().value.tolist(),
+                         (fahrenheit - fahrenheit).value.tolist())
+        self.assertEqual((lazy(kelvin) - kelvin).evaluate().value.tolist(), [273.15] * 3)
+        np.testing.assert_allclose((np.ones(3) + lazy(fahrenheit)).evaluate().value, [33, 213, -39])
+        np.testing.assert_allclose((lazy(np.array([1.0, 2.0]), KiloMeter) + QuantityBuffer([1, 2], Meter))
+                                   .evaluate().value, [1.001, 2.002])
+        np.testing.assert_allclose((lazy(np.array([1.0]), Meter) + np.array([1.0, 2.0])).evaluate().value, [2, 3])
+        self.assertEqual(lazy(fahrenheit).evaluate().value.tolist(), [32, 212, -40])
+        self.assertIsNot(lazy(fahrenheit).evaluate().value, fahrenheit.value)
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            lazy(1.0)
+        with self.assertRaises(TypeError):
+            lazy(1.0, float)
+        with self.assertRaises(TypeError):
+            lazy(Meter(1), KiloMeter)
+        with self.assertRaises(TypeError):
+            lazy(Meter(1)) + KiloGram(1)
+        with self.assertRaises(TypeError):
+            lazy(Meter(1)) + '1'
+        with self.assertRaises(TypeError):
+            lazy(Meter(1)).to(Celsius)
+        with self.assertRaises(UnknownUnitMultiplicationError):
+            lazy(Meter(1)) * Meter(1)
+        with self.assertRaises(UnknownUnitDivisionError):
+            lazy(Meter(1)) / Meter(1)
+        with self.assertRaises(UnknownUnitDivisionError):
+            1 / lazy(Meter(1))
+        with self.assertRaises(ZeroDivisionError):
+            lazy(Meter(1)) / 0
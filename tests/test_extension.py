@@ -0,0 +1,173 @@
+from unittest import TestCase, skipIf
+
+try:
+    import numpy as np
+    import pandas as pd
+    from pyUnitTypes.extension import UnitArray, UnitDtype
+except ImportError:  # pragma: no cover
+    pd = None
+
+from pyUnitTypes.area import SquareMeter
+from pyUnitTypes.basics import UnknownUnitMultiplicationError
+from pyUnitTypes.length import Meter, KiloMeter, Mile, Feet
+from pyUnitTypes.mass import KiloGram
+from pyUnitTypes.temperature import Celsius, Fahrenheit
+
+
+@skipIf(pd is None, 'pandas is not installed')
+class TestUnitDtype(TestCase):
+    """Tests for extension.py module"""
+
+    def test_dtype(self):
+        dtype = UnitDtype(Meter)
+        self.assertEqual(dtype.name, 'unit[Meter]')
+        self.assertIs(dtype.type, Meter)
+        self.assertEqual(dtype, UnitDtype(Meter))
+        self.assertNotEqual(dtype, UnitDtype(KiloMeter))
+        self.assertEqual(UnitDtype.construct_from_string('unit[km]'), UnitDtype(KiloMeter))
+        self.assertEqual(pd.api.types.pandas_dtype('unit[Meter]'), dtype)
+
+        with self.assertRaises(TypeError):
+            UnitDtype.construct_from_string('float64')
+        with self.assertRaises(TypeError):
+            UnitDtype(float)
+
+    def test_construction(self):
+        series = pd.Series(UnitArray.from_units([Meter(1), KiloMeter(2), None, Mile(1)]))
+        self.assertEqual(series.dtype, UnitDtype(Meter))
+        self.assertEqual(series[1], Meter(2000))
+        self.assertTrue(np.isnan(series[2]))
+        self.assertEqual(series.isna().tolist(), [False, False, True, False])
+
+        series = pd.Series([1.5, 2.5], dtype='unit[KiloMeter]')
+        self.assertEqual(series.tolist(), [KiloMeter(1.5), KiloMeter(2.5)])
+        self.assertEqual(series.array.nbytes, 16)
+
+        series = pd.Series([Meter(1), Feet(1)], dtype=UnitDtype(Feet))
+        self.assertAlmostEqual(series[0].value, Feet(Meter(1)).value)
+
+        with self.assertRaises(ValueError):
+            UnitArray.from_units([1.0, 2.0])
+        with self.assertRaises(TypeError):
+            UnitArray.from_units([Meter(1), KiloGram(1)])
+
+    def test_conversion(self):
+        series = pd.Series([0.0, 100.0], dtype=UnitDtype(Celsius))
+
+        fahrenheit = series.astype(UnitDtype(Fahrenheit))
+        self.assertEqual(fahrenheit.dtype, UnitDtype(Fahrenheit))
+        self.assertEqual(fahrenheit.array._data.tolist(), [32, 212])
+        self.assertEqual(series.astype('unit[Fahrenheit]').array._data.tolist(), [32, 212])
+        self.assertEqual(series.units.to(Fahrenheit).array._data.tolist(), [32, 212])
+        self.assertEqual(series.array.astype(Fahrenheit)._data.tolist(), [32, 212])
+
+        self.assertIs(series.units.unit, Celsius)
+        self.assertEqual(series.units.values.tolist(), [0, 100])
+        self.assertEqual(series.astype(float).tolist(), [0, 100])
+        self.assertEqual(series.astype(object).tolist(), [Celsius(0), Celsius(100)])
+
+        with self.assertRaises(TypeError):
+            series.astype(UnitDtype(Meter))
+        with self.assertRaises(AttributeError):
+            pd.Series([1.0]).units
+
+    def test_arithmetic_and_comparison(self):
+        meters = pd.Series([1.0, 2000.0, np.nan], dtype=UnitDtype(Meter))
+        kilometers = pd.Series([1.0, 1.0, 1.0], dtype=UnitDtype(KiloMeter))
+
+        total = meters + kilometers
+        self.assertEqual(total.dtype, UnitDtype(Meter))
+        self.assertEqual(total.array._data[:2].tolist(), [1001, 3000])
+        self.assertTrue(np.isnan(total.array._data[2]))
+
+        self.assertEqual((kilometers - meters).array._data[:2].tolist(), [0.999, -1])
+        self.assertEqual((meters * 2).array._data[:2].tolist(), [2, 4000])
+        self.assertEqual((2 * meters).array._data[:2].tolist(), [2, 4000])
+        self.assertEqual((meters / 2).array._data[:2].tolist(), [0.5, 1000])
+        self.assertEqual((-meters).array._data[:2].tolist(), [-1, -2000])
+
+        self.assertEqual((meters > kilometers).tolist(), [False, True, False])
+        self.assertEqual((meters == KiloMeter(2)).tolist(), [False, True, False])
+        self.assertEqual((meters != KiloGram(2)).tolist(), [True, True, True])
+
+        with self.assertRaises(TypeError):
+            meters + pd.Series([1.0, 1.0, 1.0], dtype=UnitDtype(KiloGram))
+        with self.assertRaises(UnknownUnitMultiplicationError):
+            meters * pd.Series([1.0, 1.0, 1.0], dtype=UnitDtype(Celsius))
+
+        # products and quotients of quantities are of the derived unit types
+        area = meters * kilometers
+        self.assertEqual(area.dtype, UnitDtype(SquareMeter))
+        self.assertEqual(area.array._data[:2].tolist(), [1000, 2000000])
+        self.assertEqual((kilometers * Meter(2)).array._data.tolist(), [2000] * 3)
+        self.assertEqual((area / kilometers).dtype, UnitDtype(Meter))
+        self.assertEqual((meters / kilometers).tolist()[:2], [0.001, 2])
+        self.assertEqual((KiloMeter(2) / kilometers.array).tolist(), [2, 2, 2])
+
+    def test_reductions(self):
+        series = pd.Series([1.0, 2.0, np.nan, 4.0], dtype=UnitDtype(KiloMeter))
+
+        self.assertEqual(series.sum(), KiloMeter(7))
+        self.assertEqual(series.mean(), KiloMeter(7 / 3))
+        self.assertEqual(series.min(), KiloMeter(1))
+        self.assertEqual(series.max(), KiloMeter(4))
+        self.assertEqual(series.median(), KiloMeter(2))
+        self.assertAlmostEqual(series.std().value, np.std([1, 2, 4], ddof=1))
+        self.assertEqual(series.quantile(0.5), KiloMeter(2))
+        self.assertEqual(series.cumsum().array._data[[0, 1, 3]].tolist(), [1, 3, 7])
+        self.assertEqual(series.cummax().array._data[[0, 1, 3]].tolist(), [1, 2, 4])
+
+        with self.assertRaises(TypeError):
+            series.prod()
+        with self.assertRaises(TypeError):
+            series.var()
+
+    def test_groupby_and_concat(self):
+        frame = pd.DataFrame({
+            'device': ['a', 'b', 'a', 'b'],
+            'distance': pd.Series([1.0, 2.0, 3.0, 4.0], dtype=UnitDtype(KiloMeter)),
+        })
+
+        grouped = frame.groupby('device')['distance']
+        for name, expected in (('sum', [4, 6]), ('mean', [2, 3]), ('min', [1, 2]), ('max', [3, 4]),
+                               ('first', [1, 2]), ('last', [3, 4])):
+            result = grouped.agg(name)
+            self.assertEqual(result.dtype, UnitDtype(KiloMeter), name)
+            self.assertEqual(result.array._data.tolist(), expected, name)
+        self.assertEqual(grouped.std().array._data.tolist(), [np.sqrt(2), np.sqrt(2)])
+        self.assertEqual(grouped.cumsum().array._data.tolist(), [1, 2, 4, 6])
+        self.assertEqual(grouped.rank().tolist(), [1, 1, 2, 2])
+        with self.assertRaises(TypeError):
+            grouped.prod()
+
+        # missing values are skipped like in float64 columns
+        frame.loc[1, 'distance'] = np.nan
+        grouped = frame.groupby('device')['distance']
+        self.assertEqual(grouped.sum().array._data.tolist(), [4, 4])
+        self.assertEqual(grouped.mean().array._data.tolist(), [2, 4])
+        self.assertEqual(grouped.cumsum().array._data[[0, 2, 3]].tolist(), [1, 4, 4])
+        self.assertTrue(np.isnan(grouped.cumsum().array._data[1]))
+        self.assertEqual(grouped.any().tolist(), [True, True])
+        self.assertEqual(grouped.any().dtype, bool)
+        self.assertEqual(grouped.idxmax().tolist(), [2, 3])
+        frame.loc[1, 'distance'] = KiloMeter(2)
+
+        concatenated = pd.concat([frame['distance'], pd.Series([500.0], dtype=UnitDtype(Meter))], ignore_index=True)
+        self.assertEqual(concatenated.dtype, UnitDtype(KiloMeter))
+        self.assertEqual(concatenated.array._data.tolist(), [1, 2, 3, 4, 0.5])
+
+        mixed = pd.concat([frame['distance'], pd.Series([1.0], dtype=UnitDtype(KiloGram))])
+        self.assertEqual(mixed.dtype, object)
+
+    def test_missing_values_and_sorting(self):
+        series = pd.Series([3.0, np.nan, 1.0], dtype=UnitDtype(Meter))
+
+        self.assertEqual(series.dropna().tolist(), [Meter(3), Meter(1)])
+        self.assertEqual(series.fillna(KiloMeter(1)).tolist(), [Meter(3), Meter(1000), Meter(1)])
+        self.assertEqual(series.sort_values().tolist()[:2], [Meter(1), Meter(3)])
+        self.assertEqual(len(series.unique()), 3)
+        self.assertEqual(series.value_counts().tolist(), [1, 1])
+
+        series[0] = KiloMeter(2)
+        series[1] = 5
+        self.assertEqual(series.tolist(), [Meter(2000), Meter(5), Meter(1)])
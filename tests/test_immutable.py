@@ -0,0 +1,110 @@
+import copy
+import math
+import pickle
+from unittest import TestCase
+
+from pyUnitTypes.immutable import FrozenUnit, frozen, freeze
+from pyUnitTypes.length import Meter, CentiMeter, Feet
+from pyUnitTypes.speed import MeterPerSecond
+from pyUnitTypes.temperature import Celsius
+from pyUnitTypes.time import Second
+
+
+class TestFrozenUnit(TestCase):
+    """Tests for the immutable unit classes."""
+
+    def test_frozen(self):
+        """Tests the creation of the frozen unit classes."""
+
+        FrozenMeter = frozen(Meter)
+        self.assertIs(frozen(Meter), FrozenMeter)
+        self.assertIs(frozen(FrozenMeter), FrozenMeter)
+        self.assertTrue(issubclass(FrozenMeter, Meter))
+        self.assertTrue(issubclass(FrozenMeter, FrozenUnit))
+        self.assertEqual(FrozenMeter.symbol, 'm')
+
+        # the frozen classes are no additional units of the unit type
+        self.assertNotIn(FrozenMeter, Meter._type._units)
+
+        self.assertEqual(frozen(CentiMeter)(Meter(1)), CentiMeter(100))
+        self.assertEqual(freeze(Meter(2)), Meter(2))
+        self.assertIsInstance(freeze(Meter(2)), FrozenMeter)
+
+        with self.assertRaises(TypeError):
+            frozen(float)
+        with self.assertRaises(TypeError):
+            frozen(Meter)('1')
+        with self.assertRaises(TypeError):
+            frozen(Meter)(Celsius(1))
+
+    def test_immutable(self):
+        """Tests that the operators do not change the frozen objects."""
+
+        meter = frozen(Meter)(2)
+
+        self.assertEqual(meter + 1, 3)
+        self.assertEqual(1 + meter, 3)
+        self.assertEqual(meter - 1, 1)
+        self.assertEqual(3 - meter, 1)
+        self.assertEqual(meter * 2, 4)
+        self.assertEqual(2 * meter, 4)
+        self.assertEqual(meter / 2, 1)
+        self.assertEqual(-meter, -2)
+        self.assertEqual(abs(frozen(Meter)(-2)), 2)
+        self.assertEqual(round(frozen(Meter)(1.6)), 2)
+        self.assertEqual(math.floor(frozen(Meter)(1.6)), 1)
+        self.assertEqual(math.ceil(frozen(Meter)(1.6)), 2)
+        self.assertEqual(meter + CentiMeter(50), Meter(2.5))
+        self.assertIsInstance(meter / Second(1), frozen(MeterPerSecond))
+        self.assertEqual(meter, 2)
+
+        other = meter
+        other += 1
+        other *= 2
+        self.assertEqual(other, 6)
+        self.assertEqual(meter, 2)
+
+        with self.assertRaises(AttributeError):
+            meter.value = 1
+        with self.assertRaises(AttributeError):
+            meter._value = 1
+
+        self.assertIs(copy.copy(meter), meter)
+        self.assertIs(copy.deepcopy(meter), meter)
+
+    def test_hash(self):
+        """Tests that equal frozen objects have the same hash."""
+
+        self.assertEqual(hash(frozen(Meter)(1)), hash(frozen(CentiMeter)(100)))
+        self.assertEqual(hash(frozen(Meter)(0.3048)), hash(frozen(Feet)(1)))
+        self.assertEqual(len({frozen(Meter)(1), frozen(CentiMeter)(100), frozen(Meter)(2)}), 2)
+        self.assertEqual({frozen(Meter)(1): 'a'}[frozen(CentiMeter)(100)], 'a')
+
+        with self.assertRaises(TypeError):
+            hash(Meter(1))
+
+    def test_intern(self):
+        """Tests the interning of frequently used values."""
+
+        FrozenCelsius = frozen(Celsius)
+        self.assertIs(FrozenCelsius(0), FrozenCelsius(0.0))
+        self.assertIs(FrozenCelsius(1), FrozenCelsius(1))
+        self.assertIsNot(FrozenCelsius(21.5), FrozenCelsius(21.5))
+
+        setpoint, = FrozenCelsius.intern(21.5)
+        self.assertIs(FrozenCelsius(21.5), setpoint)
+        self.assertEqual(setpoint, 21.5)
+
+        # the sign of -0.0 is kept like by the mutable units, it's never the interned 0.0
+        for zero in (FrozenCelsius(-0.0), FrozenCelsius.intern(-0.0)[0]):
+            self.assertEqual(math.copysign(1.0, zero.value), math.copysign(1.0, Celsius(-0.0).value))
+            self.assertIsNot(zero, FrozenCelsius(0.0))
+        self.assertEqual(math.copysign(1.0, FrozenCelsius(0.0).value), 1.0)
+        self.assertEqual(math.copysign(1.0, frozen(Meter)(-0.0).value), -1.0)
+
+    def test_pickle(self):
+        """Tests pickling of frozen objects."""
+
+        meter = frozen(Meter)(2.5)
+        self.assertEqual(pickle.loads(pickle.dumps(meter)), meter)
+        self.assertIs(pickle.loads(pickle.dumps(frozen(Meter)(0))), frozen(Meter)(0))
@@ -0,0 +1,80 @@
+from io import StringIO
+from unittest import TestCase
+
+from pyUnitTypes.basics import UnknownUnitError
+from pyUnitTypes.io import convert_stream, convert_file
+from pyUnitTypes.length import Meter, Mile
+from pyUnitTypes.mass import KiloGram, Pound
+from pyUnitTypes.temperature import Celsius, Fahrenheit
+
+CSV = """time,temp,distance,weight
+1,32,1,1
+2,212,2,
+3,-40,0.5,2
+"""
+
+
+class TestConvertStream(TestCase):
+    """Tests the streaming conversion of rows."""
+
+    def test_rows(self):
+        """Tests the conversion of an iterable of rows."""
+
+        rows = [{'temp': 32, 'id': 'a'}, {'temp': 212, 'id': 'b'}]
+        converted = list(convert_stream(rows, {'temp': (Fahrenheit, Celsius)}))
+        self.assertEqual([row['id'] for row in converted], ['a', 'b'])
+        self.assertAlmostEqual(converted[0]['temp'], 0)
+        self.assertAlmostEqual(converted[1]['temp'], 100)
+
+        # the input rows are not changed
+        self.assertEqual(rows[0]['temp'], 32)
+
+        # sequences
+        converted = list(convert_stream([(1, 'x'), (2, 'y')], {0: ('Mi', 'm')}))
+        self.assertEqual(converted, [[1609.344, 'x'], [3218.688, 'y']])
+
+    def test_chunks(self):
+        """Tests that the stream is consumed chunk by chunk."""
+
+        consumed = []
+
+        def source():
+            for i in range(10):
+                consumed.append(i)
+                yield {'d': i}
+
+        stream = convert_stream(source(), {'d': (Meter, Meter)}, chunk_size=4)
+        self.assertEqual(next(stream), {'d': 0})
+        self.assertEqual(len(consumed), 4)
+        self.assertEqual(len(list(stream)), 9)
+
+        with self.assertRaises(ValueError):
+            list(convert_stream([], {}, chunk_size=0))
+
+    def test_files(self):
+        """Tests the conversion of csv and ndjson files."""
+
+        columns = {'temp': ('°F', Celsius), 'distance': (Mile, Meter), 'weight': (Pound, KiloGram)}
+        rows = list(convert_stream(StringIO(CSV), columns, chunk_size=2))
+        self.assertEqual([row['time'] for row in rows], ['1', '2', '3'])
+        self.assertAlmostEqual(rows[1]['temp'], 100)
+        self.assertAlmostEqual(rows[2]['distance'], 804.672)
+        self.assertEqual(rows[1]['weight'], '')
+
+        target = StringIO()
+        self.assertEqual(convert_file(StringIO(CSV), target, columns), 3)
+        lines = target.getvalue().splitlines()
+        self.assertEqual(lines[0], 'time,temp,distance,weight')
+        self.assertEqual(len(lines), 4)
+
+        ndjson = StringIO('{"t": 32}\n\n{"t": 212}\n')
+        target = StringIO()
+        self.assertEqual(convert_file(ndjson, target, {'t': (Fahrenheit, Celsius)}, format='ndjson'), 2)
+        self.assertEqual(target.getvalue(), '{"t": 0.0}\n{"t": 100.0}\n')
+
+        with self.assertRaises(ValueError):
+            list(convert_stream(StringIO(CSV), columns, format='xml'))
+        with self.assertRaises(UnknownUnitError):
+            list(convert_stream(StringIO(CSV), {'temp': ('°X', Celsius)}))
+        with self.assertRaises(TypeError):
+            list(convert_stream(StringIO(CSV), {'temp': (Fahrenheit, Meter)}))
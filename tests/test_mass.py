@@ -33,8 +33,8 @@ class TestTimes(TestCase):
         self.assertEqual(KiloGram(1000), Tonne(1))
         self.assertEqual(Gram(1000), KiloGram(1))
         self.assertEqual(MilliGram(1000), Gram(1))
-        self.assertAlmostEqual(MicroGram(1000), MilliGram(1), places=prec)
-        self.assertAlmostEqual(KiloGram(1), Pound(2.204623), places=prec)
-        self.assertAlmostEqual(Pound(2240), Ton(1), places=3)
-        self.assertAlmostEqual(Pound(2000), ShortTon(1), places=4)
-        self.assertAlmostEqual(Pound(1), Ounce(16), places=prec)
+        self.assertAlmostEqual(MicroGram(1000).base_value, MilliGram(1).base_value, places=prec)
+        self.assertAlmostEqual(KiloGram(1).base_value, Pound(2.204623).base_value, places=prec)
+        self.assertAlmostEqual(Pound(2240).base_value, Ton(1).base_value, places=3)
+        self.assertAlmostEqual(Pound(2000).base_value, ShortTon(1).base_value, places=4)
+        self.assertAlmostEqual(Pound(1).base_value, Ounce(16).base_value, places=prec)
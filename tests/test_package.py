@@ -0,0 +1,66 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+import pyUnitTypes
+from pyUnitTypes import basics, expressions, length
+
+
+class TestPackage(TestCase):
+    """Tests the lazy loading of the pyUnitTypes package."""
+
+    def test_lazy_import(self):
+        """Tests that importing the package does not import any of its modules."""
+
+        code = 'import sys, pyUnitTypes; print(sorted(m for m in sys.modules if m.startswith("pyUnitTypes.")))'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.decode().strip(), '[]')
+
+        code = 'import sys, pyUnitTypes; pyUnitTypes.Celsius; ' \
+               'print(sorted(m for m in sys.modules if m.startswith("pyUnitTypes.")))'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.decode().strip(), "['pyUnitTypes.basics', 'pyUnitTypes.temperature']")
+
+    def test_attributes(self):
+        """Tests the access of the classes and functions through the package."""
+
+        self.assertIs(pyUnitTypes.Meter, length.Meter)
+        self.assertIs(pyUnitTypes.CentiMeter, length.CentiMeter)
+        self.assertIs(pyUnitTypes.convert, basics.convert)
+        self.assertIs(pyUnitTypes.length, length)
+        self.assertIs(pyUnitTypes.lazy, expressions.lazy)
+        self.assertIn('Meter', dir(pyUnitTypes))
+
+        with self.assertRaises(AttributeError):
+            pyUnitTypes._unknown
+
+    def test_index(self):
+        """Tests that the static index matches the modules."""
+
+        for name, module_name in pyUnitTypes._INDEX.items():
+            self.assertTrue(hasattr(getattr(pyUnitTypes, module_name), name), name)
+
+        self.assertEqual(pyUnitTypes._SI_PREFIX_NAMES, tuple(name for name, _, _ in basics.SI_PREFIXES))
+
+        # every unit of the unit modules is reachable through the package
+        for module_name in ('current', 'length', 'luminous', 'mass', 'substance', 'temperature', 'time'):
+            module = getattr(pyUnitTypes, module_name)
+            names = getattr(module, '__all__', [name for name in vars(module) if not name.startswith('_')])
+            for name in names:
+                attribute = getattr(module, name)
+                if isinstance(attribute, type) and issubclass(attribute, basics.BaseUnit):
+                    self.assertIs(getattr(pyUnitTypes, name), attribute)
+
+    def test_lazy_si_units(self):
+        """Tests that the SI prefixed units are only created when they are used."""
+
+        code = 'import pyUnitTypes.length as length; print("YoctoMeter" in vars(length)); length.YoctoMeter; ' \
+               'print("YoctoMeter" in vars(length)); print(length.YoctoMeter is length.YoctoMeter)'
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.decode().split(), ['False', 'True', 'True'])
+
+        self.assertEqual(pyUnitTypes.KiloAmpere.symbol, 'kA')
+        self.assertEqual(pyUnitTypes.MilliMole.to_base, basics.Conversion(1e-3))
+        self.assertEqual(pyUnitTypes.MegaGram.to_base, basics.Conversion(1e3))
+        with self.assertRaises(AttributeError):
+            length.KiloGram
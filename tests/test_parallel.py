@@ -0,0 +1,73 @@
+from array import array
+from multiprocessing import shared_memory
+from unittest import TestCase, skipIf
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyUnitTypes.basics import convert
+from pyUnitTypes.length import Meter, KiloMeter
+from pyUnitTypes.mass import KiloGram, Pound
+from pyUnitTypes.parallel import ParallelConverter, convert_parallel
+from pyUnitTypes.temperature import Fahrenheit, Kelvin
+
+
+class TestParallelConverter(TestCase):
+    """Tests for parallel.py module"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.converter = ParallelConverter(workers=2, chunk_size=100)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.converter.shutdown()
+
+    def test_convert_array(self):
+        values = array('d', range(1050))
+        result = self.converter.convert(values, Fahrenheit, Kelvin)
+        self.assertIsInstance(result, array)
+        self.assertEqual(len(result), len(values))
+        for value, converted in zip(values, result):
+            self.assertAlmostEqual(converted, convert(value, Fahrenheit, Kelvin))
+
+        # the input is not changed
+        self.assertEqual(values[1], 1)
+
+        # iterables and small buffers
+        self.assertEqual(list(self.converter.convert([1.0, 2.0], KiloMeter, Meter)), [1000, 2000])
+        self.assertEqual(self.converter.convert([], KiloMeter, Meter), array('d'))
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_convert_numpy(self):
+        values = np.arange(2000.0).reshape(40, 50)
+        result = self.converter.convert(values, Pound, KiloGram)
+        self.assertEqual(result.shape, (40, 50))
+        np.testing.assert_allclose(result, values * 0.45359237)
+        self.assertEqual(values[0, 1], 1)
+
+        np.testing.assert_allclose(convert_parallel(values[:, 0], KiloMeter, Meter, workers=1, chunk_size=7),
+                                   values[:, 0] * 1000)
+
+    def test_convert_shared(self):
+        block = shared_memory.SharedMemory(create=True, size=8 * 1000)
+        try:
+            values = block.buf.cast('d')
+            for index in range(1000):
+                values[index] = index
+            self.assertEqual(self.converter.convert_shared(block, KiloMeter, Meter, length=900), 900)
+            self.assertEqual(values[899], 899000)
+            self.assertEqual(values[900], 900)
+            values.release()
+
+            with self.assertRaises(ValueError):
+                self.converter.convert_shared(block, KiloMeter, Meter, length=1001)
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ParallelConverter(chunk_size=0)
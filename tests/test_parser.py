@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from pyUnitTypes.basics import Conversion, UnknownUnitError, unregister_unit
+from pyUnitTypes.parser import parse, parse_unit
+from pyUnitTypes.length import Length, Meter, KiloMeter, MilliMeter, MicroMeter, MegaMeter, Mile, Yard
+from pyUnitTypes.mass import Gram, KiloGram, Pound
+from pyUnitTypes.temperature import Celsius, Fahrenheit, Kelvin
+from pyUnitTypes.time import Hour, Second
+
+
+class TestParser(TestCase):
+    """Tests the parsing of units and quantities from strings."""
+
+    def test_parse_unit(self):
+        """Tests the lookup of the unit classes by name and symbol."""
+
+        # symbols
+        self.assertIs(parse_unit('m'), Meter)
+        self.assertIs(parse_unit('km'), KiloMeter)
+        self.assertIs(parse_unit('mm'), MilliMeter)
+        self.assertIs(parse_unit('Mm'), MegaMeter)
+        self.assertIs(parse_unit('μm'), MicroMeter)
+        self.assertIs(parse_unit('µm'), MicroMeter)
+        self.assertIs(parse_unit('Mi'), Mile)
+        self.assertIs(parse_unit('yrd'), Yard)
+        self.assertIs(parse_unit('°F'), Fahrenheit)
+        self.assertIs(parse_unit('K'), Kelvin)
+        self.assertIs(parse_unit('g'), Gram)
+        self.assertIs(parse_unit('kg'), KiloGram)
+        self.assertIs(parse_unit('lbs'), Pound)
+        self.assertIs(parse_unit('h'), Hour)
+        self.assertIs(parse_unit(' s '), Second)
+
+        # names
+        self.assertIs(parse_unit('KiloMeter'), KiloMeter)
+        self.assertIs(parse_unit('kilometer'), KiloMeter)
+        self.assertIs(parse_unit('Celsius'), Celsius)
+        self.assertIs(parse_unit('Second'), Second)
+
+        with self.assertRaises(UnknownUnitError):
+            parse_unit('parsec')
+        with self.assertRaises(TypeError):
+            parse_unit(1)
+
+    def test_cache(self):
+        """Tests that the parsed units are cached."""
+
+        parse_unit.cache_clear()
+        for _ in range(100):
+            parse_unit('km')
+        info = parse_unit.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 99)
+        self.assertIsNotNone(info.maxsize)
+
+    def test_new_units(self):
+        """Tests that units defined after the first parsing are found."""
+
+        parse_unit('m')
+
+        class Furlong(Length):
+            """An eighth of a mile."""
+
+            name = 'Furlong'
+            symbol = 'fur'
+            to_base = Conversion(201.168)
+
+        self.addCleanup(unregister_unit, Furlong)
+        self.assertIs(parse_unit('fur'), Furlong)
+
+    def test_parse(self):
+        """Tests the parsing of quantities."""
+
+        self.assertEqual(parse('12.5 KiloMeter'), KiloMeter(12.5))
+        self.assertIsInstance(parse('12.5 KiloMeter'), KiloMeter)
+        self.assertEqual(parse('12.5km'), Meter(12500))
+        self.assertEqual(parse('-40 °F'), Celsius(-40))
+        self.assertEqual(parse('+.5 m'), Meter(0.5))
+        self.assertEqual(parse('1e3 mm'), Meter(1))
+        self.assertEqual(parse('  3 h  '), Hour(3))
+
+        with self.assertRaises(ValueError):
+            parse('km')
+        with self.assertRaises(ValueError):
+            parse('12.5')
+        with self.assertRaises(UnknownUnitError):
+            parse('12.5 parsec')
+        with self.assertRaises(TypeError):
+            parse(12.5)
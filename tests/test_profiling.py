@@ -0,0 +1,160 @@
+import threading
+from unittest import TestCase
+
+import pyUnitTypes
+from pyUnitTypes.arrays import QuantityArray
+from pyUnitTypes.basics import BaseUnit, UnknownUnitDivisionError, convert, convert_list, convert_scalar, converter
+from pyUnitTypes.buffer import QuantityBuffer
+from pyUnitTypes.immutable import FrozenUnit, frozen
+from pyUnitTypes.length import Meter, KiloMeter, Mile
+from pyUnitTypes.mass import KiloGram
+from pyUnitTypes.temperature import Celsius, Fahrenheit
+from pyUnitTypes import profiling
+from pyUnitTypes.profiling import ProfileStats, disable_profiling, enable_profiling, profile
+from pyUnitTypes.time import Second
+
+
+class TestProfiling(TestCase):
+    """Tests for profiling.py module"""
+
+    def test_counters(self):
+        with profile() as stats:
+            distance = Meter(Mile(1))
+            distance = distance + KiloMeter(1)
+            distance += 2
+            distance = 1 - distance
+            -distance
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['constructions'], {'Mile': 1, 'Meter': 2, 'KiloMeter': 1})
+        self.assertEqual(snapshot['conversions'], {'Mile->Meter': 1})
+        # __rsub__ is implemented by other operators, but counted once
+        self.assertEqual(snapshot['operations'], {'Meter.__add__': 1, 'Meter.__iadd__': 1, 'Meter.__rsub__': 1,
+                                                  'Meter.__neg__': 1})
+        self.assertEqual(snapshot['errors'], {})
+        self.assertEqual(snapshot['timings'], {})
+
+        # nothing is counted after the block
+        Meter(1) + Meter(2)
+        self.assertEqual(stats.constructions['Meter'], 2)
+
+    def test_errors(self):
+        with profile() as stats:
+            with self.assertRaises(TypeError):
+                Meter(1) + KiloGram(1)
+            with self.assertRaises(TypeError):
+                Meter('1')
+            with self.assertRaises(UnknownUnitDivisionError):
+                1 / Second(1)
+
+        self.assertEqual(stats.errors, {'TypeError': 2, 'UnknownUnitDivisionError': 1})
+
+    def test_comparisons(self):
+        with profile() as stats:
+            self.assertLess(Meter(1), KiloMeter(1))
+            self.assertTrue(Meter(1) >= 1)
+            self.assertEqual(Meter(1000), KiloMeter(1))
+            self.assertFalse(Meter(1) != Meter(1))
+            with self.assertRaises(TypeError):
+                Meter(1) < Celsius(1)
+
+        self.assertEqual(stats.operations, {('Meter', '__lt__'): 2, ('Meter', '__ge__'): 1, ('Meter', '__eq__'): 1,
+                                            ('Meter', '__ne__'): 1})
+        self.assertEqual(stats.errors, {'TypeError': 1})
+
+    def test_thread_state(self):
+        failed = threading.Event()
+        stopped = threading.Event()
+        states = []
+
+        def worker():
+            try:
+                Meter(1) + KiloGram(1)
+            except TypeError:
+                pass
+            states.append(getattr(profiling._state, 'error', None))
+            failed.set()
+            stopped.wait()
+            states.append(getattr(profiling._state, 'error', None))
+
+        with profile() as stats:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            failed.wait()
+        stopped.set()
+        thread.join()
+
+        # the state of the other thread is reset as well, it doesn't keep the error alive
+        self.assertEqual(stats.errors, {'TypeError': 1})
+        self.assertIsInstance(states[0], TypeError)
+        self.assertIsNone(states[1])
+
+    def test_timing(self):
+        with profile(timing=True) as stats:
+            Meter(1) * 2
+
+        timings = stats.snapshot()['timings']
+        self.assertEqual(sum(timings['construction'].values()), 1)
+        self.assertEqual(sum(timings['__mul__'].values()), 1)
+        for bucket in timings['__mul__']:
+            self.assertEqual(bucket & (bucket - 1), 0)
+
+        stats.reset()
+        self.assertEqual(stats.snapshot()['timings'], {})
+
+    def test_arrays_and_frozen_units(self):
+        with profile() as stats:
+            QuantityArray([1.0, 2.0], Meter).to(KiloMeter)
+            FrozenMeter = frozen(Meter)
+            FrozenMeter(3) + FrozenMeter(4)
+
+        self.assertEqual(stats.conversions['Meter', 'KiloMeter'], 1)
+        self.assertEqual(stats.constructions['FrozenMeter'], 3)
+        self.assertEqual(stats.operations['FrozenMeter', '__add__'], 1)
+
+    def test_plain_conversions(self):
+        with profile() as stats:
+            self.assertEqual(convert_scalar(212, Fahrenheit, Celsius), 100)
+            convert_scalar(32, Fahrenheit, Celsius)
+            convert(1, Mile, Meter)
+            convert_list([1, 2], KiloMeter, Meter)
+            to_meter = converter(Mile, Meter)
+            to_meter(1)
+            to_meter(2)
+            QuantityBuffer([1, 2], Meter).convert(KiloMeter)
+            with self.assertRaises(TypeError):
+                QuantityArray([1.0], Meter).to(Celsius)
+            with self.assertRaises(TypeError):
+                convert_scalar(1, Meter, Celsius)
+
+        # a converter is counted once when it is handed out, not per call
+        self.assertEqual(stats.snapshot()['conversions'], {'Fahrenheit->Celsius': 2, 'Mile->Meter': 2,
+                                                           'KiloMeter->Meter': 1, 'Meter->KiloMeter': 1})
+        self.assertEqual(stats.errors['TypeError'], 2)
+
+        # the converters handed out while profiling are the plain generated ones
+        self.assertIs(converter(Mile, Meter), to_meter)
+        self.assertFalse(hasattr(to_meter, '__wrapped__'))
+
+    def test_enable_and_disable(self):
+        init = BaseUnit.__dict__['__init__']
+        add = FrozenUnit.__dict__['__add__']
+
+        outer = enable_profiling()
+        self.assertIsInstance(outer, ProfileStats)
+        self.assertIsNot(BaseUnit.__dict__['__init__'], init)
+        with self.assertRaises(ValueError):
+            enable_profiling(outer)
+
+        with pyUnitTypes.profile() as inner:
+            Meter(1)
+        Meter(2)
+        disable_profiling(outer)
+        disable_profiling(outer)
+
+        self.assertEqual(inner.constructions['Meter'], 1)
+        self.assertEqual(outer.constructions['Meter'], 2)
+
+        # the unit classes run without wrappers again
+        self.assertIs(BaseUnit.__dict__['__init__'], init)
+        self.assertIs(FrozenUnit.__dict__['__add__'], add)
@@ -0,0 +1,65 @@
+import math
+from unittest import TestCase
+
+from pyUnitTypes.length import Meter, KiloMeter, Mile, Yard
+from pyUnitTypes.reductions import qsum, qmean, qmin, qmax, qstd
+from pyUnitTypes.temperature import Celsius, Fahrenheit
+
+
+class TestReductions(TestCase):
+    """Tests for reductions.py module"""
+
+    def setUp(self):
+        self.values = [Mile(1), Yard(100), KiloMeter(2)]
+        self.meters = [1609.344, 91.4399909, 2000]
+
+    def test_qsum(self):
+        self.assertAlmostEqual(qsum(self.values, Meter).value, sum(self.meters))
+        self.assertIsInstance(qsum(self.values), Mile)
+        self.assertAlmostEqual(qsum(self.values).value, sum(self.meters) / 1609.344)
+        self.assertEqual(qsum([], Meter), Meter(0))
+        self.assertEqual(qsum(iter([Meter(1), Meter(2)])), Meter(3))
+
+        # compensated summation
+        self.assertEqual(qsum([Meter(1e16), Meter(1), Meter(-1e16)]).value, 1)
+
+        # the quantities are not changed
+        self.assertEqual(self.values, [Mile(1), Yard(100), KiloMeter(2)])
+
+    def test_qmean(self):
+        self.assertAlmostEqual(qmean(self.values, Meter).value, sum(self.meters) / 3)
+        self.assertEqual(qmean([Celsius(0), Fahrenheit(212)], Celsius), Celsius(50))
+        self.assertEqual(qmean(iter([Meter(1), Meter(2)])), Meter(1.5))
+
+    def test_qmin_qmax(self):
+        self.assertIsInstance(qmin(self.values), Mile)
+        self.assertAlmostEqual(qmin(self.values, Meter).value, 91.4399909)
+        self.assertEqual(qmax(self.values, Meter), Meter(2000))
+        self.assertEqual(qmax([Meter(-1)]), Meter(-1))
+
+    def test_qstd(self):
+        mean = sum(self.meters) / 3
+        std = math.sqrt(sum((value - mean) ** 2 for value in self.meters) / 3)
+        self.assertAlmostEqual(qstd(self.values, Meter).value, std)
+        self.assertAlmostEqual(qstd(self.values, Meter, ddof=1).value, std * math.sqrt(3 / 2))
+        self.assertEqual(qstd([Meter(1)]), Meter(0))
+
+        # only the factor of the unit is applied
+        self.assertAlmostEqual(qstd([Celsius(0), Celsius(2)], Fahrenheit).value, 1.8)
+
+        with self.assertRaises(ValueError):
+            qstd([Meter(1)], ddof=1)
+
+    def test_errors(self):
+        for function in (qsum, qmean, qmin, qmax, qstd):
+            with self.assertRaises(ValueError):
+                function([])
+            with self.assertRaises(TypeError):
+                function([Meter(1), Celsius(1)])
+            with self.assertRaises(TypeError):
+                function([Meter(1), 1.0])
+            with self.assertRaises(TypeError):
+                function([1.0])
+        for function in (qmean, qmin, qmax, qstd):
+            with self.assertRaises(ValueError):
+                function([], Meter)
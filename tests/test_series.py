@@ -0,0 +1,133 @@
+from unittest import TestCase, skipIf
+
+from pyUnitTypes.arrays import QuantityArray
+from pyUnitTypes.series import QuantitySeries, np
+from pyUnitTypes.length import Meter, CentiMeter
+from pyUnitTypes.temperature import Celsius, Fahrenheit
+
+
+@skipIf(np is None, 'numpy is not installed')
+class TestQuantitySeries(TestCase):
+    """Tests the columnar QuantitySeries."""
+
+    def setUp(self):
+        self.series = QuantitySeries([10, 20, 30, 40, 50, 60], [0, 10, 20, 30, 40, 50], Celsius)
+
+    def test_constructor(self):
+        """Tests the creation of a series."""
+
+        self.assertEqual(len(self.series), 6)
+        self.assertEqual(self.series.value.dtype, np.float64)
+        self.assertEqual(self.series.timestamps.dtype, np.int64)
+        self.assertEqual(self.series.unit, Celsius)
+
+        series = QuantitySeries(QuantityArray([1, 2], Meter), [1, 2], CentiMeter)
+        self.assertEqual(series.value.tolist(), [100, 200])
+
+        with self.assertRaises(ValueError):
+            QuantitySeries([1, 2], [1], Meter)
+        with self.assertRaises(ValueError):
+            QuantitySeries([1, 2], [2, 1], Meter)
+        with self.assertRaises(TypeError):
+            QuantitySeries(QuantityArray([1, 2], Meter), [1, 2], Celsius)
+
+    def test_slicing(self):
+        """Tests the zero-copy slicing and the time windows."""
+
+        part = self.series[1:3]
+        self.assertEqual(part.timestamps.tolist(), [10, 20])
+        self.assertTrue(np.shares_memory(part.value, self.series.value))
+        self.assertEqual(self.series[0], (0, Celsius(10)))
+
+        window = self.series.window(15, 40)
+        self.assertEqual(window.timestamps.tolist(), [20, 30])
+        self.assertTrue(np.shares_memory(window.value, self.series.value))
+        self.assertEqual(self.series.window(start=45).timestamps.tolist(), [50])
+        self.assertEqual(self.series.window(stop=10).timestamps.tolist(), [0])
+        self.assertEqual(len(self.series.window(100, 200)), 0)
+        self.assertEqual(len(self.series.window(30, 20)), 0)
+
+        self.assertEqual(list(self.series[:2]), [(0, Celsius(10)), (10, Celsius(20))])
+
+    def test_conversion(self):
+        """Tests the conversion of the whole value column."""
+
+        fahrenheit = self.series.to(Fahrenheit)
+        np.testing.assert_allclose(fahrenheit.value, [50, 68, 86, 104, 122, 140])
+        self.assertEqual(self.series.unit, Celsius)
+
+        buffer = self.series.value
+        self.series.convert(Fahrenheit)
+        self.assertIs(self.series.value, buffer)
+        np.testing.assert_allclose(self.series.value, [50, 68, 86, 104, 122, 140])
+
+        with self.assertRaises(TypeError):
+            self.series.to(Meter)
+
+    def test_views_and_conversion(self):
+        """Tests that slices and windows stay in the unit of the series they share the columns with."""
+
+        window = self.series.window(15, 40)
+        nested = window[1:]
+
+        # a view can't be converted in place, the rest of the series would keep its unit
+        with self.assertRaises(TypeError):
+            self.series[0:2].convert(Fahrenheit)
+        with self.assertRaises(TypeError):
+            nested.convert(Fahrenheit)
+        self.assertEqual(self.series.value.tolist(), [10, 20, 30, 40, 50, 60])
+        self.assertEqual(self.series.unit, Celsius)
+        np.testing.assert_allclose(window.to(Fahrenheit).value, [86, 104])
+
+        # views follow the in place conversion of their series
+        self.series.convert(Fahrenheit)
+        self.assertEqual(window.unit, Fahrenheit)
+        self.assertEqual(nested.unit, Fahrenheit)
+        np.testing.assert_allclose(window.value, [86, 104])
+        self.assertIs(self.series.quantities.unit, Fahrenheit)
+        with self.assertRaises(TypeError):
+            self.series.quantities.convert(Celsius)
+        self.assertAlmostEqual(nested.max().value, 104)
+        self.assertAlmostEqual(window.mean().value, 95)
+
+    def test_aggregation(self):
+        """Tests the aggregation of the whole series."""
+
+        self.assertEqual(self.series.mean(), Celsius(35))
+        self.assertEqual(self.series.min(), Celsius(10))
+        self.assertEqual(self.series.max(), Celsius(60))
+        self.assertEqual(self.series.sum(), Celsius(210))
+        self.assertEqual(QuantitySeries([], [], Fahrenheit).sum().value, 0)
+
+        # the results don't depend on the unit of the series
+        fahrenheit = self.series.to(Fahrenheit)
+        for how in ('mean', 'min', 'max', 'sum'):
+            self.assertAlmostEqual(Celsius(getattr(fahrenheit, how)()).value, getattr(self.series, how)().value)
+
+        with self.assertRaises(ValueError):
+            self.series.window(100).mean()
+
+    def test_resample(self):
+        """Tests the resampling into buckets."""
+
+        resampled = self.series.resample(20)
+        self.assertEqual(resampled.timestamps.tolist(), [0, 20, 40])
+        self.assertEqual(resampled.value.tolist(), [15, 35, 55])
+        self.assertEqual(self.series.resample(20, how='min').value.tolist(), [10, 30, 50])
+        self.assertEqual(self.series.resample(20, how='max').value.tolist(), [20, 40, 60])
+        self.assertEqual(self.series.resample(30, how='sum').value.tolist(), [60, 150])
+        self.assertEqual(self.series.resample(25, origin=5).timestamps.tolist(), [-20, 5, 30])
+
+        # empty buckets are left out
+        sparse = QuantitySeries([1, 2, 3], [0, 1, 100], Meter).resample(10)
+        self.assertEqual(sparse.timestamps.tolist(), [0, 100])
+        self.assertEqual(sparse.value.tolist(), [1.5, 3])
+
+        # sums of temperatures are calculated in the base unit
+        fahrenheit_sums = self.series.to(Fahrenheit).resample(30, how='sum').to(Celsius)
+        np.testing.assert_allclose(fahrenheit_sums.value, [60, 150])
+
+        with self.assertRaises(ValueError):
+            self.series.resample(10, how='median')
+        with self.assertRaises(ValueError):
+            self.series.resample(0)
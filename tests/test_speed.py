@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from pyUnitTypes.length import Meter, KiloMeter, Mile
+from pyUnitTypes.speed import MeterPerSecond, KiloMeterPerHour, MilePerHour, FeetPerSecond, Knot
+from pyUnitTypes.time import Hour, Second
+
+
+class TestSpeeds(TestCase):
+    """Tests for speed.py module"""
+
+    def test_constructor(self):
+        """Tests the constructors of the Speed class."""
+
+        self.assertEqual(MeterPerSecond(MeterPerSecond(1)), MeterPerSecond(1))
+        self.assertAlmostEqual(KiloMeterPerHour(MeterPerSecond(1)).value, 3.6)
+
+        with self.assertRaises(TypeError):
+            MeterPerSecond('1')
+        with self.assertRaises(TypeError):
+            MeterPerSecond(Meter(1))
+
+    def test_Conversions(self):
+        """Tests the conversions between the speed units."""
+
+        self.assertAlmostEqual(MeterPerSecond(KiloMeterPerHour(36)).value, 10)
+        self.assertAlmostEqual(MeterPerSecond(MilePerHour(1)).value, 0.44704)
+        self.assertAlmostEqual(MeterPerSecond(FeetPerSecond(1)).value, 0.3048)
+        self.assertAlmostEqual(KiloMeterPerHour(Knot(1)).value, 1.852)
+
+    def test_derived(self):
+        """Tests speeds as result of calculations with lengths and times."""
+
+        self.assertAlmostEqual(MilePerHour(Mile(60) / Hour(1)).value, 60)
+        self.assertAlmostEqual(KiloMeterPerHour(KiloMeter(1) / Second(36)).value, 100)
+        self.assertAlmostEqual(Meter(MeterPerSecond(10) * Second(3)).value, 30)
+        self.assertAlmostEqual(Second(Meter(30) / MeterPerSecond(10)).value, 3)
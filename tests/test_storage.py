@@ -0,0 +1,164 @@
+import os
+import sys
+import tempfile
+from array import array
+from unittest import TestCase, mock, skipIf
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyUnitTypes.basics import UnknownUnitError, convert
+from pyUnitTypes.length import Meter, KiloMeter
+from pyUnitTypes.storage import HEADER_SIZE, QuantityView, open_quantities, write_quantities
+from pyUnitTypes.temperature import Celsius, Fahrenheit
+
+
+class TestStorage(TestCase):
+    """Tests for storage.py module"""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.qty')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_write_and_open(self):
+        values = array('d', [1.5, 2.5, 3.5])
+        self.assertEqual(write_quantities(self.path, values, KiloMeter), 3)
+        self.assertEqual(os.path.getsize(self.path), HEADER_SIZE + 3 * 8)
+
+        with open_quantities(self.path) as file:
+            self.assertEqual(len(file), 3)
+            self.assertIs(file.unit, KiloMeter)
+            self.assertEqual(file.dtype, 'd')
+            self.assertIsNone(file.timestamps)
+
+            view = file.values
+            self.assertIs(view.unit, KiloMeter)
+            self.assertEqual(view[1], KiloMeter(2.5))
+            self.assertEqual(view[-1], KiloMeter(3.5))
+            self.assertEqual(view.values.tolist(), [1.5, 2.5, 3.5])
+            self.assertEqual(list(view), [KiloMeter(1.5), KiloMeter(2.5), KiloMeter(3.5)])
+            del view
+
+    def test_iterables_and_float32(self):
+        write_quantities(self.path, (value / 2 for value in range(7)), Fahrenheit, dtype='f', chunk_size=3)
+
+        with open_quantities(self.path) as file:
+            self.assertEqual(file.dtype, 'f')
+            self.assertEqual(file.values.values.tolist(), [value / 2 for value in range(7)])
+
+    def test_byteorder(self):
+        """Tests the byteswapping on big endian machines by pretending to run on one."""
+
+        values = array('d', [1.5, -2.5, 1e300])
+        swapped = array('d', values)
+        swapped.byteswap()
+        columns = [values, list(values)] + ([np.array(values)] if np is not None else [])
+        for column in columns:
+            with mock.patch.object(sys, 'byteorder', 'big'):
+                write_quantities(self.path, column, Meter, timestamps=[3, 4, 5], chunk_size=2)
+                with open_quantities(self.path) as file:
+                    self.assertEqual(file.values.values.tolist(), values.tolist())
+                    self.assertEqual(file.timestamps.tolist(), [3, 4, 5])
+                    self.assertEqual(file.window(4, 6)[0], Meter(-2.5))
+
+            # the pretended big endian machine wrote the values swapped
+            with open_quantities(self.path) as file:
+                self.assertEqual(file.values.values.tobytes(), swapped.tobytes())
+
+    def test_lazy_conversion(self):
+        write_quantities(self.path, [value for value in range(10)], Fahrenheit)
+
+        with open_quantities(self.path) as file:
+            celsius = file.values.to(Celsius)
+            self.assertIs(celsius.unit, Celsius)
+            self.assertEqual(len(celsius), 10)
+            self.assertAlmostEqual(celsius[3].value, convert(3, Fahrenheit, Celsius))
+
+            chunks = list(celsius.chunks(4))
+            self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+            converted = [value for chunk in chunks for value in chunk]
+            for value, result in zip(range(10), converted):
+                self.assertAlmostEqual(result, convert(value, Fahrenheit, Celsius))
+
+            # slices share the column and keep the conversion
+            sliced = celsius[2:5]
+            self.assertIsInstance(sliced, QuantityView)
+            self.assertEqual(len(sliced), 3)
+            self.assertAlmostEqual(sliced[0].value, convert(2, Fahrenheit, Celsius))
+
+            with self.assertRaises(ValueError):
+                next(celsius.chunks(0))
+            del celsius, sliced
+
+    def test_window(self):
+        write_quantities(self.path, range(10), Meter, timestamps=range(100, 110), dtype='f')
+
+        with open_quantities(self.path) as file:
+            self.assertEqual(file.timestamps.tolist(), list(range(100, 110)))
+
+            window = file.window(103, 106)
+            self.assertEqual(list(window), [Meter(3), Meter(4), Meter(5)])
+            self.assertEqual(list(window.to(KiloMeter)), [KiloMeter(0.003), KiloMeter(0.004), KiloMeter(0.005)])
+            self.assertEqual(len(file.window(stop=102)), 2)
+            self.assertEqual(len(file.window(start=108)), 2)
+            self.assertEqual(len(file.window(200, 300)), 0)
+            self.assertEqual(len(file.window(105, 100)), 0)
+            del window
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            write_quantities(self.path, [1.0], Meter, dtype='i')
+        # a failed write leaves the existing file as it is and no temporary file behind
+        write_quantities(self.path, [5.0], Celsius)
+        with open(self.path, 'rb') as raw:
+            content = raw.read()
+        with self.assertRaises(ValueError):
+            write_quantities(self.path, [1.0, 2.0], Meter, timestamps=[1])
+        with self.assertRaises(TypeError):
+            write_quantities(self.path, [1.0, 'x'], Meter, chunk_size=1)
+        with open(self.path, 'rb') as raw:
+            self.assertEqual(raw.read(), content)
+        directory, name = os.path.split(self.path)
+        self.assertEqual([entry for entry in os.listdir(directory) if entry.startswith(name + '.')], [])
+        with self.assertRaises(UnknownUnitError):
+            write_quantities(self.path, [1.0], type('Unregistered', (Meter,), {}))
+
+        write_quantities(self.path, [1.0], Meter)
+        with open_quantities(self.path) as file:
+            with self.assertRaises(ValueError):
+                file.window(0, 1)
+
+        # closing twice is fine
+        file.close()
+
+        with open(self.path, 'r+b') as raw:
+            raw.write(b'NOPE')
+        with self.assertRaises(ValueError):
+            open_quantities(self.path)
+
+        write_quantities(self.path, [1.0, 2.0], Meter)
+        with open(self.path, 'r+b') as raw:
+            raw.truncate(HEADER_SIZE + 8)
+        with self.assertRaises(ValueError):
+            open_quantities(self.path)
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_numpy(self):
+        write_quantities(self.path, np.arange(6, dtype=np.float64).reshape(2, 3), KiloMeter,
+                         timestamps=np.arange(6, dtype=np.int64))
+
+        with open_quantities(self.path) as file:
+            chunks = list(file.values.to(Meter).chunks())
+            self.assertEqual(len(chunks), 1)
+            self.assertIsInstance(chunks[0], np.ndarray)
+            self.assertEqual(chunks[0].tolist(), [0, 1000, 2000, 3000, 4000, 5000])
+
+            # zero copy view on the mapped file
+            values = np.frombuffer(file.values.values, dtype=np.float64)
+            self.assertEqual(values[5], 5)
+            del values
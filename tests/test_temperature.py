@@ -29,9 +29,9 @@ class TestTemperature(TestCase):
         self.assertAlmostEqual(Celsius(100), Celsius(100), places=prec)
         self.assertAlmostEqual(Fahrenheit(100), Fahrenheit(100), places=prec)
         self.assertAlmostEqual(Kelvin(100), Kelvin(100), places=prec)
-        self.assertAlmostEqual(Celsius(100), Kelvin(373.15), places=prec)
-        self.assertAlmostEqual(Celsius(101), Fahrenheit(213.8), places=prec)
-        self.assertAlmostEqual(Kelvin(100), Celsius(-173.15), places=prec)
-        self.assertAlmostEqual(Kelvin(100), Fahrenheit(-279.67), places=prec)
-        self.assertAlmostEqual(Fahrenheit(100), Celsius(37.77778), places=prec)
-        self.assertAlmostEqual(Fahrenheit(100), Kelvin(310.9278), places=prec)
+        self.assertAlmostEqual(Celsius(100).base_value, Kelvin(373.15).base_value, places=prec)
+        self.assertAlmostEqual(Celsius(101).base_value, Fahrenheit(213.8).base_value, places=prec)
+        self.assertAlmostEqual(Kelvin(100).base_value, Celsius(-173.15).base_value, places=prec)
+        self.assertAlmostEqual(Kelvin(100).base_value, Fahrenheit(-279.67).base_value, places=prec)
+        self.assertAlmostEqual(Fahrenheit(100).base_value, Celsius(37.77778).base_value, places=prec)
+        self.assertAlmostEqual(Fahrenheit(100).base_value, Kelvin(310.9278).base_value, places=prec)
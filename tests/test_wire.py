@@ -0,0 +1,114 @@
+import copy
+import pickle
+from array import array
+from unittest import TestCase, skipIf
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pyUnitTypes.auxiliary import class_factory
+from pyUnitTypes.basics import Conversion, UnknownUnitError, unregister_unit
+from pyUnitTypes.length import Length, Meter, KiloMeter, Feet, YottaMeter
+from pyUnitTypes.mass import KiloGram, MilliGram
+from pyUnitTypes.temperature import Celsius
+from pyUnitTypes.wire import SCALAR, BATCH_HEADER, USER_UNIT_IDS, encode, decode, encode_batch, decode_batch, \
+    register_unit, unit_id, unit_from_id
+
+
+class TestWire(TestCase):
+    """Tests for wire.py module"""
+
+    def test_unit_ids(self):
+        """Tests that the ids of the units are stable."""
+
+        self.assertEqual(unit_id(Meter), 0x0100)
+        self.assertEqual(unit_id(Feet), 0x0103)
+        self.assertEqual(unit_id(KiloGram), 0x0201)
+        self.assertEqual(unit_id(MilliGram), 0x028C)
+        self.assertEqual(unit_id(YottaMeter), 0x0180)
+        self.assertEqual(unit_id(Celsius), 0x0400)
+
+        for unit in (Meter, KiloMeter, YottaMeter, KiloGram, MilliGram, Celsius):
+            self.assertIs(unit_from_id(unit_id(unit)), unit)
+
+        with self.assertRaises(UnknownUnitError):
+            unit_from_id(0x7FFF)
+
+    def test_scalar(self):
+        """Tests the encoding of single quantities."""
+
+        data = encode(KiloMeter(1.5))
+        self.assertEqual(len(data), SCALAR.size)
+        self.assertEqual(len(data), 10)
+        self.assertEqual(decode(data), KiloMeter(1.5))
+        self.assertIsInstance(decode(data), KiloMeter)
+        self.assertEqual(decode(b'xx' + encode(Celsius(-40)), offset=2), Celsius(-40))
+
+    def test_batch(self):
+        """Tests the encoding of batches."""
+
+        data = encode_batch([1.0, 2.0, 3.0], Meter)
+        self.assertEqual(len(data), BATCH_HEADER.size + 24)
+        self.assertEqual(decode_batch(data), (Meter, array('d', [1, 2, 3])))
+
+        self.assertEqual(decode_batch(encode_batch(array('d', [4, 5]), Feet)), (Feet, array('d', [4, 5])))
+
+        # unit objects are converted into the unit of the first one or the given unit
+        self.assertEqual(decode_batch(encode_batch([Meter(1), KiloMeter(1)])), (Meter, array('d', [1, 1000])))
+        self.assertEqual(decode_batch(encode_batch([Meter(1), KiloMeter(1)], KiloMeter)),
+                         (KiloMeter, array('d', [0.001, 1])))
+
+        # empty batches
+        self.assertEqual(decode_batch(encode_batch([], Meter)), (Meter, array('d')))
+
+        with self.assertRaises(ValueError):
+            encode_batch([1.0])
+        with self.assertRaises(ValueError):
+            decode_batch(b'xx' + data[2:])
+        with self.assertRaises(ValueError):
+            decode_batch(data[:-1])
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_batch_numpy(self):
+        from pyUnitTypes.arrays import QuantityArray
+
+        values = np.arange(6.0)
+        self.assertEqual(decode_batch(encode_batch(values, Meter))[1].tolist(), values.tolist())
+        self.assertEqual(decode_batch(encode_batch(values[::2], Meter))[1].tolist(), [0, 2, 4])
+        self.assertEqual(decode_batch(encode_batch(QuantityArray(values, KiloMeter), Meter)),
+                         (Meter, array('d', values * 1000)))
+        self.assertEqual(decode_batch(encode_batch(QuantityArray(values, KiloMeter)))[0], KiloMeter)
+
+    def test_pickle(self):
+        """Tests pickling by unit id."""
+
+        for quantity in (Meter(1), KiloMeter(2.5), YottaMeter(3), MilliGram(4), Celsius(-40)):
+            data = pickle.dumps(quantity)
+            self.assertNotIn(b'Conversion', data)
+            self.assertEqual(pickle.loads(data), quantity)
+            self.assertIs(type(pickle.loads(data)), type(quantity))
+
+        self.assertEqual(copy.copy(KiloMeter(2)), KiloMeter(2))
+        self.assertEqual(copy.deepcopy(KiloMeter(2)), KiloMeter(2))
+
+    def test_register_unit(self):
+        """Tests the ids of own units."""
+
+        Furlong = class_factory(Length, 'WireFurlong', 'wfur', Conversion(201.168))
+        self.addCleanup(unregister_unit, Furlong)
+        with self.assertRaises(UnknownUnitError):
+            encode(Furlong(1))
+
+        register_unit(Furlong, USER_UNIT_IDS + 1)
+        register_unit(Furlong, USER_UNIT_IDS + 1)
+        self.assertEqual(unit_id(Furlong), USER_UNIT_IDS + 1)
+        self.assertEqual(decode(encode(Furlong(2))), Furlong(2))
+
+        with self.assertRaises(ValueError):
+            register_unit(Meter, USER_UNIT_IDS + 1)
+        with self.assertRaises(ValueError):
+            register_unit(Meter, 0x0100)
+        with self.assertRaises(TypeError):
+            register_unit(float, USER_UNIT_IDS + 2)